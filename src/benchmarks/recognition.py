@@ -0,0 +1,357 @@
+"""
+Бенчмарк распознавателей экзаменов и программ.
+
+Каталог берётся из сидов загрузчиков и масштабируется синтетическими
+копиями (1x/10x/100x), запросы — опечатки, транслит, ввод на латинской
+раскладке и сокращения. Результаты пишутся в JSON, чтобы сравнивать релизы:
+
+    cd src && python -m benchmarks.recognition --output benchmarks/results/recognition.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Sequence, Tuple
+
+from tactic.domain.entities.program import ProgramDTO
+from tactic.domain.entities.subject import SubjectAliasDomain, SubjectDto
+from tactic.infrastructure.recognize_exam_rapid_wuzzy import RecognizeExamRapidWuzzy
+from tactic.infrastructure.recognize_program_rapid_wuzzy import (
+    RecognizeProgramRapidWuzzy,
+)
+from tactic.infrastructure.text_normalization import (
+    normalize,
+    to_latin_layout,
+    transliterate,
+)
+
+UPLOAD_DATA_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "tactic/infrastructure/db/migrations/upload_data"
+)
+EXAM_SEED_PATH = UPLOAD_DATA_DIR / "add_alias/exam_aliase.json"
+PROGRAM_SEED_PATH = UPLOAD_DATA_DIR / "education_areas/program_info_full.json"
+
+RU_LETTERS = "абвгдежзийклмнопрстуфхцчшщыэюя"
+SYLLABLES = ["ка", "ло", "ми", "ре", "ту", "на", "ви", "со", "пра", "ник", "тер", "ос"]
+
+# (вид запроса, ввод, ожидаемое нормализованное название)
+Query = Tuple[str, str, str]
+Recognize = Callable[[str, int], Awaitable[List[str]]]
+
+
+@dataclass
+class KindAccuracy:
+    queries: int = 0
+    top1: int = 0
+    topk: int = 0
+
+
+@dataclass
+class BenchmarkResult:
+    recognizer: str
+    scale: int
+    catalog_size: int
+    build_seconds: float
+    index_bytes: int
+    queries: int
+    throughput_qps: float
+    latency_ms: Dict[str, float]
+    accuracy: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+def synthetic_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def make_typo(text: str, rng: random.Random, count: int = 1) -> str:
+    chars = list(text)
+    for _ in range(count):
+        letters = [i for i, ch in enumerate(chars) if ch.isalpha()]
+        if len(letters) < 2:
+            break
+        i = rng.choice(letters)
+        op = rng.choice(("delete", "replace", "swap", "insert"))
+        if op == "delete":
+            del chars[i]
+        elif op == "replace":
+            chars[i] = rng.choice(RU_LETTERS)
+        elif op == "insert":
+            chars.insert(i, rng.choice(RU_LETTERS))
+        elif i + 1 < len(chars):
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+    return "".join(chars)
+
+
+def abbreviate(text: str, length: int = 5) -> str:
+    """Усечённые слова, как их пишут в чате: "прикл информ"."""
+    return " ".join(word[:length] for word in text.split() if len(word) > 2)
+
+
+def load_exam_catalog(scale: int, rng: random.Random) -> List[SubjectDto]:
+    seed = json.loads(EXAM_SEED_PATH.read_text(encoding="utf-8"))
+    subjects: List[SubjectDto] = []
+    alias_id = 0
+    for copy in range(scale):
+        # Копии получают выдуманное слово в конце названия и алиасов —
+        # похожие, но неверные кандидаты для поиска
+        suffix = "" if copy == 0 else f" {synthetic_word(rng)}"
+        for entry in seed:
+            subject_id = len(subjects) + 1
+            aliases = []
+            for alias in entry["aliases"]:
+                alias_id += 1
+                aliases.append(
+                    SubjectAliasDomain(
+                        id=alias_id, alias=alias + suffix, subject_id=subject_id
+                    )
+                )
+            subjects.append(
+                SubjectDto(
+                    id=subject_id,
+                    name=entry["exam"] + suffix,
+                    popularity=entry["popularity"],
+                    aliases=aliases,
+                )
+            )
+    return subjects
+
+
+def load_program_catalog(scale: int, rng: random.Random) -> List[ProgramDTO]:
+    seed = json.loads(PROGRAM_SEED_PATH.read_text(encoding="utf-8"))
+    titles = [entry["title"] for entry in seed]
+    programs: List[ProgramDTO] = []
+    for copy in range(scale):
+        suffix = "" if copy == 0 else f" {synthetic_word(rng)}"
+        for title in titles:
+            programs.append(ProgramDTO(id=len(programs) + 1, title=title + suffix))
+    return programs
+
+
+def exam_queries(
+    subjects: Sequence[SubjectDto], count: int, rng: random.Random
+) -> List[Query]:
+    queries: List[Query] = []
+    for _ in range(count):
+        subject = rng.choice(subjects)
+        name = normalize(subject.name)
+        source = normalize(rng.choice([subject.name] + [a.alias for a in subject.aliases]))
+        kind = rng.choice(("exact", "alias", "typo", "translit", "layout"))
+        if kind == "alias":
+            text = source
+        elif kind == "typo":
+            text = make_typo(source, rng)
+        elif kind == "translit":
+            text = transliterate(source)
+        elif kind == "layout":
+            text = to_latin_layout(source)
+        else:
+            text = name
+        queries.append((kind, text, name))
+    return queries
+
+
+def program_queries(
+    programs: Sequence[ProgramDTO], count: int, rng: random.Random
+) -> List[Query]:
+    queries: List[Query] = []
+    for _ in range(count):
+        title = normalize(rng.choice(programs).title)
+        kind = rng.choice(
+            ("exact", "typo", "word_order", "translit", "layout", "abbreviation")
+        )
+        if kind == "typo":
+            text = make_typo(title, rng, count=2)
+        elif kind == "word_order":
+            words = title.split()
+            rng.shuffle(words)
+            text = " ".join(words)
+        elif kind == "translit":
+            text = transliterate(title)
+        elif kind == "layout":
+            text = to_latin_layout(title)
+        elif kind == "abbreviation":
+            text = abbreviate(title)
+        else:
+            text = title
+        queries.append((kind, text, title))
+    return queries
+
+
+async def measure_build(
+    build: Callable[[], Awaitable[object]],
+) -> Tuple[object, float, int]:
+    """Время построения и объём памяти, который удерживает индекс."""
+    start = time.perf_counter()
+    recognizer = await build()
+    build_seconds = time.perf_counter() - start
+    del recognizer
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    recognizer = await build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return recognizer, build_seconds, after - before
+
+
+async def measure_queries(
+    recognize: Recognize, queries: Sequence[Query], k: int
+) -> Tuple[List[float], Dict[str, KindAccuracy]]:
+    latencies: List[float] = []
+    accuracy: Dict[str, KindAccuracy] = {}
+    for kind, text, expected in queries:
+        start = time.perf_counter()
+        found = await recognize(text, k)
+        latencies.append(time.perf_counter() - start)
+
+        for key in (kind, "overall"):
+            stats = accuracy.setdefault(key, KindAccuracy())
+            stats.queries += 1
+            stats.top1 += bool(found) and found[0] == expected
+            stats.topk += expected in found
+    return latencies, accuracy
+
+
+def summarize(
+    recognizer: str,
+    scale: int,
+    catalog_size: int,
+    build_seconds: float,
+    index_bytes: int,
+    latencies: List[float],
+    accuracy: Dict[str, KindAccuracy],
+) -> BenchmarkResult:
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return BenchmarkResult(
+        recognizer=recognizer,
+        scale=scale,
+        catalog_size=catalog_size,
+        build_seconds=round(build_seconds, 4),
+        index_bytes=index_bytes,
+        queries=len(latencies),
+        throughput_qps=round(len(latencies) / sum(latencies), 1),
+        latency_ms={
+            "p50": round(quantiles[49] * 1000, 3),
+            "p99": round(quantiles[98] * 1000, 3),
+        },
+        accuracy={
+            kind: {
+                "queries": stats.queries,
+                "top1": round(stats.top1 / stats.queries, 4),
+                "topk": round(stats.topk / stats.queries, 4),
+            }
+            for kind, stats in sorted(accuracy.items())
+        },
+    )
+
+
+async def bench_exams(
+    scale: int, query_count: int, k: int, threshold: int, seed: int
+) -> BenchmarkResult:
+    rng = random.Random(seed)
+    subjects = load_exam_catalog(scale, rng)
+    # Запросы строятся только по исходным экзаменам, копии — помехи
+    queries = exam_queries(subjects[: len(subjects) // scale], query_count, rng)
+
+    recognizer, build_seconds, index_bytes = await measure_build(
+        lambda: RecognizeExamRapidWuzzy.create(subjects, threshold)
+    )
+    assert isinstance(recognizer, RecognizeExamRapidWuzzy)
+
+    async def recognize(text: str, top: int) -> List[str]:
+        return [normalize(s.name) for s in await recognizer.recognize(text, top)]
+
+    latencies, accuracy = await measure_queries(recognize, queries, k)
+    return summarize(
+        "exam", scale, len(subjects), build_seconds, index_bytes, latencies, accuracy
+    )
+
+
+async def bench_programs(
+    scale: int, query_count: int, k: int, threshold: int, seed: int
+) -> BenchmarkResult:
+    rng = random.Random(seed)
+    programs = load_program_catalog(scale, rng)
+    queries = program_queries(programs[: len(programs) // scale], query_count, rng)
+
+    recognizer, build_seconds, index_bytes = await measure_build(
+        lambda: RecognizeProgramRapidWuzzy.create(programs, threshold)
+    )
+    assert isinstance(recognizer, RecognizeProgramRapidWuzzy)
+
+    async def recognize(text: str, top: int) -> List[str]:
+        return [normalize(p.title) for p in await recognizer.recognize(text, top)]
+
+    latencies, accuracy = await measure_queries(recognize, queries, k)
+    return summarize(
+        "program", scale, len(programs), build_seconds, index_bytes, latencies, accuracy
+    )
+
+
+async def run(
+    scales: Sequence[int], query_count: int, k: int, threshold: int, seed: int
+) -> Dict[str, object]:
+    results: List[BenchmarkResult] = []
+    for scale in scales:
+        results.append(await bench_exams(scale, query_count, k, threshold, seed))
+        results.append(await bench_programs(scale, query_count, k, threshold, seed))
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "queries": query_count,
+            "k": k,
+            "threshold": threshold,
+            "seed": seed,
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("-k", type=int, default=3)
+    parser.add_argument("--threshold", type=int, default=70)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--output", type=Path, default=Path("benchmarks/results/recognition.json")
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        run(args.scales, args.queries, args.k, args.threshold, args.seed)
+    )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+    for result in report["results"]:  # type: ignore[union-attr]
+        print(
+            f"{result['recognizer']:>8} x{result['scale']:<4}"
+            f" n={result['catalog_size']:<6}"
+            f" qps={result['throughput_qps']:<9}"
+            f" p50={result['latency_ms']['p50']}ms"
+            f" p99={result['latency_ms']['p99']}ms"
+            f" top1={result['accuracy']['overall']['top1']}"
+            f" top{report['meta']['k']}={result['accuracy']['overall']['topk']}"  # type: ignore[index]
+            f" mem={result['index_bytes'] // 1024}KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
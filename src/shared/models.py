@@ -14,6 +14,7 @@ from sqlalchemy import (
     String,
     Text,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -96,8 +97,14 @@ class Program(HaveAutoincriment, Base):
         ForeignKey("study_duration.id"), nullable=False
     )
 
-    program_info: Mapped[str | None] = mapped_column(Text, nullable=True)
-    career_info: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Длинные тексты описания нужны только карточке программы и индексации,
+    # поэтому по умолчанию не читаются; undefer_group("details") загрузит оба
+    program_info: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="details"
+    )
+    career_info: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="details"
+    )
 
     education_level: Mapped["EducationLevel"] = relationship(
         "EducationLevel", back_populates="programs"
@@ -149,10 +156,74 @@ class ProgramContestExam(HaveAutoincriment, Base):
     subject: Mapped[Subject] = relationship("Subject", back_populates="contest_exams")
 
 
+# Индексы подобраны под запросы репозиториев: фильтры по уровню/форме,
+# подзапросы условий поступления и поиск предметов по типу конкурса.
+# INCLUDE позволяет отвечать на них Index Only Scan без обращения к таблице.
+Index(
+    "idx_program_level_form",
+    Program.education_level_id,
+    Program.study_form_id,
+    postgresql_include=["id"],
+)
+Index("idx_program_study_form", Program.study_form_id, postgresql_include=["id"])
 Index(
     "idx_pce_program_contest",
     ProgramContestExam.program_id,
     ProgramContestExam.contest_type_id,
+    ProgramContestExam.is_optional,
+    ProgramContestExam.subject_id,
+)
+Index(
+    "idx_pce_contest_type",
+    ProgramContestExam.contest_type_id,
+    postgresql_include=["program_id", "subject_id", "is_optional"],
+)
+Index(
+    "idx_pce_subject",
+    ProgramContestExam.subject_id,
+    postgresql_include=["program_id", "contest_type_id", "is_optional"],
+)
+
+
+class ProgramEligibility(Base):
+    """
+    Денормализованные условия поступления: одна строка на пару
+    (программа, тип конкурса). Заполняется загрузчиком данных из
+    program_contest_exam, в запросах бота только читается.
+    """
+
+    __tablename__ = "program_eligibility"
+
+    program_id: Mapped[int] = mapped_column(
+        ForeignKey("program.id", ondelete="CASCADE"), primary_key=True
+    )
+    contest_type_id: Mapped[int] = mapped_column(
+        ForeignKey("contest_type.id", ondelete="CASCADE"), primary_key=True
+    )
+    education_level_id: Mapped[int] = mapped_column(
+        ForeignKey("education_level.id", ondelete="CASCADE"), nullable=False
+    )
+    study_form_id: Mapped[int] = mapped_column(
+        ForeignKey("study_form.id", ondelete="CASCADE"), nullable=False
+    )
+    required_subject_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), nullable=False, server_default="{}"
+    )
+    optional_subject_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), nullable=False, server_default="{}"
+    )
+
+
+Index(
+    "idx_program_eligibility_filters",
+    ProgramEligibility.education_level_id,
+    ProgramEligibility.study_form_id,
+    ProgramEligibility.contest_type_id,
+)
+Index(
+    "idx_program_eligibility_required",
+    ProgramEligibility.required_subject_ids,
+    postgresql_using="gin",
 )
 
 
@@ -345,3 +416,31 @@ class NotificationSubscription(HaveAutoincriment, Base):
     notifications: Mapped[list["ScheduledNotification"]] = relationship(
         back_populates="subscription", cascade="all, delete-orphan"
     )
+
+
+Index(
+    "idx_subscription_user_program_type",
+    NotificationSubscription.user_id,
+    NotificationSubscription.program_id,
+    NotificationSubscription.timeline_type_id,
+)
+Index(
+    "idx_subscription_program_type",
+    NotificationSubscription.program_id,
+    NotificationSubscription.timeline_type_id,
+)
+Index(
+    "idx_scheduled_notification_subscription",
+    ScheduledNotification.subscription_id,
+)
+Index(
+    "idx_ptb_level_form_type",
+    ProgramTimelineBinding.education_level_id,
+    ProgramTimelineBinding.study_form_id,
+    ProgramTimelineBinding.type_id,
+)
+Index(
+    "idx_timeline_event_binding_deadline",
+    TimelineEvent.binding_id,
+    TimelineEvent.deadline,
+)
@@ -1,5 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Collection, Generic, List, Optional, Protocol, Sequence, TypeVar
+from typing import (
+    Collection,
+    Generic,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
 
 from shared.models import TimelineEventName
 from tactic.domain.entities.category import CategoryDomain, CreateCategoryDomain
@@ -14,6 +25,7 @@ from tactic.domain.entities.education_level import (
 from tactic.domain.entities.notification_subscription import (
     CreateNotificationSubscriptionDomain,
     NotificationSubscriptionDomain,
+    NotificationSubscriptionDTO,
 )
 from tactic.domain.entities.program import (
     CreateProgramDomain,
@@ -24,6 +36,7 @@ from tactic.domain.entities.question import CreateQuestionDomain, QuestionDomain
 from tactic.domain.entities.sheduled_notification import (
     CreateScheduledNotificationDomain,
     ScheduledNotificationDomain,
+    ScheduledNotificationDTO,
 )
 from tactic.domain.entities.study_form import CreateStudyFormDomain, StudyFormDomain
 from tactic.domain.entities.subject import (
@@ -49,6 +62,7 @@ from tactic.domain.value_objects.user import UserId
 
 T = TypeVar("T")  # доменная модель
 TCreate = TypeVar("TCreate")
+P = TypeVar("P", bound=BaseModel)  # проекция: DTO с частью колонок
 
 
 class IBaseRepository(ABC, Generic[T, TCreate]):
@@ -77,6 +91,13 @@ class IBaseRepository(ABC, Generic[T, TCreate]):
     @abstractmethod
     async def get_many(self, ids: Collection[int]) -> List[T]: ...
 
+    @abstractmethod
+    async def get_projection(
+        self, projection: Type[P], ids: Optional[Collection[int]] = None
+    ) -> List[P]:
+        """Записи в виде DTO projection: читаются только колонки его полей."""
+        ...
+
 
 class UserRepository(Protocol):
     """User repository interface"""
@@ -117,6 +138,11 @@ class ProgramRepository(IBaseRepository[ProgramDomain, CreateProgramDomain], ABC
     async def get_all_titles(self) -> List[ProgramDTO]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_catalog_version(self) -> str:
+        """Отпечаток каталога программ и их экзаменов, меняется при любом обновлении."""
+        raise NotImplementedError
+
 
 class CategoryRepository(
     IBaseRepository[CategoryDomain, CreateCategoryDomain], ABC
@@ -177,6 +203,13 @@ class ScheduledNotificationRepository(
     ) -> List[ScheduledNotificationDomain]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_notifications_by_subscription_id(
+        self, subscription_id: int
+    ) -> List[ScheduledNotificationDTO]:
+        """Уведомления подписки сразу с названием и сроком события, одним запросом."""
+        raise NotImplementedError
+
 
 class NotificationSubscriptionRepository(
     IBaseRepository[
@@ -193,6 +226,13 @@ class NotificationSubscriptionRepository(
     ) -> List[NotificationSubscriptionDomain]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_subscriptions_by_user_id(
+        self, user_id: int
+    ) -> List[NotificationSubscriptionDTO]:
+        """Подписки пользователя сразу с названием программы, одним запросом."""
+        raise NotImplementedError
+
 
 class TimelineTypeRepository(
     IBaseRepository[TimelineTypeDomain, CreateTimelineTypeDomain], ABC
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+# (education_level_ids, study_form_ids, contest_type_ids, exam_subject_ids)
+ProgramFilterKey = Tuple[
+    Tuple[int, ...], Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]
+]
+
+
+class ProgramFilterCache(ABC):
+    """
+    Результаты подбора программ, ключом служит канонизированный набор фильтров.
+    """
+
+    @abstractmethod
+    def get(self, key: ProgramFilterKey) -> Optional[List[int]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: ProgramFilterKey, program_ids: List[int]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Сбрасывает все результаты (после изменения каталога программ)."""
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Sequence
 
 from tactic.domain.entities.subject import SubjectDto
 
@@ -8,3 +8,9 @@ class RecognizeExam(ABC):
     @abstractmethod
     async def recognize(self, user_input: str, k: int = 3) -> List[SubjectDto]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def recognize_many(
+        self, user_inputs: Sequence[str], k: int = 3
+    ) -> List[List[SubjectDto]]:
+        raise NotImplementedError
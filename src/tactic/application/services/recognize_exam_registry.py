@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from tactic.application.services.recognize_exam import RecognizeExam
+
+# (contest_type_ids, education_level_ids, study_form_ids, threshold)
+RecognizerKey = Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...], int]
+
+
+class RecognizeExamRegistry(ABC):
+    """
+    Хранилище уже построенных распознавателей экзаменов,
+    ключом служит комбинация фильтров.
+    """
+
+    @abstractmethod
+    def get(self, key: RecognizerKey) -> Optional[RecognizeExam]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: RecognizerKey, recognizer: RecognizeExam) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Сбрасывает все распознаватели (например, после перезагрузки алиасов)."""
+        raise NotImplementedError
@@ -1,4 +1,3 @@
-
 from abc import ABC, abstractmethod
 from typing import List
 
@@ -8,4 +7,9 @@ from tactic.domain.entities.program import ProgramDTO
 class RecognizeProgram(ABC):
     @abstractmethod
     async def recognize(self, user_input: str, k: int = 3) -> List[ProgramDTO]:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    async def suggest(self, prefix: str, k: int = 5) -> List[ProgramDTO]:
+        """Программы, в названии которых каждое слово ввода — начало какого-то слова."""
+        raise NotImplementedError
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from tactic.domain.entities.sheduled_notification import ScheduledNotificationDTO
+
+
+class ScheduledNotificationCache(ABC):
+    """
+    Готовые списки уведомлений по id подписки.
+    """
+
+    @abstractmethod
+    def get(self, subscription_id: int) -> Optional[List[ScheduledNotificationDTO]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(
+        self, subscription_id: int, notifications: List[ScheduledNotificationDTO]
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, subscription_id: int) -> None:
+        """Сбрасывает список подписки (после подписки или отписки)."""
+        raise NotImplementedError
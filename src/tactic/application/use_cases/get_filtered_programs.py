@@ -1,12 +1,36 @@
 from typing import List, Optional
 
 from tactic.application.common.repositories import ProgramRepository
+from tactic.application.services.program_filter_cache import (
+    ProgramFilterCache,
+    ProgramFilterKey,
+)
 
 
 class GetFilterdProgramsUseCase:
 
-    def __init__(self, program_repository: ProgramRepository):
+    def __init__(
+        self,
+        program_repository: ProgramRepository,
+        filter_cache: Optional[ProgramFilterCache] = None,
+    ):
         self.program_repository = program_repository
+        self.filter_cache = filter_cache
+
+    @staticmethod
+    def make_key(
+        education_level_ids: Optional[List[int]] = None,
+        study_form_ids: Optional[List[int]] = None,
+        contest_type_ids: Optional[List[int]] = None,
+        exam_subject_ids: Optional[List[int]] = None,
+    ) -> ProgramFilterKey:
+        # None и [] означают "без фильтра", поэтому дают одинаковый ключ
+        return (
+            tuple(sorted(set(education_level_ids or []))),
+            tuple(sorted(set(study_form_ids or []))),
+            tuple(sorted(set(contest_type_ids or []))),
+            tuple(sorted(set(exam_subject_ids or []))),
+        )
 
     async def __call__(
         self,
@@ -15,9 +39,21 @@ class GetFilterdProgramsUseCase:
         contest_type_ids: Optional[List[int]] = None,
         exam_subject_ids: Optional[List[int]] = None,
     ) -> List[int]:
-        return await self.program_repository.filter(
+        key = self.make_key(
+            education_level_ids, study_form_ids, contest_type_ids, exam_subject_ids
+        )
+        if self.filter_cache is not None:
+            program_ids = self.filter_cache.get(key)
+            if program_ids is not None:
+                return program_ids
+
+        program_ids = await self.program_repository.filter(
             education_level_ids=education_level_ids,
             study_form_ids=study_form_ids,
             contest_type_ids=contest_type_ids,
             exam_subject_ids=exam_subject_ids,
         )
+
+        if self.filter_cache is not None:
+            self.filter_cache.put(key, program_ids)
+        return program_ids
@@ -2,6 +2,10 @@ from typing import List, Optional
 
 from tactic.application.common.fabrics import RecognizeExamFactory
 from tactic.application.common.repositories import SubjectRepository
+from tactic.application.services.recognize_exam_registry import (
+    RecognizeExamRegistry,
+    RecognizerKey,
+)
 from tactic.domain.entities.subject import SubjectDto
 
 
@@ -10,9 +14,26 @@ class RecognizeExamUseCase:
         self,
         subj_repo: SubjectRepository,
         recognizer_factory: RecognizeExamFactory,
+        recognizer_registry: RecognizeExamRegistry,
     ):
         self.subj_repo = subj_repo
         self.recognizer_factory = recognizer_factory
+        self.recognizer_registry = recognizer_registry
+
+    @staticmethod
+    def make_key(
+        threshold: int,
+        contest_type_ids: Optional[List[int]] = None,
+        education_level_ids: Optional[List[int]] = None,
+        study_form_ids: Optional[List[int]] = None,
+    ) -> RecognizerKey:
+        # None и [] означают "без фильтра", поэтому дают одинаковый ключ
+        return (
+            tuple(sorted(set(contest_type_ids or []))),
+            tuple(sorted(set(education_level_ids or []))),
+            tuple(sorted(set(study_form_ids or []))),
+            threshold,
+        )
 
     async def __call__(
         self,
@@ -23,10 +44,18 @@ class RecognizeExamUseCase:
         education_level_ids: Optional[List[int]] = None,
         study_form_ids: Optional[List[int]] = None,
     ) -> List[SubjectDto]:
-        subjects = await self.subj_repo.filter(
-            contest_type_ids=contest_type_ids,
-            education_level_ids=education_level_ids,
-            study_form_ids=study_form_ids,
+        key = self.make_key(
+            threshold, contest_type_ids, education_level_ids, study_form_ids
         )
-        recognizer = await self.recognizer_factory.create(subjects, threshold)
+
+        recognizer = self.recognizer_registry.get(key)
+        if recognizer is None:
+            subjects = await self.subj_repo.filter(
+                contest_type_ids=contest_type_ids,
+                education_level_ids=education_level_ids,
+                study_form_ids=study_form_ids,
+            )
+            recognizer = await self.recognizer_factory.create(subjects, threshold)
+            self.recognizer_registry.put(key, recognizer)
+
         return await recognizer.recognize(user_input, k)
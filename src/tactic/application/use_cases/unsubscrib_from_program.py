@@ -1,14 +1,21 @@
+from typing import Optional
+
 from tactic.application.services.notification_sheduling_service import (
     NotificationSchedulingService,
 )
+from tactic.application.services.scheduled_notification_cache import (
+    ScheduledNotificationCache,
+)
 
 
 class UnsubscribeFromProgramUseCase:
     def __init__(
         self,
         scheduling_service: NotificationSchedulingService,
+        notification_cache: Optional[ScheduledNotificationCache] = None,
     ):
         self.scheduling_service = scheduling_service
+        self.notification_cache = notification_cache
 
     async def __call__(
         self,
@@ -19,3 +26,5 @@ class UnsubscribeFromProgramUseCase:
             subscription_id=subscription_id,
             chat_id=chat_id,
         )
+        if self.notification_cache is not None:
+            self.notification_cache.invalidate(subscription_id)
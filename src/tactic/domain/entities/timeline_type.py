@@ -7,6 +7,12 @@ class PaymentType(IntEnum):
     PAID = 1
     BUDGET = 2
 
+
+PAYMENT_TYPE_NAMES = {
+    PaymentType.BUDGET.value: "Бюджет",
+    PaymentType.PAID.value: "Платно",
+}
+
 class TimelineTypeDomain(BaseModel):
     id: int
     name: str
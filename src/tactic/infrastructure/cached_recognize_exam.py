@@ -0,0 +1,57 @@
+from typing import List, Sequence
+
+from tactic.application.common.fabrics import RecognizeExamFactory
+from tactic.application.services.recognize_exam import RecognizeExam
+from tactic.domain.entities.subject import SubjectDto
+from tactic.infrastructure.recognition_cache import RecognitionCache
+
+
+class CachedRecognizeExam(RecognizeExam):
+    """Распознаватель экзаменов, который сначала смотрит в общий LRU."""
+
+    def __init__(
+        self,
+        recognizer: RecognizeExam,
+        cache: RecognitionCache[SubjectDto],
+        threshold: int,
+    ):
+        self.recognizer = recognizer
+        self.cache = cache
+        self.threshold = threshold
+        self.version = cache.next_version()
+
+    async def recognize(self, user_input: str, k: int = 3) -> List[SubjectDto]:
+        return (await self.recognize_many([user_input], k))[0]
+
+    async def recognize_many(
+        self, user_inputs: Sequence[str], k: int = 3
+    ) -> List[List[SubjectDto]]:
+        keys = [
+            self.cache.make_key(text, k, self.threshold, self.version)
+            for text in user_inputs
+        ]
+        results = [self.cache.get(key) for key in keys]
+
+        # Нечёткий поиск только для промахов, одной пачкой
+        missed = [i for i, result in enumerate(results) if result is None]
+        if missed:
+            found = await self.recognizer.recognize_many(
+                [user_inputs[i] for i in missed], k
+            )
+            for i, result in zip(missed, found):
+                self.cache.put(keys[i], result)
+                results[i] = result
+
+        return [result or [] for result in results]
+
+
+class CachingRecognizeExamFactory(RecognizeExamFactory):
+    def __init__(
+        self, factory: RecognizeExamFactory, cache: RecognitionCache[SubjectDto]
+    ):
+        self.factory = factory
+        self.cache = cache
+
+    async def create(self, subjects: List[SubjectDto], threshold: int) -> RecognizeExam:
+        recognizer = await self.factory.create(subjects, threshold)
+        return CachedRecognizeExam(recognizer, self.cache, threshold)
@@ -0,0 +1,47 @@
+from typing import List
+
+from tactic.application.common.fabrics import RecognizeProgramFactory
+from tactic.application.common.repositories import ProgramRepository
+from tactic.application.services.recognize_program import RecognizeProgram
+from tactic.domain.entities.program import ProgramDTO
+from tactic.infrastructure.recognition_cache import RecognitionCache
+
+
+class CachedRecognizeProgram(RecognizeProgram):
+    """Распознаватель программ, который сначала смотрит в общий LRU."""
+
+    def __init__(
+        self,
+        recognizer: RecognizeProgram,
+        cache: RecognitionCache[ProgramDTO],
+        threshold: int,
+    ):
+        self.recognizer = recognizer
+        self.cache = cache
+        self.threshold = threshold
+        self.version = cache.next_version()
+
+    async def recognize(self, user_input: str, k: int = 5) -> List[ProgramDTO]:
+        key = self.cache.make_key(user_input, k, self.threshold, self.version)
+        result = self.cache.get(key)
+        if result is None:
+            result = await self.recognizer.recognize(user_input, k)
+            self.cache.put(key, result)
+        return result
+
+    async def suggest(self, prefix: str, k: int = 5) -> List[ProgramDTO]:
+        return await self.recognizer.suggest(prefix, k)
+
+
+class CachingRecognizeProgramFactory(RecognizeProgramFactory):
+    def __init__(
+        self, factory: RecognizeProgramFactory, cache: RecognitionCache[ProgramDTO]
+    ):
+        self.factory = factory
+        self.cache = cache
+
+    async def create(
+        self, program_repo: ProgramRepository, threshold: int
+    ) -> RecognizeProgram:
+        recognizer = await self.factory.create(program_repo, threshold)
+        return CachedRecognizeProgram(recognizer, self.cache, threshold)
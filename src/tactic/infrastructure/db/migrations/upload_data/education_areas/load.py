@@ -20,6 +20,7 @@ from shared.models import (
     TimelineEventName,
     TimelineType,
 )
+from tactic.infrastructure.repositories.program_repository import ProgramRepositoryImpl
 from tactic.settings import db_settings
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -273,6 +274,8 @@ async def load(session_factory: async_sessionmaker[AsyncSession]):
 
     async with session_factory() as session:
         await load_program_data(data, db=session)
+        await ProgramRepositoryImpl(session).refresh_eligibility()
+        await session.commit()
 
 
 async def main():
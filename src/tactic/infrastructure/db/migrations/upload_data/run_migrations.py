@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from shared.models import Category, Program, SubjectAlias
+from shared.models import Category, Program, ProgramEligibility, SubjectAlias
 from tactic.infrastructure.db.migrations.upload_data.add_alias.load import (
     load as add_alias,
 )
@@ -20,6 +20,7 @@ from tactic.infrastructure.db.migrations.upload_data.education_areas.load import
     load as load_areas,
 )
 from tactic.infrastructure.db.check_db.table_exist_and_empty import table_exists_and_empty
+from tactic.infrastructure.repositories.program_repository import ProgramRepositoryImpl
 from tactic.settings import db_settings
 
 logging.basicConfig(level=logging.INFO)
@@ -59,6 +60,13 @@ async def run_async_checks():
             f"Таблица '{Program.__tablename__}' пуста — запускаем инициализацию."
         )
         await load_areas(session_factory)
+    elif await table_exists_and_empty(engine, ProgramEligibility):
+        logger.info(
+            f"Таблица '{ProgramEligibility.__tablename__}' пуста — собираем из каталога."
+        )
+        async with session_factory() as session:
+            await ProgramRepositoryImpl(session).refresh_eligibility()
+            await session.commit()
 
     if await table_exists_and_empty(engine, SubjectAlias):
         logger.info(
@@ -0,0 +1,33 @@
+from typing import List, Optional
+
+import numpy as np
+from cachetools import TTLCache  # type:ignore
+
+from tactic.application.services.program_filter_cache import (
+    ProgramFilterCache,
+    ProgramFilterKey,
+)
+
+
+class TTLProgramFilterCache(ProgramFilterCache):
+    """
+    In-memory кеш отфильтрованных программ с ограничением по размеру и времени.
+
+    Списки id хранятся компактными массивами int32, а не списками объектов int:
+    популярных комбинаций экзаменов немного, но каждая держит сотни id.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 3600):
+        self.results = TTLCache[ProgramFilterKey, np.ndarray](maxsize=maxsize, ttl=ttl)
+
+    def get(self, key: ProgramFilterKey) -> Optional[List[int]]:
+        program_ids = self.results.get(key)
+        if program_ids is None:
+            return None
+        return program_ids.tolist()
+
+    def put(self, key: ProgramFilterKey, program_ids: List[int]) -> None:
+        self.results[key] = np.array(program_ids, dtype=np.int32)
+
+    def invalidate(self) -> None:
+        self.results.clear()
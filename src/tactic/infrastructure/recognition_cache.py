@@ -0,0 +1,54 @@
+from itertools import count
+from typing import Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from cachetools import LRUCache  # type:ignore
+
+from tactic.infrastructure.text_normalization import normalize
+
+T = TypeVar("T")
+
+# (нормализованный ввод, k, порог, версия индекса)
+RecognitionKey = Tuple[str, int, int, int]
+
+
+class RecognitionCache(Generic[T]):
+    """
+    LRU последних результатов распознавания.
+
+    Каждый построенный индекс получает свою версию из next_version, и она
+    входит в ключ: после перестроения старые записи больше не совпадают
+    и вытесняются сами, без явного сброса.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.results = LRUCache[Hashable, List[T]](maxsize=maxsize)
+        self._versions = count(1)
+        self.hits = 0
+        self.misses = 0
+
+    def next_version(self) -> int:
+        return next(self._versions)
+
+    @staticmethod
+    def make_key(user_input: str, k: int, threshold: int, version: int) -> RecognitionKey:
+        return (normalize(user_input), k, threshold, version)
+
+    def get(self, key: RecognitionKey) -> Optional[List[T]]:
+        result = self.results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Копия, чтобы вызывающий код не испортил закешированный список
+        return list(result)
+
+    def put(self, key: RecognitionKey, result: List[T]) -> None:
+        self.results[key] = list(result)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        self.results.clear()
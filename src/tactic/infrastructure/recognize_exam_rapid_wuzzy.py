@@ -1,25 +1,70 @@
-from typing import Dict, List
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from rapidfuzz import fuzz, process
 
 from tactic.application.services.recognize_exam import RecognizeExam
 from tactic.domain.entities.subject import SubjectDto
+from tactic.infrastructure.recognizer_executor import run_blocking
+from tactic.infrastructure.text_normalization import normalize, text_variants
+
+
+def score_top_k(
+    queries: List[str],
+    aliases: Tuple[str, ...],
+    alias_popularity: np.ndarray,
+    threshold: int,
+    k: int,
+) -> Tuple[List[List[int]], List[List[bool]]]:
+    """
+    Тяжёлая часть распознавания: матрица сходства и top-k по строкам.
+    Вынесена в функцию модуля, чтобы её можно было отправить в пул процессов.
+    """
+    scores = process.cdist(
+        queries,
+        aliases,
+        scorer=fuzz.ratio,
+        score_cutoff=threshold,
+        workers=-1 if len(queries) > 1 else 1,
+    )
+
+    popularity = np.broadcast_to(alias_popularity, scores.shape)
+    # lexsort сортирует по последнему ключу, затем по предыдущим
+    order = np.lexsort((-popularity, -scores), axis=-1)[:, :k]
+    top_scores = np.take_along_axis(scores, order, axis=-1)
+    passed = (top_scores >= threshold) & (top_scores > 0)
+    return order.tolist(), passed.tolist()
 
 
 class RecognizeExamRapidWuzzy(RecognizeExam):
-    def __init__(self, subject_data: List[SubjectDto], threshold: int = 70):
+    def __init__(
+        self,
+        subject_data: List[SubjectDto],
+        threshold: int = 70,
+        executor: Optional[Executor] = None,
+    ):
         self.threshold = threshold
+        # Пул для сканирования; None — считать прямо в event loop
+        self.executor = executor
         self.subject_data: List[SubjectDto] = []
         self.aliase_subject: Dict[str, List[str]] = {}
         self.exam_popularity: Dict[str, int] = {}
         self.normalized_subject_name_to_subject: Dict[str, SubjectDto] = {}
         self.subject_data = subject_data
 
+        # Замороженные после построения массивы для векторного поиска
+        self.aliases: Tuple[str, ...] = ()
+        self.alias_popularity: np.ndarray = np.zeros(0, dtype=np.int64)
+
     @classmethod
     async def create(
-        cls, subject_data: List[SubjectDto], threshold: int = 70
+        cls,
+        subject_data: List[SubjectDto],
+        threshold: int = 70,
+        executor: Optional[Executor] = None,
     ) -> "RecognizeExamRapidWuzzy":
-        self = cls(subject_data, threshold)
+        self = cls(subject_data, threshold, executor)
         await self.setup()
         return self
 
@@ -29,9 +74,11 @@ class RecognizeExamRapidWuzzy(RecognizeExam):
     def _build_mappings(self) -> None:
         """
         Строим словарь с alias (синонимами) для каждого экзамена.
+        Каждый алиас попадает в словарь вместе с вариантами набора
+        на латинской раскладке и транслитом.
         """
         for subject in self.subject_data:
-            normalized_exam = subject.name.lower().strip()
+            normalized_exam = normalize(subject.name)
             self.normalized_subject_name_to_subject[normalized_exam] = subject
             self.exam_popularity[normalized_exam] = (
                 subject.popularity if subject.popularity else 0
@@ -39,42 +86,66 @@ class RecognizeExamRapidWuzzy(RecognizeExam):
 
             aliases_name = [a.alias for a in subject.aliases]
             for word in [subject.name] + aliases_name:
-                normalized = word.lower().strip()
-                if normalized not in self.aliase_subject:
-                    self.aliase_subject[normalized] = [normalized_exam]
-                else:
-                    self.aliase_subject[normalized].append(normalized_exam)
-
-    async def recognize(self, user_input: str, k: int = 3) -> List[SubjectDto]:
-        def unique_elements(seq):
-            return list(dict.fromkeys(seq))
-
-        user_input = user_input.lower().strip()
-
-        matches = process.extract(
-            user_input,
-            self.aliase_subject.keys(),
-            scorer=fuzz.ratio,
-            limit=k,
-            score_cutoff=self.threshold,  # Это отличие rapidfuzz: можно сразу порог указать
+                for normalized in text_variants(word):
+                    if normalized not in self.aliase_subject:
+                        self.aliase_subject[normalized] = [normalized_exam]
+                    else:
+                        self.aliase_subject[normalized].append(normalized_exam)
+
+        self.aliases = tuple(self.aliase_subject.keys())
+        # Популярность алиаса — максимальная популярность его экзаменов
+        self.alias_popularity = np.array(
+            [
+                max(self.exam_popularity[ex] for ex in self.aliase_subject[alias])
+                for alias in self.aliases
+            ],
+            dtype=np.int64,
         )
 
-        # В rapidfuzz результат немного другой: [(key, score, index)], нам нужен key и score
-        filtered = [(alias, score) for alias, score, _ in matches]
-        filtered.sort(key=lambda x: (-x[1], -self.get_popularity(x[0])))
+    async def recognize(self, user_input: str, k: int = 3) -> List[SubjectDto]:
+        return (await self.recognize_many([user_input], k))[0]
 
-        if not filtered:
+    async def recognize_many(
+        self, user_inputs: Sequence[str], k: int = 3
+    ) -> List[List[SubjectDto]]:
+        """
+        Распознаёт сразу пачку вводов одной матрицей rapidfuzz.process.cdist.
+        Для каждого ввода порядок тот же, что у recognize: по убыванию
+        сходства, при равенстве — по популярности экзамена.
+        """
+        if not user_inputs:
             return []
+        if not self.aliases or k <= 0:
+            return [[] for _ in user_inputs]
+
+        queries = [normalize(text) for text in user_inputs]
+        order, passed = await run_blocking(
+            self.executor,
+            score_top_k,
+            queries,
+            self.aliases,
+            self.alias_popularity,
+            self.threshold,
+            k,
+        )
 
-        matched_exams = []
-        for alias, _ in filtered:
-            matched_exams.extend(self.aliase_subject[alias])
-
-        normalized_matched = unique_elements(matched_exams)[:k]
+        results: List[List[SubjectDto]] = []
+        for row_order, row_passed in zip(order, passed):
+            matched_exams: Dict[str, None] = {}
+            for alias_idx, ok in zip(row_order, row_passed):
+                if not ok:
+                    break
+                for exam in self.aliase_subject[self.aliases[alias_idx]]:
+                    matched_exams.setdefault(exam)
+
+            results.append(
+                [
+                    self.normalized_subject_name_to_subject[ex]
+                    for ex in list(matched_exams)[:k]
+                ]
+            )
 
-        return [
-            self.normalized_subject_name_to_subject[ex] for ex in normalized_matched
-        ]
+        return results
 
     def get_popularity(self, exam_name: str) -> int:
-        return self.exam_popularity.get(exam_name.lower(), 0)
+        return self.exam_popularity.get(normalize(exam_name), 0)
@@ -1,4 +1,5 @@
-from typing import List
+from concurrent.futures import Executor
+from typing import List, Optional
 
 from tactic.application.common.fabrics import RecognizeExamFactory
 from tactic.application.services.recognize_exam import RecognizeExam
@@ -7,5 +8,8 @@ from tactic.infrastructure.recognize_exam_rapid_wuzzy import RecognizeExamRapidW
 
 
 class RecognizeExamRapidWuzzyFactory(RecognizeExamFactory):
+    def __init__(self, executor: Optional[Executor] = None):
+        self.executor = executor
+
     async def create(self, subjects: List[SubjectDto], threshold: int) -> RecognizeExam:
-        return await RecognizeExamRapidWuzzy.create(subjects, threshold)
+        return await RecognizeExamRapidWuzzy.create(subjects, threshold, self.executor)
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from cachetools import TTLCache  # type:ignore
+
+from tactic.application.services.recognize_exam import RecognizeExam
+from tactic.application.services.recognize_exam_registry import (
+    RecognizeExamRegistry,
+    RecognizerKey,
+)
+
+
+class TTLRecognizeExamRegistry(RecognizeExamRegistry):
+    """
+    In-memory реестр распознавателей с ограничением по размеру и времени жизни.
+
+    Распознаватели после построения не изменяются, поэтому один экземпляр
+    безопасно разделять между всеми пользователями с одинаковыми фильтрами.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: int = 600):
+        self.recognizers = TTLCache[RecognizerKey, RecognizeExam](
+            maxsize=maxsize, ttl=ttl
+        )
+
+    def get(self, key: RecognizerKey) -> Optional[RecognizeExam]:
+        return self.recognizers.get(key)
+
+    def put(self, key: RecognizerKey, recognizer: RecognizeExam) -> None:
+        self.recognizers[key] = recognizer
+
+    def invalidate(self) -> None:
+        self.recognizers.clear()
@@ -1,47 +1,180 @@
-from typing import Dict, List, Optional
+import re
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
 from rapidfuzz import fuzz, process
 
 from tactic.application.services.recognize_program import RecognizeProgram
 from tactic.domain.entities.program import ProgramDTO
+from tactic.infrastructure.recognizer_executor import run_blocking
+from tactic.infrastructure.text_normalization import normalize, text_variants
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text)
+
+
+def char_ngrams(token: str, n: int = 3) -> List[str]:
+    padded = f" {token} "
+    return [padded[i : i + n] for i in range(len(padded) - n + 1)]
+
+
+def rank_titles(query: str, titles: List[str], threshold: int) -> List[int]:
+    """
+    Индексы titles, прошедших порог, по убыванию сходства.
+    Порядок слов не важен: берём лучший из ratio и token_sort_ratio.
+    token_set_ratio не подходит — любое подмножество слов даёт 100.
+    """
+    scores = np.maximum(
+        process.cdist([query], titles, scorer=fuzz.ratio)[0],
+        process.cdist([query], titles, scorer=fuzz.token_sort_ratio)[0],
+    )
+    order = np.argsort(-scores, kind="stable")
+    return [i for i in order.tolist() if scores[i] >= threshold]
 
 
 class RecognizeProgramRapidWuzzy(RecognizeProgram):
-    def __init__(self, programs: List[ProgramDTO], threshold: Optional[int] = 70):
+    def __init__(
+        self,
+        programs: List[ProgramDTO],
+        threshold: Optional[int] = 70,
+        min_ngram_overlap: float = 0.3,
+        executor: Optional[Executor] = None,
+    ):
         self.threshold = threshold
+        # Пул для скоринга кандидатов; None — считать прямо в event loop
+        self.executor = executor
         self.programs = programs
+        # Доля n-грамм запроса, которую должен разделять кандидат
+        self.min_ngram_overlap = min_ngram_overlap
 
-        # Предобработанные названия
+        # Предобработанные названия вместе с вариантами на латинской
+        # раскладке и транслитом
         self.normalized_titles: List[str] = []
         self.title_to_program: Dict[str, ProgramDTO] = {}
 
+        # Инвертированные индексы: токен / n-грамма -> позиции в normalized_titles
+        self.token_index: Dict[str, Set[int]] = {}
+        self.ngram_index: Dict[str, Set[int]] = {}
+
+        # Индекс префиксов: отсортированные токены и параллельные им позиции
+        self.prefix_tokens: Tuple[str, ...] = ()
+        self.prefix_postings: Tuple[Tuple[int, ...], ...] = ()
+
     async def _build_index(self) -> None:
         self.normalized_titles = []
         for program in self.programs:
-            normalized_title = program.title.lower().strip()
-            self.normalized_titles.append(normalized_title)
-            self.title_to_program[normalized_title] = program
+            for normalized_title in text_variants(program.title):
+                if normalized_title not in self.title_to_program:
+                    self.normalized_titles.append(normalized_title)
+                self.title_to_program[normalized_title] = program
+
+        for pos, title in enumerate(self.normalized_titles):
+            for token in tokenize(title):
+                self.token_index.setdefault(token, set()).add(pos)
+                for gram in char_ngrams(token):
+                    self.ngram_index.setdefault(gram, set()).add(pos)
+
+        self.prefix_tokens = tuple(sorted(self.token_index))
+        self.prefix_postings = tuple(
+            tuple(sorted(self.token_index[token])) for token in self.prefix_tokens
+        )
 
     @classmethod
     async def create(
-        cls, programs: List[ProgramDTO], threshold: Optional[int] = 70
+        cls,
+        programs: List[ProgramDTO],
+        threshold: Optional[int] = 70,
+        executor: Optional[Executor] = None,
     ) -> "RecognizeProgramRapidWuzzy":
-        self = cls(programs, threshold)
+        self = cls(programs, threshold, executor=executor)
         await self._build_index()
         return self
 
+    def _candidates(self, input_normalized: str) -> List[int]:
+        """
+        Отбирает названия, у которых есть общий токен с запросом
+        или достаточно общих n-грамм (устойчиво к опечаткам).
+        """
+        tokens = tokenize(input_normalized)
+        candidates: Set[int] = set()
+        for token in tokens:
+            candidates |= self.token_index.get(token, set())
+
+        grams = [gram for token in tokens for gram in char_ngrams(token)]
+        if grams:
+            overlap: Counter[int] = Counter()
+            for gram in set(grams):
+                overlap.update(self.ngram_index.get(gram, ()))
+            min_overlap = max(1, int(len(set(grams)) * self.min_ngram_overlap))
+            candidates.update(
+                pos for pos, count in overlap.items() if count >= min_overlap
+            )
+
+        return sorted(candidates)
+
     async def recognize(self, user_input: str, k: int = 5) -> List[ProgramDTO]:
-        input_normalized = user_input.lower().strip()
-
-        matches = process.extract(
-            input_normalized,
-            self.normalized_titles,
-            scorer=fuzz.ratio,
-            limit=k,
-            score_cutoff=self.threshold,
+        input_normalized = normalize(user_input)
+
+        candidates = self._candidates(input_normalized)
+        if not candidates or k <= 0:
+            return []
+
+        titles = [self.normalized_titles[pos] for pos in candidates]
+        ranked = await run_blocking(
+            self.executor, rank_titles, input_normalized, titles, self.threshold or 0
+        )
+
+        # Несколько вариантов одного названия дают одну программу
+        result: Dict[int, ProgramDTO] = {}
+        for i in ranked:
+            if len(result) >= k:
+                break
+            program = self.title_to_program[titles[i]]
+            result.setdefault(program.id, program)
+
+        return list(result.values())
+
+    def _prefix_positions(self, prefix: str) -> Set[int]:
+        lo = bisect_left(self.prefix_tokens, prefix)
+        hi = bisect_left(self.prefix_tokens, prefix + "\uffff", lo)
+        positions: Set[int] = set()
+        for postings in self.prefix_postings[lo:hi]:
+            positions.update(postings)
+        return positions
+
+    async def suggest(self, prefix: str, k: int = 5) -> List[ProgramDTO]:
+        input_normalized = normalize(prefix)
+        tokens = tokenize(input_normalized)
+        if not tokens or k <= 0:
+            return []
+
+        positions = self._prefix_positions(tokens[0])
+        for token in tokens[1:]:
+            if not positions:
+                break
+            positions &= self._prefix_positions(token)
+
+        # Сначала названия, начинающиеся с ввода, затем более короткие
+        ranked = sorted(
+            positions,
+            key=lambda pos: (
+                not self.normalized_titles[pos].startswith(input_normalized),
+                len(self.normalized_titles[pos]),
+                self.normalized_titles[pos],
+            ),
         )
 
-        # matches: List[Tuple[str, score, index]]
-        sorted_titles = [title for title, score, _ in matches]
+        result: Dict[int, ProgramDTO] = {}
+        for pos in ranked:
+            if len(result) >= k:
+                break
+            program = self.title_to_program[self.normalized_titles[pos]]
+            result.setdefault(program.id, program)
 
-        return [self.title_to_program[title] for title in sorted_titles]
+        return list(result.values())
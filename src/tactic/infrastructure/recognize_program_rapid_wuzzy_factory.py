@@ -0,0 +1,22 @@
+from concurrent.futures import Executor
+from typing import Optional
+
+from tactic.application.common.fabrics import RecognizeProgramFactory
+from tactic.application.common.repositories import ProgramRepository
+from tactic.application.services.recognize_program import RecognizeProgram
+from tactic.infrastructure.recognize_program_rapid_wuzzy import (
+    RecognizeProgramRapidWuzzy,
+)
+
+
+class RecognizeProgramRapidWuzzyFactory(RecognizeProgramFactory):
+    def __init__(self, executor: Optional[Executor] = None):
+        self.executor = executor
+
+    async def create(
+        self, program_repo: ProgramRepository, threshold: int
+    ) -> RecognizeProgram:
+        programs = await program_repo.get_all_titles()
+        return await RecognizeProgramRapidWuzzy.create(
+            programs, threshold, executor=self.executor
+        )
@@ -0,0 +1,33 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Literal, Optional, TypeVar
+
+R = TypeVar("R")
+
+ExecutorKind = Literal["none", "thread", "process"]
+
+
+def create_recognizer_executor(
+    kind: ExecutorKind, workers: int
+) -> Optional[Executor]:
+    """
+    Пул для нечёткого поиска. rapidfuzz отпускает GIL, поэтому по умолчанию
+    хватает потоков; процессы имеют смысл только для очень больших сканов,
+    так как аргументы сериализуются на каждый вызов.
+    """
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="recognizer")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return None
+
+
+async def run_blocking(
+    executor: Optional[Executor], fn: Callable[..., R], *args: Any
+) -> R:
+    """Выполняет fn в пуле, а без пула — прямо в event loop."""
+    if executor is None:
+        return fn(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(fn, *args))
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from tactic.application.common.fabrics import RecognizeProgramFactory
+from tactic.application.services.recognize_program import RecognizeProgram
+from tactic.domain.entities.program import ProgramDTO
+from tactic.infrastructure.repositories.program_repository import ProgramRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+ReloadListener = Callable[[], Awaitable[None]]
+
+
+class ReloadableRecognizeProgram(RecognizeProgram):
+    """
+    Версионированная обёртка над распознавателем программ.
+
+    Новый индекс строится в фоне, а затем подменяется одной ссылкой,
+    поэтому уже начатые вызовы recognize дорабатывают на старом индексе
+    и никогда не ждут перестроения.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        factory: RecognizeProgramFactory,
+        threshold: int = 70,
+    ):
+        self._session_factory = session_factory
+        self._factory = factory
+        self._threshold = threshold
+
+        self._current: Optional[RecognizeProgram] = None
+        self._reload_lock = asyncio.Lock()
+        self._listeners: List[ReloadListener] = []
+        self._tasks: List[asyncio.Task] = []
+
+        self.version = 0
+        self.catalog_version: Optional[str] = None
+
+    def add_listener(self, listener: ReloadListener) -> None:
+        """Вызывается после каждой успешной подмены индекса."""
+        self._listeners.append(listener)
+
+    async def recognize(self, user_input: str, k: int = 3) -> List[ProgramDTO]:
+        current = self._current
+        if current is None:
+            raise RuntimeError("Program recognizer is not loaded")
+        return await current.recognize(user_input, k)
+
+    async def suggest(self, prefix: str, k: int = 5) -> List[ProgramDTO]:
+        current = self._current
+        if current is None:
+            raise RuntimeError("Program recognizer is not loaded")
+        return await current.suggest(prefix, k)
+
+    async def reload(self) -> None:
+        async with self._reload_lock:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    repo = ProgramRepositoryImpl(session)
+                    catalog_version = await repo.get_catalog_version()
+                    recognizer = await self._factory.create(repo, self._threshold)
+
+            self._current = recognizer
+            self.catalog_version = catalog_version
+            self.version += 1
+            logger.info("Распознаватель программ обновлён до версии %d", self.version)
+
+        for listener in self._listeners:
+            await listener()
+
+    async def reload_if_changed(self) -> bool:
+        async with self._session_factory() as session:
+            async with session.begin():
+                catalog_version = await ProgramRepositoryImpl(
+                    session
+                ).get_catalog_version()
+
+        if catalog_version == self.catalog_version:
+            return False
+
+        await self.reload()
+        return True
+
+    async def _poll_catalog_version(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reload_if_changed()
+            except Exception:
+                logger.exception("Не удалось проверить версию каталога программ")
+
+    async def _listen_reload_channel(
+        self,
+        redis: Redis,
+        channel: str,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+    ) -> None:
+        delay = retry_delay
+        while True:
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(channel)
+                delay = retry_delay
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        await self.reload()
+                    except Exception:
+                        logger.exception("Не удалось перезагрузить каталог программ")
+            except Exception:
+                # CancelledError не перехватывается: stop() останавливает задачу
+                logger.exception(
+                    "Подписка на %s прервана, повтор через %.0f с", channel, delay
+                )
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    logger.debug("Не удалось закрыть pubsub", exc_info=True)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_retry_delay)
+
+    def start(
+        self,
+        interval: float,
+        redis: Optional[Redis] = None,
+        channel: Optional[str] = None,
+    ) -> None:
+        self._tasks.append(asyncio.create_task(self._poll_catalog_version(interval)))
+        if redis is not None and channel:
+            self._tasks.append(
+                asyncio.create_task(self._listen_reload_channel(redis, channel))
+            )
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
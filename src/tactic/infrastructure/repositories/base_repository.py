@@ -1,13 +1,16 @@
 from typing import Collection, Generic, List, Optional, Sequence, Type, TypeVar
 
-from sqlalchemy import delete, select
+from pydantic import BaseModel
+from sqlalchemy import Select, delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.models import HaveAutoincriment
+from tactic.infrastructure.repositories.model_mapper import model_mapper
 
 T = TypeVar("T")  # доменная модель
 M = TypeVar("M", bound=HaveAutoincriment)  # ORM модель
 TCreate = TypeVar("TCreate")  # DTO для создания
+P = TypeVar("P", bound=BaseModel)  # проекция: DTO с частью колонок
 
 
 class BaseRepository(Generic[T, M, TCreate]):
@@ -22,24 +25,56 @@ class BaseRepository(Generic[T, M, TCreate]):
         self.orm_model = orm_model
         self.domain_model = domain_model
         self.create_model = create_model
+        self.mapper = model_mapper(domain_model, orm_model, create_model)
+
+    def select_domain(self) -> Select:
+        """
+        select колонок доменной модели. Строки собираются в домен через
+        fetch_domain, без ORM объектов и identity map; отложенные (deferred)
+        колонки читаются, только если домен их объявляет.
+        """
+        return select(*self.mapper.columns)
+
+    async def fetch_domain(self, stmt: Select) -> List[T]:
+        result = await self.db.execute(stmt)
+        return [self.mapper.from_row(row) for row in result.all()]
 
     async def get(self, id: int) -> Optional[T]:
-        obj = await self.db.get(self.orm_model, id)
-        return self.to_domain(obj) if obj else None
+        found = await self.fetch_domain(
+            self.select_domain().where(self.orm_model.id == id)
+        )
+        return found[0] if found else None
 
     async def get_all(self) -> List[T]:
-        result = await self.db.execute(select(self.orm_model))
-        objs = result.scalars().all()
-        return [self.to_domain(obj) for obj in objs]
+        return await self.fetch_domain(self.select_domain())
 
     async def get_many(self, ids: Collection[int]) -> List[T]:
         if not ids:
             return []
 
-        stmt = select(self.orm_model).where(self.orm_model.id.in_(ids))
+        return await self.fetch_domain(
+            self.select_domain().where(self.orm_model.id.in_(ids))
+        )
+
+    async def get_projection(
+        self, projection: Type[P], ids: Optional[Collection[int]] = None
+    ) -> List[P]:
+        """
+        Читает только колонки, объявленные полями projection, и собирает DTO
+        прямо из строк, без ORM объектов. ids=None — все записи.
+        """
+        if ids is not None and not ids:
+            return []
+
+        stmt = select(
+            *(getattr(self.orm_model, name) for name in projection.model_fields)
+        )
+        if ids is not None:
+            stmt = stmt.where(self.orm_model.id.in_(ids))
+        stmt = stmt.order_by(self.orm_model.id)
+
         result = await self.db.execute(stmt)
-        objs = result.scalars().all()
-        return [self.to_domain(obj) for obj in objs]
+        return [projection(**row._mapping) for row in result.all()]
 
     async def add(self, create_dto: TCreate) -> T:
         orm_obj = self.to_orm_from_create(create_dto)
@@ -48,11 +83,18 @@ class BaseRepository(Generic[T, M, TCreate]):
         return self.to_domain(orm_obj)
 
     async def add_all(self, create_dtos: Sequence[TCreate]) -> List[T]:
-        orm_objs = [self.to_orm_from_create(dto) for dto in create_dtos]
-        self.db.add_all(orm_objs)
-        await self.db.flush()
-        ids = [obj.id for obj in orm_objs]
-        return await self.get_many(ids)
+        if not create_dtos:
+            return []
+
+        # Один INSERT ... RETURNING на пачку (insertmanyvalues), без ORM
+        # объектов и повторного SELECT; порядок строк — как у create_dtos
+        stmt = insert(self.orm_model).returning(
+            *self.mapper.columns, sort_by_parameter_order=True
+        )
+        result = await self.db.execute(
+            stmt, [self.mapper.create_values(dto) for dto in create_dtos]
+        )
+        return [self.mapper.from_row(row) for row in result.all()]
 
     async def update(self, entity: T) -> T:
         orm_obj = await self.db.merge(self.to_orm(entity))
@@ -72,12 +114,10 @@ class BaseRepository(Generic[T, M, TCreate]):
         await self.db.flush()
 
     def to_domain(self, orm_obj: M) -> T:
-        data = {k: v for k, v in vars(orm_obj).items() if not k.startswith("_")}
-        return self.domain_model(**data)
+        return self.mapper.from_orm(orm_obj)
 
     def to_orm(self, domain_obj: T) -> M:
-        return self.orm_model(**vars(domain_obj))
+        return self.mapper.to_orm(domain_obj)
 
     def to_orm_from_create(self, create_dto: TCreate) -> M:
-        data = vars(create_dto)
-        return self.orm_model(**data)
+        return self.mapper.to_orm_from_create(create_dto)
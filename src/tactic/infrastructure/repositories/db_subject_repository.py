@@ -14,6 +14,9 @@ from tactic.domain.entities.subject import (
     SubjectDto,
 )
 from tactic.infrastructure.repositories.base_repository import BaseRepository
+from tactic.infrastructure.repositories.subject_eligibility_index import (
+    SubjectEligibilityIndex,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +24,13 @@ logger = logging.getLogger(__name__)
 class DbSubjectRepository(
     BaseRepository[SubjectDomain, Subject, CreateSubjectDomain], SubjectRepository
 ):
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        eligibility_index: Optional[SubjectEligibilityIndex] = None,
+    ):
         super().__init__(db, SubjectDomain, Subject, CreateSubjectDomain)
+        self.eligibility_index = eligibility_index
 
     async def filter(
         self,
@@ -30,6 +38,12 @@ class DbSubjectRepository(
         education_level_ids: Optional[List[int]] = None,
         study_form_ids: Optional[List[int]] = None,
     ) -> List[SubjectDto]:
+        if self.eligibility_index is not None and self.eligibility_index.loaded:
+            return self.eligibility_index.filter(
+                contest_type_ids=contest_type_ids,
+                education_level_ids=education_level_ids,
+                study_form_ids=study_form_ids,
+            )
 
         stmt = select(Subject).distinct()
         stmt = stmt.join(ProgramContestExam, Subject.contest_exams).options(
@@ -51,6 +65,33 @@ class DbSubjectRepository(
         result = await self.db.execute(stmt)
         return [self.to_subject_dto(m) for m in result.scalars().all()]
 
+    async def load_eligibility_index(self, index: SubjectEligibilityIndex) -> None:
+        """
+        Заполняет индекс допустимых предметов одной выгрузкой из БД.
+        Повторный вызов перестраивает индекс (хук перезагрузки справочников).
+        """
+        subjects_result = await self.db.execute(
+            select(Subject).options(selectinload(Subject.aliases))
+        )
+        subjects = [self.to_subject_dto(m) for m in subjects_result.scalars().all()]
+
+        rows_result = await self.db.execute(
+            select(
+                ProgramContestExam.subject_id,
+                ProgramContestExam.contest_type_id,
+                Program.education_level_id,
+                Program.study_form_id,
+            )
+            .join(Program, ProgramContestExam.program)
+            .distinct()
+        )
+        rows = [(r[0], r[1], r[2], r[3]) for r in rows_result.all()]
+
+        index.build(subjects, rows)
+        logger.info(
+            "Индекс предметов построен: %d предметов, %d строк", len(subjects), len(rows)
+        )
+
     def to_subject_dto(self, orm_obj: Subject) -> SubjectDto:
         return SubjectDto(
             id=orm_obj.id,
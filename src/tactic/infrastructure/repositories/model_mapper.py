@@ -0,0 +1,100 @@
+from functools import lru_cache
+from typing import Any, Dict, Generic, Sequence, Tuple, Type, TypeVar
+
+from sqlalchemy import inspect
+
+T = TypeVar("T")  # доменная модель
+M = TypeVar("M")  # ORM модель
+
+
+class ModelMapper(Generic[T, M]):
+    """
+    Преобразование между ORM и доменной моделью без vars() и повторной
+    валидации: список колонок считается один раз на пару моделей.
+
+    Строки из БД считаются доверенными и собираются без валидации, как
+    model_construct, но без его разбора значений по умолчанию: в pydantic v2
+    model_construct медленнее самой валидации. Полная валидация остаётся,
+    если у домена есть поля, которых нет среди колонок ORM модели.
+    """
+
+    def __init__(
+        self, domain_model: Type[T], orm_model: Type[M], create_model: Type[Any]
+    ):
+        self.domain_model = domain_model
+        self.orm_model = orm_model
+
+        orm_mapper = inspect(orm_model)
+        attrs = orm_mapper.column_attrs
+        domain_fields = tuple(getattr(domain_model, "model_fields", {}))
+        self.fields: Tuple[str, ...] = tuple(
+            name for name in domain_fields if name in attrs
+        )
+        self.columns = tuple(attrs[name].class_attribute for name in self.fields)
+        self.trusted = (
+            len(self.fields) == len(domain_fields)
+            and not getattr(domain_model, "__private_attributes__", None)
+            and getattr(domain_model, "model_config", {}).get("extra") != "allow"
+        )
+        self._fields_set = frozenset(self.fields)
+        self.create_fields: Tuple[str, ...] = tuple(
+            getattr(create_model, "model_fields", {})
+        )
+        # insert() в обход ORM не вызывает @validates, их нужно запускать явно
+        self.validated = any(
+            name in orm_mapper.validators for name in self.create_fields
+        )
+
+    def from_row(self, row: Sequence[Any]) -> T:
+        """Строка select(*columns) в доменную модель, без ORM объекта."""
+        data = dict(zip(self.fields, row))
+        if self.trusted:
+            return self._construct(data)
+        return self.domain_model(**data)
+
+    def from_orm(self, orm_obj: M) -> T:
+        state = orm_obj.__dict__
+        if self.trusted:
+            try:
+                return self._construct({name: state[name] for name in self.fields})
+            except KeyError:
+                pass
+        # Не все колонки загружены: пусть валидация укажет, каких не хватает
+        data = {k: v for k, v in state.items() if not k.startswith("_")}
+        return self.domain_model(**data)
+
+    def _construct(self, data: Dict[str, Any]) -> T:
+        # То же, что делает BaseModel.model_construct для модели без
+        # приватных атрибутов и extra-полей
+        obj = self.domain_model.__new__(self.domain_model)
+        object.__setattr__(obj, "__dict__", data)
+        object.__setattr__(obj, "__pydantic_fields_set__", set(self._fields_set))
+        object.__setattr__(obj, "__pydantic_extra__", None)
+        object.__setattr__(obj, "__pydantic_private__", None)
+        return obj
+
+    def to_orm(self, domain_obj: T) -> M:
+        state = domain_obj.__dict__
+        return self.orm_model(**{name: state[name] for name in self.fields})
+
+    def to_orm_from_create(self, create_dto: Any) -> M:
+        state = create_dto.__dict__
+        return self.orm_model(**{name: state[name] for name in self.create_fields})
+
+    def create_values(self, create_dto: Any) -> Dict[str, Any]:
+        """
+        Значения колонок для insert() из DTO создания. Если у ORM модели
+        есть @validates, они срабатывают так же, как в add().
+        """
+        state = create_dto.__dict__
+        if self.validated:
+            state = self.to_orm_from_create(create_dto).__dict__
+        return {name: state[name] for name in self.create_fields}
+
+
+@lru_cache(maxsize=None)
+def model_mapper(
+    domain_model: Type[T], orm_model: Type[M], create_model: Type[Any]
+) -> ModelMapper[T, M]:
+    # Репозитории создаются на каждую сессию, а маппер — один на пару моделей
+    return ModelMapper(domain_model, orm_model, create_model)
@@ -3,12 +3,14 @@ from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.models import NotificationSubscription
+from shared.models import NotificationSubscription, Program
 from tactic.application.common.repositories import NotificationSubscriptionRepository
 from tactic.domain.entities.notification_subscription import (
     CreateNotificationSubscriptionDomain,
     NotificationSubscriptionDomain,
+    NotificationSubscriptionDTO,
 )
+from tactic.domain.entities.timeline_type import PAYMENT_TYPE_NAMES
 from tactic.infrastructure.repositories.base_repository import BaseRepository
 
 
@@ -35,7 +37,7 @@ class NotificationSubscriptionRepositoryImpl(
         program_id: Optional[int] = None,
         timeline_type_id: Optional[int] = None,
     ) -> List[NotificationSubscriptionDomain]:
-        stmt = select(self.orm_model)
+        stmt = self.select_domain()
 
         # Условия фильтрации
         if user_id is not None:
@@ -45,6 +47,31 @@ class NotificationSubscriptionRepositoryImpl(
         if timeline_type_id is not None:
             stmt = stmt.where(self.orm_model.timeline_type_id == timeline_type_id)
 
+        return await self.fetch_domain(stmt)
+
+    async def get_subscriptions_by_user_id(
+        self, user_id: int
+    ) -> List[NotificationSubscriptionDTO]:
+        # Только нужные колонки: program_info и career_info не читаются
+        stmt = (
+            select(
+                NotificationSubscription.id,
+                Program.title,
+                NotificationSubscription.timeline_type_id,
+            )
+            .join(Program, NotificationSubscription.program_id == Program.id)
+            .where(NotificationSubscription.user_id == user_id)
+            .order_by(NotificationSubscription.id)
+        )
+
         result = await self.db.execute(stmt)
-        objs = result.scalars().all()
-        return [self.to_domain(obj) for obj in objs]
+        return [
+            NotificationSubscriptionDTO(
+                id=row.id,
+                program_title=row.title,
+                timeline_type_name=PAYMENT_TYPE_NAMES.get(
+                    row.timeline_type_id, "Неизвестно"
+                ),
+            )
+            for row in result.all()
+        ]
@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# (program_id, education_level_id, study_form_id)
+ProgramRow = Tuple[int, int, int]
+# (program_id, contest_type_id, subject_id, is_optional)
+ContestExamRow = Tuple[int, int, int, bool]
+
+_WORD_BITS = 64
+
+
+@dataclass(frozen=True)
+class _IndexState:
+    program_ids: np.ndarray
+    education_level_ids: np.ndarray
+    study_form_ids: np.ndarray
+    # Пары (программа, тип конкурса): позиция программы и тип конкурса
+    pair_program: np.ndarray
+    pair_contest_type: np.ndarray
+    # Маски предметов пар, по строке из слов uint64 на пару
+    required: np.ndarray
+    optional: np.ndarray
+    has_optional: np.ndarray
+    subject_pos: Dict[int, int]
+
+
+class ProgramEligibilityIndex:
+    """
+    In-memory индекс для ProgramRepositoryImpl.filter.
+
+    ProgramContestExam загружается один раз и сворачивается в маски
+    обязательных и выборочных предметов для каждой пары
+    (программа, тип конкурса). Пара подходит, если все обязательные
+    предметы сданы и, если выборочные есть, сдан хотя бы один из них;
+    программа подходит, если подходит хотя бы одна её пара.
+    """
+
+    def __init__(self) -> None:
+        self._state: Optional[_IndexState] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._state is not None
+
+    def clear(self) -> None:
+        self._state = None
+
+    def build(
+        self, programs: Iterable[ProgramRow], exams: Iterable[ContestExamRow]
+    ) -> None:
+        program_rows = sorted(programs)
+        program_pos = {row[0]: i for i, row in enumerate(program_rows)}
+
+        pair_ids: Dict[Tuple[int, int], int] = {}
+        pair_program: List[int] = []
+        pair_contest_type: List[int] = []
+        # (пара, позиция предмета, выборочный ли)
+        bits: List[Tuple[int, int, bool]] = []
+        subject_pos: Dict[int, int] = {}
+
+        for program_id, contest_type_id, subject_id, is_optional in exams:
+            pos = program_pos.get(program_id)
+            if pos is None:
+                continue
+
+            pair = pair_ids.setdefault((program_id, contest_type_id), len(pair_ids))
+            if pair == len(pair_program):
+                pair_program.append(pos)
+                pair_contest_type.append(contest_type_id)
+
+            bit = subject_pos.setdefault(subject_id, len(subject_pos))
+            bits.append((pair, bit, is_optional))
+
+        words = max(1, -(-len(subject_pos) // _WORD_BITS))
+        required = np.zeros((len(pair_program), words), dtype=np.uint64)
+        optional = np.zeros((len(pair_program), words), dtype=np.uint64)
+        for pair, bit, is_optional in bits:
+            target = optional if is_optional else required
+            target[pair, bit // _WORD_BITS] |= np.uint64(1 << (bit % _WORD_BITS))
+
+        # Подмена одной ссылкой: параллельные filter() видят либо старый,
+        # либо новый индекс целиком
+        self._state = _IndexState(
+            program_ids=np.array([r[0] for r in program_rows], dtype=np.int64),
+            education_level_ids=np.array(
+                [r[1] for r in program_rows], dtype=np.int64
+            ),
+            study_form_ids=np.array([r[2] for r in program_rows], dtype=np.int64),
+            pair_program=np.array(pair_program, dtype=np.int64),
+            pair_contest_type=np.array(pair_contest_type, dtype=np.int64),
+            required=required,
+            optional=optional,
+            has_optional=optional.any(axis=1),
+            subject_pos=subject_pos,
+        )
+
+    def filter(
+        self,
+        education_level_ids: Optional[List[int]] = None,
+        study_form_ids: Optional[List[int]] = None,
+        contest_type_ids: Optional[List[int]] = None,
+        exam_subject_ids: Optional[List[int]] = None,
+    ) -> List[int]:
+        state = self._state
+        if state is None:
+            raise RuntimeError("ProgramEligibilityIndex is not built")
+
+        selected = np.ones(len(state.program_ids), dtype=bool)
+        if education_level_ids:
+            selected &= np.isin(state.education_level_ids, education_level_ids)
+        if study_form_ids:
+            selected &= np.isin(state.study_form_ids, study_form_ids)
+
+        pairs = np.ones(len(state.pair_program), dtype=bool)
+        if contest_type_ids:
+            pairs &= np.isin(state.pair_contest_type, contest_type_ids)
+
+        if exam_subject_ids:
+            passed = self._subject_mask(state, exam_subject_ids)
+            missing_required = (state.required & ~passed).any(axis=1)
+            optional_ok = ~state.has_optional | (state.optional & passed).any(axis=1)
+            pairs &= ~missing_required & optional_ok
+
+        if contest_type_ids or exam_subject_ids:
+            with_pair = np.zeros(len(state.program_ids), dtype=bool)
+            with_pair[state.pair_program[pairs]] = True
+            selected &= with_pair
+
+        return state.program_ids[selected].tolist()
+
+    @staticmethod
+    def _subject_mask(state: _IndexState, subject_ids: List[int]) -> np.ndarray:
+        mask = np.zeros(state.required.shape[1], dtype=np.uint64)
+        for subject_id in subject_ids:
+            bit = state.subject_pos.get(subject_id)
+            if bit is not None:
+                mask[bit // _WORD_BITS] |= np.uint64(1 << (bit % _WORD_BITS))
+        return mask
@@ -1,10 +1,17 @@
 import logging
 from typing import List, Optional
 
-from sqlalchemy import or_, select, tuple_
+from sqlalchemy import delete, func, insert, literal_column, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.models import Program, ProgramContestExam
+from shared.models import (
+    Program,
+    ProgramContestExam,
+    ProgramEligibility,
+    Subject,
+    SubjectAlias,
+)
 from tactic.application.common.repositories import ProgramRepository
 from tactic.domain.entities.program import (
     CreateProgramDomain,
@@ -12,19 +19,83 @@ from tactic.domain.entities.program import (
     ProgramDTO,
 )
 from tactic.infrastructure.repositories.base_repository import BaseRepository
+from tactic.infrastructure.repositories.program_eligibility_index import (
+    ProgramEligibilityIndex,
+)
 
 logger = logging.getLogger(__name__)
+
+
+def _ordered_md5(row_expr, order_by):
+    """md5 от всех строк таблицы, склеенных в детерминированном порядке."""
+    return select(
+        func.coalesce(
+            func.md5(
+                func.string_agg(
+                    row_expr, aggregate_order_by(literal_column("','"), order_by)
+                )
+            ),
+            "",
+        )
+    ).scalar_subquery()
+
+
 class ProgramRepositoryImpl(
     BaseRepository[ProgramDomain, Program, CreateProgramDomain], ProgramRepository
 ):
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        eligibility_index: Optional[ProgramEligibilityIndex] = None,
+        use_eligibility_table: bool = False,
+    ):
         super().__init__(db, ProgramDomain, Program, CreateProgramDomain)
+        self.eligibility_index = eligibility_index
+        # Читать условия поступления из program_eligibility, а не собирать
+        # их подзапросами к program_contest_exam
+        self.use_eligibility_table = use_eligibility_table
 
     async def get_all_titles(self) -> List[ProgramDTO]:
-        result = await self.db.execute(select(Program.id, Program.title))
-        rows = result.all()
+        return await self.get_projection(ProgramDTO)
+
+    async def get_catalog_version(self) -> str:
+        programs_hash = _ordered_md5(
+            func.concat_ws(
+                ":",
+                Program.id,
+                Program.title,
+                Program.education_level_id,
+                Program.study_form_id,
+            ),
+            Program.id,
+        )
+        exams_hash = _ordered_md5(
+            func.concat_ws(
+                ":",
+                ProgramContestExam.program_id,
+                ProgramContestExam.contest_type_id,
+                ProgramContestExam.subject_id,
+                ProgramContestExam.is_optional,
+            ),
+            ProgramContestExam.id,
+        )
+
+        # Предметы и их синонимы: от них зависят распознаватели экзаменов
+        # и индекс предметов, которые перестраиваются вместе с каталогом
+        subjects_hash = _ordered_md5(
+            func.concat_ws(":", Subject.id, Subject.name), Subject.id
+        )
+        aliases_hash = _ordered_md5(
+            func.concat_ws(
+                ":", SubjectAlias.id, SubjectAlias.subject_id, SubjectAlias.alias
+            ),
+            SubjectAlias.id,
+        )
 
-        return [ProgramDTO(id=row[0], title=row[1]) for row in rows]
+        result = await self.db.execute(
+            select(func.concat(programs_hash, exams_hash, subjects_hash, aliases_hash))
+        )
+        return result.scalar_one()
 
     async def filter(
         self,
@@ -33,6 +104,20 @@ class ProgramRepositoryImpl(
         contest_type_ids: Optional[List[int]] = None,
         exam_subject_ids: Optional[List[int]] = None,
     ) -> List[int]:
+        if self.eligibility_index is not None and self.eligibility_index.loaded:
+            return self.eligibility_index.filter(
+                education_level_ids=education_level_ids,
+                study_form_ids=study_form_ids,
+                contest_type_ids=contest_type_ids,
+                exam_subject_ids=exam_subject_ids,
+            )
+
+        # Программы без экзаменов в таблице не представлены, поэтому без
+        # фильтров по конкурсу и экзаменам она не нужна
+        if self.use_eligibility_table and (contest_type_ids or exam_subject_ids):
+            return await self._filter_by_eligibility_table(
+                education_level_ids, study_form_ids, contest_type_ids, exam_subject_ids
+            )
 
         stmt = select(Program.id)
 
@@ -132,3 +217,110 @@ class ProgramRepositoryImpl(
         ids = [i for i in program_ids]
         logger.info(f"Отвильтрованные программы: {ids}")
         return [i for i in program_ids]
+
+    async def _filter_by_eligibility_table(
+        self,
+        education_level_ids: Optional[List[int]],
+        study_form_ids: Optional[List[int]],
+        contest_type_ids: Optional[List[int]],
+        exam_subject_ids: Optional[List[int]],
+    ) -> List[int]:
+        stmt = select(ProgramEligibility.program_id).distinct()
+
+        if education_level_ids:
+            stmt = stmt.where(
+                ProgramEligibility.education_level_id.in_(education_level_ids)
+            )
+        if study_form_ids:
+            stmt = stmt.where(ProgramEligibility.study_form_id.in_(study_form_ids))
+        if contest_type_ids:
+            stmt = stmt.where(ProgramEligibility.contest_type_id.in_(contest_type_ids))
+
+        if exam_subject_ids:
+            passed = array(exam_subject_ids)
+            stmt = stmt.where(
+                ProgramEligibility.required_subject_ids.contained_by(passed),
+                or_(
+                    func.cardinality(ProgramEligibility.optional_subject_ids) == 0,
+                    ProgramEligibility.optional_subject_ids.overlap(passed),
+                ),
+            )
+
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def refresh_eligibility(self) -> int:
+        """
+        Пересобирает program_eligibility из program_contest_exam.
+        Вызывается загрузчиком после любого изменения каталога.
+        """
+
+        def subjects(is_optional: bool):
+            return func.coalesce(
+                func.array_agg(ProgramContestExam.subject_id).filter(
+                    ProgramContestExam.is_optional.is_(is_optional)
+                ),
+                literal_column("'{}'::integer[]"),
+            )
+
+        rows = (
+            select(
+                ProgramContestExam.program_id,
+                ProgramContestExam.contest_type_id,
+                Program.education_level_id,
+                Program.study_form_id,
+                subjects(False),
+                subjects(True),
+            )
+            .join(Program, ProgramContestExam.program)
+            .group_by(
+                ProgramContestExam.program_id,
+                ProgramContestExam.contest_type_id,
+                Program.education_level_id,
+                Program.study_form_id,
+            )
+        )
+
+        await self.db.execute(delete(ProgramEligibility))
+        result = await self.db.execute(
+            insert(ProgramEligibility).from_select(
+                [
+                    ProgramEligibility.program_id,
+                    ProgramEligibility.contest_type_id,
+                    ProgramEligibility.education_level_id,
+                    ProgramEligibility.study_form_id,
+                    ProgramEligibility.required_subject_ids,
+                    ProgramEligibility.optional_subject_ids,
+                ],
+                rows,
+            )
+        )
+        logger.info("program_eligibility пересобрана: %d строк", result.rowcount)
+        return result.rowcount
+
+    async def load_eligibility_index(self, index: ProgramEligibilityIndex) -> None:
+        """
+        Заполняет индекс допустимых программ одной выгрузкой из БД.
+        Повторный вызов перестраивает индекс (хук перезагрузки каталога).
+        """
+        programs_result = await self.db.execute(
+            select(Program.id, Program.education_level_id, Program.study_form_id)
+        )
+        programs = [(r[0], r[1], r[2]) for r in programs_result.all()]
+
+        exams_result = await self.db.execute(
+            select(
+                ProgramContestExam.program_id,
+                ProgramContestExam.contest_type_id,
+                ProgramContestExam.subject_id,
+                ProgramContestExam.is_optional,
+            )
+        )
+        exams = [(r[0], r[1], r[2], bool(r[3])) for r in exams_result.all()]
+
+        index.build(programs, exams)
+        logger.info(
+            "Индекс программ построен: %d программ, %d экзаменов",
+            len(programs),
+            len(exams),
+        )
@@ -1,7 +1,6 @@
 from typing import List
 
 from aiocache import cached
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.models import Question
@@ -21,6 +20,5 @@ class QuestionRepositoryImpl(
     async def get_questions_by_category_id(  # type: ignore
         self, category_id: int
     ) -> List[QuestionDomain]:
-        stmt = select(Question).where(Question.category_id == category_id)
-        result = await self.db.execute(stmt)
-        return [self.to_domain(q) for q in result.scalars().all()]
+        stmt = self.select_domain().where(Question.category_id == category_id)
+        return await self.fetch_domain(stmt)
@@ -3,11 +3,12 @@ from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.models import ScheduledNotification
+from shared.models import ScheduledNotification, TimelineEvent, TimelineEventName
 from tactic.application.common.repositories import ScheduledNotificationRepository
 from tactic.domain.entities.sheduled_notification import (
     CreateScheduledNotificationDomain,
     ScheduledNotificationDomain,
+    ScheduledNotificationDTO,
 )
 from tactic.infrastructure.repositories.base_repository import BaseRepository
 
@@ -31,12 +32,37 @@ class ScheduledNotificationRepositoryImpl(
     async def filter(
         self, notification_subscription_id: Optional[int] = None
     ) -> List[ScheduledNotificationDomain]:
-        stmt = select(self.orm_model)
+        stmt = self.select_domain()
         if notification_subscription_id is not None:
             stmt = stmt.where(
                 self.orm_model.subscription_id == notification_subscription_id
             )
 
+        return await self.fetch_domain(stmt)
+
+    async def get_notifications_by_subscription_id(
+        self, subscription_id: int
+    ) -> List[ScheduledNotificationDTO]:
+        stmt = (
+            select(
+                ScheduledNotification.id,
+                TimelineEventName.name.label("event_name"),
+                ScheduledNotification.send_at,
+                TimelineEvent.deadline,
+            )
+            .join(TimelineEvent, ScheduledNotification.event_id == TimelineEvent.id)
+            .join(TimelineEventName, TimelineEvent.name_id == TimelineEventName.id)
+            .where(ScheduledNotification.subscription_id == subscription_id)
+            .order_by(ScheduledNotification.send_at, ScheduledNotification.id)
+        )
+
         result = await self.db.execute(stmt)
-        objs = result.scalars().all()
-        return [self.to_domain(obj) for obj in objs]
+        return [
+            ScheduledNotificationDTO(
+                id=row.id,
+                event_name=row.event_name,
+                send_at=row.send_at,
+                deadline=row.deadline,
+            )
+            for row in result.all()
+        ]
@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tactic.domain.entities.subject import SubjectDto
+
+# (subject_id, contest_type_id, education_level_id, study_form_id)
+EligibilityRow = Tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class _IndexState:
+    subjects: Tuple[SubjectDto, ...]
+    # Для каждой комбинации (тип конкурса, уровень, форма) — битовая маска предметов
+    combo_subjects: Tuple[int, ...]
+    # Значение фильтра -> битовая маска комбинаций, в которых оно встречается
+    by_contest_type: Dict[int, int]
+    by_education_level: Dict[int, int]
+    by_study_form: Dict[int, int]
+    all_combos: int
+
+
+class SubjectEligibilityIndex:
+    """
+    In-memory индекс допустимых предметов для DbSubjectRepository.filter.
+
+    Строится один раз из выгрузки ProgramContestExam x Program. Условия фильтра
+    должны выполняться для одной и той же строки экзамена, поэтому пересекаются
+    не множества предметов, а маски комбинаций (тип конкурса, уровень, форма),
+    и только затем объединяются маски предметов подходящих комбинаций.
+    """
+
+    def __init__(self) -> None:
+        self._state: Optional[_IndexState] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._state is not None
+
+    def build(
+        self, subjects: Iterable[SubjectDto], rows: Iterable[EligibilityRow]
+    ) -> None:
+        ordered = tuple(sorted(subjects, key=lambda s: s.id))
+        subject_bit = {s.id: 1 << i for i, s in enumerate(ordered)}
+
+        combo_ids: Dict[Tuple[int, int, int], int] = {}
+        combo_subjects: List[int] = []
+        by_contest_type: Dict[int, int] = {}
+        by_education_level: Dict[int, int] = {}
+        by_study_form: Dict[int, int] = {}
+
+        for subject_id, contest_type_id, education_level_id, study_form_id in rows:
+            bit = subject_bit.get(subject_id)
+            if bit is None:
+                continue
+
+            combo = (contest_type_id, education_level_id, study_form_id)
+            idx = combo_ids.get(combo)
+            if idx is None:
+                idx = len(combo_subjects)
+                combo_ids[combo] = idx
+                combo_subjects.append(0)
+                combo_bit = 1 << idx
+                by_contest_type[contest_type_id] = (
+                    by_contest_type.get(contest_type_id, 0) | combo_bit
+                )
+                by_education_level[education_level_id] = (
+                    by_education_level.get(education_level_id, 0) | combo_bit
+                )
+                by_study_form[study_form_id] = (
+                    by_study_form.get(study_form_id, 0) | combo_bit
+                )
+            combo_subjects[idx] |= bit
+
+        # Подмена одной ссылкой: параллельные filter() видят либо старый,
+        # либо новый индекс целиком
+        self._state = _IndexState(
+            subjects=ordered,
+            combo_subjects=tuple(combo_subjects),
+            by_contest_type=by_contest_type,
+            by_education_level=by_education_level,
+            by_study_form=by_study_form,
+            all_combos=(1 << len(combo_subjects)) - 1,
+        )
+
+    def filter(
+        self,
+        contest_type_ids: Optional[List[int]] = None,
+        education_level_ids: Optional[List[int]] = None,
+        study_form_ids: Optional[List[int]] = None,
+    ) -> List[SubjectDto]:
+        state = self._state
+        if state is None:
+            raise RuntimeError("SubjectEligibilityIndex is not built")
+
+        combos = state.all_combos
+        for ids, by_value in (
+            (contest_type_ids, state.by_contest_type),
+            (education_level_ids, state.by_education_level),
+            (study_form_ids, state.by_study_form),
+        ):
+            if ids:
+                combos &= self._union(by_value, ids)
+
+        subjects_mask = 0
+        idx = 0
+        while combos:
+            if combos & 1:
+                subjects_mask |= state.combo_subjects[idx]
+            combos >>= 1
+            idx += 1
+
+        return [
+            subject
+            for i, subject in enumerate(state.subjects)
+            if subjects_mask >> i & 1
+        ]
+
+    @staticmethod
+    def _union(by_value: Dict[int, int], ids: List[int]) -> int:
+        mask = 0
+        for value in ids:
+            mask |= by_value.get(value, 0)
+        return mask
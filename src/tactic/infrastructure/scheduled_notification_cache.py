@@ -0,0 +1,33 @@
+from typing import List, Optional
+
+from cachetools import TTLCache  # type:ignore
+
+from tactic.application.services.scheduled_notification_cache import (
+    ScheduledNotificationCache,
+)
+from tactic.domain.entities.sheduled_notification import ScheduledNotificationDTO
+
+
+class TTLScheduledNotificationCache(ScheduledNotificationCache):
+    """
+    In-memory кеш уведомлений подписок с коротким временем жизни.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 60):
+        self.notifications = TTLCache[int, List[ScheduledNotificationDTO]](
+            maxsize=maxsize, ttl=ttl
+        )
+
+    def get(self, subscription_id: int) -> Optional[List[ScheduledNotificationDTO]]:
+        notifications = self.notifications.get(subscription_id)
+        if notifications is None:
+            return None
+        return list(notifications)
+
+    def put(
+        self, subscription_id: int, notifications: List[ScheduledNotificationDTO]
+    ) -> None:
+        self.notifications[subscription_id] = list(notifications)
+
+    def invalidate(self, subscription_id: int) -> None:
+        self.notifications.pop(subscription_id, None)
@@ -0,0 +1,74 @@
+import re
+from typing import List
+
+_SPACES_RE = re.compile(r"\s+")
+
+# Та же клавиша на раскладке ЙЦУКЕН -> QWERTY
+_RU_TO_EN_LAYOUT = str.maketrans(
+    "йцукенгшщзхъфывапролджэячсмитьбюё",
+    "qwertyuiop[]asdfghjkl;'zxcvbnm,.`",
+)
+
+_RU_TO_TRANSLIT = str.maketrans(
+    {
+        "а": "a",
+        "б": "b",
+        "в": "v",
+        "г": "g",
+        "д": "d",
+        "е": "e",
+        "ё": "e",
+        "ж": "zh",
+        "з": "z",
+        "и": "i",
+        "й": "y",
+        "к": "k",
+        "л": "l",
+        "м": "m",
+        "н": "n",
+        "о": "o",
+        "п": "p",
+        "р": "r",
+        "с": "s",
+        "т": "t",
+        "у": "u",
+        "ф": "f",
+        "х": "h",
+        "ц": "ts",
+        "ч": "ch",
+        "ш": "sh",
+        "щ": "sch",
+        "ъ": "",
+        "ы": "y",
+        "ь": "",
+        "э": "e",
+        "ю": "yu",
+        "я": "ya",
+    }
+)
+
+
+def normalize(text: str) -> str:
+    """Нижний регистр, ё -> е, схлопнутые пробелы."""
+    return _SPACES_RE.sub(" ", text.lower().replace("ё", "е")).strip()
+
+
+def to_latin_layout(text: str) -> str:
+    """Что получится, если набрать русский текст на английской раскладке."""
+    return text.translate(_RU_TO_EN_LAYOUT)
+
+
+def transliterate(text: str) -> str:
+    return text.translate(_RU_TO_TRANSLIT)
+
+
+def text_variants(text: str) -> List[str]:
+    """
+    Нормализованный текст и его варианты для индекса: набор на латинской
+    раскладке и транслит. Варианты добавляются в индекс при построении,
+    поэтому запрос "vfntvfnbrf" или "matematika" сравнивается с ними
+    напрямую, без отдельных проходов на каждый вариант ввода.
+    """
+    normalized = normalize(text)
+    variants = [normalized, to_latin_layout(normalized), transliterate(normalized)]
+    return list(dict.fromkeys(variants))
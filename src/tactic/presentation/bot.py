@@ -10,6 +10,10 @@ from aiogram_dialog import setup_dialogs
 from arq import create_pool
 from arq.connections import RedisSettings
 
+from tactic.domain.entities.program import ProgramDTO
+from tactic.infrastructure.cached_recognize_program import (
+    CachingRecognizeProgramFactory,
+)
 from tactic.infrastructure.config_loader import load_config
 from tactic.infrastructure.db.check_db.is_correct_education_level import (
     is_correct_education_levels,
@@ -22,11 +26,22 @@ from tactic.infrastructure.middlewares.antiflood_middlewares import (
     CallbackQueryThrottlingMiddleware,
     MessageThrottlingMiddleware,
 )
-from tactic.infrastructure.recognize_program_rapid_wuzzy import (
-    RecognizeProgramRapidWuzzy,
+from tactic.infrastructure.recognition_cache import RecognitionCache
+from tactic.infrastructure.recognize_program_rapid_wuzzy_factory import (
+    RecognizeProgramRapidWuzzyFactory,
+)
+from tactic.infrastructure.recognizer_executor import create_recognizer_executor
+from tactic.infrastructure.reloadable_recognize_program import (
+    ReloadableRecognizeProgram,
 )
 from tactic.infrastructure.repositories.cache_config import setup_cache
-from tactic.infrastructure.repositories.program_repository import ProgramRepositoryImpl
+from tactic.infrastructure.repositories.db_subject_repository import DbSubjectRepository
+from tactic.infrastructure.repositories.program_eligibility_index import (
+    ProgramEligibilityIndex,
+)
+from tactic.infrastructure.repositories.subject_eligibility_index import (
+    SubjectEligibilityIndex,
+)
 from tactic.infrastructure.telegram.rate_limited_bot import RateLimitedBot, RedisLimiterBackend
 from tactic.presentation.ioc import IoC
 from tactic.presentation.telegram import (
@@ -34,7 +49,11 @@ from tactic.presentation.telegram import (
     register_dialogs,
     register_handlers,
 )
-from tactic.settings import redis_settings
+from tactic.settings import (
+    program_service_settings,
+    recognizer_settings,
+    redis_settings,
+)
 
 
 async def main() -> None:
@@ -82,18 +101,36 @@ async def main() -> None:
 
     bot = RateLimitedBot(token=token, limiter_backend=backend)
 
+    recognizer_executor = create_recognizer_executor(
+        recognizer_settings.executor, recognizer_settings.workers
+    )
+    recognize_program = ReloadableRecognizeProgram(
+        session_factory=session_factory,
+        factory=CachingRecognizeProgramFactory(
+            RecognizeProgramRapidWuzzyFactory(recognizer_executor),
+            RecognitionCache[ProgramDTO](maxsize=recognizer_settings.cache_size),
+        ),
+        threshold=program_service_settings.threshold,
+    )
+    await recognize_program.reload()
+
     async with session_factory() as session:
         async with session.begin():
-            program_repo = ProgramRepositoryImpl(session)
-            programs = await program_repo.get_all_titles()
-            recognize_program = await RecognizeProgramRapidWuzzy.create(programs, 70)
+            subject_eligibility_index = SubjectEligibilityIndex()
+            await DbSubjectRepository(session).load_eligibility_index(
+                subject_eligibility_index
+            )
 
     ioc = IoC(
         session_factory=session_factory,
         bot=bot,
         arq_redis=redis,
         recognize_program=recognize_program,
+        subject_eligibility_index=subject_eligibility_index,
+        program_eligibility_index=ProgramEligibilityIndex(),
+        recognizer_executor=recognizer_executor,
     )
+    await ioc.load_program_eligibility_index()
 
     storage: RedisStorage = RedisStorage.from_url(
         redis_settings.get_connection_string(),
@@ -104,6 +141,15 @@ async def main() -> None:
         events_isolation=RedisEventIsolation(redis=storage.redis),
         ioc=ioc,
     )
+    # Каталог меняется только загрузчиком данных: вместе с программами
+    # перестраиваем индексы предметов и программ
+    recognize_program.add_listener(ioc.reload_exam_data)
+    recognize_program.start(
+        interval=program_service_settings.reload_interval,
+        redis=storage.redis,
+        channel=program_service_settings.reload_channel,
+    )
+
     dp.message.middleware.register(MessageThrottlingMiddleware(redis=storage.redis))
     dp.callback_query.middleware.register(
         CallbackQueryThrottlingMiddleware(redis=storage.redis)
@@ -122,6 +168,13 @@ async def main() -> None:
     finally:
         logging.info("Shutdown..")
 
+        await recognize_program.stop()
+        logging.info("Program recognizer reload tasks stopped.")
+
+        if recognizer_executor is not None:
+            recognizer_executor.shutdown(wait=True)
+            logging.info("Recognizer executor shut down.")
+
         await redis.close()
         logging.info("Arq redis pool closed.")
 
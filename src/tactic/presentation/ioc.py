@@ -1,11 +1,20 @@
+import logging
+from concurrent.futures import Executor
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
 
 from arq import ArqRedis
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from tactic.application.common.fabrics import RecognizeExamFactory
+from tactic.application.services.program_filter_cache import ProgramFilterCache
+from tactic.application.services.recognize_exam_registry import (
+    RecognizeExamRegistry,
+)
 from tactic.application.services.recognize_program import RecognizeProgram
+from tactic.application.services.scheduled_notification_cache import (
+    ScheduledNotificationCache,
+)
 from tactic.application.use_cases.create_user import CreateUser
 from tactic.application.use_cases.get_all_contest_types import GetAllContestTypesUseCase
 from tactic.application.use_cases.get_all_education_levels import (
@@ -41,14 +50,19 @@ from tactic.application.use_cases.subscribe_for_program import (
 from tactic.application.use_cases.unsubscrib_from_program import (
     UnsubscribeFromProgramUseCase,
 )
+from tactic.domain.entities.subject import SubjectDto
 from tactic.domain.services.user import UserService
+from tactic.infrastructure.cached_recognize_exam import CachingRecognizeExamFactory
 from tactic.infrastructure.db.uow import SQLAlchemyUoW
 from tactic.infrastructure.notificaton_message_sheduling_service import (
     NotificationSchedulingServiceImpl,
 )
+from tactic.infrastructure.program_filter_cache import TTLProgramFilterCache
+from tactic.infrastructure.recognition_cache import RecognitionCache
 from tactic.infrastructure.recognize_exam_rapid_wuzzy_factory import (
     RecognizeExamRapidWuzzyFactory,
 )
+from tactic.infrastructure.recognize_exam_registry import TTLRecognizeExamRegistry
 from tactic.infrastructure.repositories.category_repository import (
     CategoryRepositoryImpl,
 )
@@ -62,6 +76,9 @@ from tactic.infrastructure.repositories.education_level_repository import (
 from tactic.infrastructure.repositories.notification_subscription_repository import (
     NotificationSubscriptionRepositoryImpl,
 )
+from tactic.infrastructure.repositories.program_eligibility_index import (
+    ProgramEligibilityIndex,
+)
 from tactic.infrastructure.repositories.program_repository import ProgramRepositoryImpl
 from tactic.infrastructure.repositories.questions_repository import (
     QuestionRepositoryImpl,
@@ -69,22 +86,30 @@ from tactic.infrastructure.repositories.questions_repository import (
 from tactic.infrastructure.repositories.sheduled_notification_repository import (
     ScheduledNotificationRepositoryImpl,
 )
+from tactic.infrastructure.repositories.subject_eligibility_index import (
+    SubjectEligibilityIndex,
+)
 from tactic.infrastructure.repositories.study_form_repository import (
     StudyFormRepositoryImpl,
 )
-from tactic.infrastructure.repositories.timeline_event_name_repository import (
-    TimelineEventNameRepositoryImpl,
-)
 from tactic.infrastructure.repositories.timeline_event_repository import (
     TimelineEventRepositoryImpl,
 )
-from tactic.infrastructure.repositories.timeline_type_repository import (
-    TimelineTypeRepositoryImpl,
-)
 from tactic.infrastructure.repositories.user import UserRepositoryImpl
+from tactic.infrastructure.scheduled_notification_cache import (
+    TTLScheduledNotificationCache,
+)
 from tactic.infrastructure.telegram.rate_limited_bot import RateLimitedBot
 from tactic.infrastructure.telegram.telegram_message_sender import TelegramMessageSender
 from tactic.presentation.interactor_factory import InteractorFactory
+from tactic.settings import (
+    exam_service_settings,
+    notification_settings,
+    program_service_settings,
+    recognizer_settings,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class IoC(InteractorFactory):
@@ -92,7 +117,13 @@ class IoC(InteractorFactory):
     _bot: RateLimitedBot
     _arq_redis: ArqRedis
     _recognize_program: RecognizeProgram
-    _exam_recognize_factory: RecognizeExamFactory = RecognizeExamRapidWuzzyFactory()
+    _exam_recognize_factory: RecognizeExamFactory
+    _exam_recognizer_registry: RecognizeExamRegistry
+    _exam_recognition_cache: RecognitionCache[SubjectDto]
+    _subject_eligibility_index: SubjectEligibilityIndex
+    _program_eligibility_index: ProgramEligibilityIndex
+    _program_filter_cache: ProgramFilterCache
+    _scheduled_notification_cache: ScheduledNotificationCache
 
     def __init__(
         self,
@@ -100,11 +131,69 @@ class IoC(InteractorFactory):
         bot: RateLimitedBot,
         arq_redis: ArqRedis,
         recognize_program: RecognizeProgram,
+        subject_eligibility_index: SubjectEligibilityIndex,
+        program_eligibility_index: ProgramEligibilityIndex,
+        recognizer_executor: Optional[Executor] = None,
     ):
         self._session_factory = session_factory
         self._bot = bot
         self._arq_redis = arq_redis
         self._recognize_program = recognize_program
+        self._subject_eligibility_index = subject_eligibility_index
+        self._program_eligibility_index = program_eligibility_index
+        self._exam_recognition_cache = RecognitionCache[SubjectDto](
+            maxsize=recognizer_settings.cache_size
+        )
+        self._exam_recognize_factory = CachingRecognizeExamFactory(
+            RecognizeExamRapidWuzzyFactory(recognizer_executor),
+            self._exam_recognition_cache,
+        )
+        self._exam_recognizer_registry = TTLRecognizeExamRegistry(
+            maxsize=exam_service_settings.recognizer_cache_size,
+            ttl=exam_service_settings.recognizer_cache_ttl,
+        )
+        self._program_filter_cache = TTLProgramFilterCache(
+            maxsize=program_service_settings.filter_cache_size,
+            ttl=program_service_settings.filter_cache_ttl,
+        )
+        self._scheduled_notification_cache = TTLScheduledNotificationCache(
+            maxsize=notification_settings.view_cache_size,
+            ttl=notification_settings.view_cache_ttl,
+        )
+
+    async def reload_exam_data(self) -> None:
+        """
+        Перестраивает индексы предметов и программ и сбрасывает распознаватели
+        экзаменов и кеш подбора программ после изменения каталога
+        (вызывается при смене его версии).
+        """
+        async with self._session_factory() as session:
+            async with session.begin():
+                repo = DbSubjectRepository(session)
+                await repo.load_eligibility_index(self._subject_eligibility_index)
+        await self.load_program_eligibility_index()
+        self._exam_recognizer_registry.invalidate()
+        self._exam_recognition_cache.clear()
+        self._program_filter_cache.invalidate()
+
+    async def load_program_eligibility_index(self) -> None:
+        """
+        Строит индекс программ. Если построить не удалось, подбор программ
+        читает условия поступления из таблицы program_eligibility.
+        """
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    await ProgramRepositoryImpl(session).load_eligibility_index(
+                        self._program_eligibility_index
+                    )
+        except Exception:
+            # Индекс старого каталога хуже таблицы, которую обновляет загрузчик
+            self._program_eligibility_index.clear()
+            logger.exception(
+                "Индекс программ не построен, подбор программ идёт "
+                "по таблице program_eligibility"
+            )
 
     @asynccontextmanager
     async def create_user(self) -> AsyncIterator[CreateUser]:
@@ -123,8 +212,10 @@ class IoC(InteractorFactory):
     async def recognize_exam(self) -> AsyncIterator[RecognizeExamUseCase]:
         async with self._session_factory() as session:
             async with session.begin():
-                repo = DbSubjectRepository(session)
-                yield RecognizeExamUseCase(repo, self._exam_recognize_factory)
+                repo = DbSubjectRepository(session, self._subject_eligibility_index)
+                yield RecognizeExamUseCase(
+                    repo, self._exam_recognize_factory, self._exam_recognizer_registry
+                )
 
     @asynccontextmanager
     async def get_categories(self) -> AsyncIterator[GetCategoriesUseCase]:
@@ -183,9 +274,14 @@ class IoC(InteractorFactory):
     async def get_filtered_programs(self) -> AsyncIterator[GetFilterdProgramsUseCase]:
         async with self._session_factory() as session:
             async with session.begin():
-                repo = ProgramRepositoryImpl(session)
+                if self._program_eligibility_index.loaded:
+                    repo = ProgramRepositoryImpl(
+                        session, self._program_eligibility_index
+                    )
+                else:
+                    repo = ProgramRepositoryImpl(session, use_eligibility_table=True)
 
-                yield GetFilterdProgramsUseCase(repo)
+                yield GetFilterdProgramsUseCase(repo, self._program_filter_cache)
 
     @asynccontextmanager
     async def send_telegram_notification(
@@ -242,14 +338,8 @@ class IoC(InteractorFactory):
         async with self._session_factory() as session:
             async with session.begin():
                 subscription_repo = NotificationSubscriptionRepositoryImpl(session)
-                program_repo = ProgramRepositoryImpl(session)
-                timeline_type_repo = TimelineTypeRepositoryImpl(session)
 
-                yield GetListSubscriptionsUseCase(
-                    subscription_repo=subscription_repo,
-                    program_repo=program_repo,
-                    timeline_type_repo=timeline_type_repo,
-                )
+                yield GetListSubscriptionsUseCase(subscription_repo=subscription_repo)
 
     @asynccontextmanager
     async def unsubscribe_from_program(
@@ -262,7 +352,8 @@ class IoC(InteractorFactory):
                 )
 
                 yield UnsubscribeFromProgramUseCase(
-                    scheduling_service=scheduling_service
+                    scheduling_service=scheduling_service,
+                    notification_cache=self._scheduled_notification_cache,
                 )
 
     @asynccontextmanager
@@ -272,13 +363,10 @@ class IoC(InteractorFactory):
         async with self._session_factory() as session:
             async with session.begin():
                 notification_repo = ScheduledNotificationRepositoryImpl(session)
-                event_repo = TimelineEventRepositoryImpl(session)
-                name_repo = TimelineEventNameRepositoryImpl(session)
 
                 yield GetScheduledNotificationsBySubscriptionUseCase(
                     notification_repo=notification_repo,
-                    event_repo=event_repo,
-                    name_repo=name_repo,
+                    cache=self._scheduled_notification_cache,
                 )
 
     @asynccontextmanager
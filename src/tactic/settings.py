@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -7,6 +8,8 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class ExamServiceSettings(BaseSettings):
     exam_json_path: Path = Path("")
     threshold: int = 70
+    recognizer_cache_size: int = 256
+    recognizer_cache_ttl: int = 600
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="allow"
@@ -16,6 +19,52 @@ class ExamServiceSettings(BaseSettings):
 exam_service_settings = ExamServiceSettings()
 
 
+class ProgramServiceSettings(BaseSettings):
+    threshold: int = 70
+    # Как часто сверять версию каталога программ с БД, секунды
+    reload_interval: int = 60
+    # Канал Redis, сообщение в который запускает немедленную перезагрузку
+    reload_channel: str = "program_catalog_updated"
+    # Кеш результатов подбора программ по фильтрам
+    filter_cache_size: int = 1024
+    filter_cache_ttl: int = 3600
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="program_", extra="ignore"
+    )
+
+
+program_service_settings = ProgramServiceSettings()
+
+
+class RecognizerSettings(BaseSettings):
+    # Где считать нечёткий поиск: none — в event loop, thread или process
+    executor: Literal["none", "thread", "process"] = "thread"
+    workers: int = 4
+    # Сколько последних результатов распознавания держать в LRU
+    cache_size: int = 1024
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="recognizer_", extra="ignore"
+    )
+
+
+recognizer_settings = RecognizerSettings()
+
+
+class NotificationSettings(BaseSettings):
+    # Кеш списка уведомлений подписки, короткий: даты могут поменять в БД
+    view_cache_size: int = 1024
+    view_cache_ttl: int = 60
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="notification_", extra="ignore"
+    )
+
+
+notification_settings = NotificationSettings()
+
+
 class VectorDbServiceSettings(BaseSettings):
     vector_db_service_container_name: str = Field(default="vector_db_service")
     vector_db_service_port: int = Field(default=8000)
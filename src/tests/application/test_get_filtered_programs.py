@@ -0,0 +1,61 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tactic.application.common.repositories import ProgramRepository
+from tactic.application.use_cases.get_filtered_programs import (
+    GetFilterdProgramsUseCase,
+)
+from tactic.infrastructure.program_filter_cache import TTLProgramFilterCache
+
+
+@pytest.fixture
+def program_repo() -> AsyncMock:
+    repo = AsyncMock(spec=ProgramRepository)
+    repo.filter.return_value = [3, 1, 2]
+    return repo
+
+
+@pytest.fixture
+def cache() -> TTLProgramFilterCache:
+    return TTLProgramFilterCache()
+
+
+@pytest.fixture
+def usecase(program_repo, cache) -> GetFilterdProgramsUseCase:
+    return GetFilterdProgramsUseCase(program_repo, cache)
+
+
+@pytest.mark.asyncio
+async def test_same_filters_in_any_order_hit_cache(usecase, program_repo):
+    first = await usecase(education_level_ids=[1], exam_subject_ids=[5, 2, 5])
+    second = await usecase(education_level_ids=[1], exam_subject_ids=[2, 5])
+
+    assert first == second == [3, 1, 2]
+    program_repo.filter.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_different_filters_query_repository(usecase, program_repo):
+    await usecase(exam_subject_ids=[1])
+    await usecase(exam_subject_ids=[1, 2])
+
+    assert program_repo.filter.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_after_catalog_change(usecase, program_repo, cache):
+    await usecase(study_form_ids=[1])
+    cache.invalidate()
+    program_repo.filter.return_value = [4]
+
+    assert await usecase(study_form_ids=[1]) == [4]
+
+
+@pytest.mark.asyncio
+async def test_empty_result_is_cached(usecase, program_repo):
+    program_repo.filter.return_value = []
+
+    assert await usecase(exam_subject_ids=[99]) == []
+    assert await usecase(exam_subject_ids=[99]) == []
+    program_repo.filter.assert_awaited_once()
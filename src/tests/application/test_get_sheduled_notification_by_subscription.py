@@ -1,25 +1,25 @@
 from datetime import date, datetime, timedelta
-from typing import Annotated, List
+from typing import Annotated
 from unittest.mock import AsyncMock
 
 import pytest
 
-from shared.models import ScheduledNotification, TimelineEvent, TimelineEventName
-from tactic.application.common.repositories import (
-    ScheduledNotificationRepository,
-    TimelineEventNameRepository,
-    TimelineEventRepository,
-)
+from tactic.application.common.repositories import ScheduledNotificationRepository
 from tactic.application.use_cases.get_sheduled_notification_by_subscription import (
     GetScheduledNotificationsBySubscriptionUseCase,
 )
-from tactic.domain.entities.sheduled_notification import ScheduledNotificationDomain
-from tactic.domain.entities.timeline_event import TimelineEventDomain
-from tactic.domain.entities.timeline_event_name import TimelineEventNameDomain
+from tactic.application.use_cases.unsubscrib_from_program import (
+    UnsubscribeFromProgramUseCase,
+)
+from tactic.application.services.notification_sheduling_service import (
+    NotificationSchedulingService,
+)
+from tactic.domain.entities.sheduled_notification import ScheduledNotificationDTO
+from tactic.infrastructure.scheduled_notification_cache import (
+    TTLScheduledNotificationCache,
+)
 
 NotificationRepo = Annotated[ScheduledNotificationRepository, AsyncMock]
-EventRepo = Annotated[TimelineEventRepository, AsyncMock]
-NameRepo = Annotated[TimelineEventNameRepository, AsyncMock]
 
 
 @pytest.fixture
@@ -27,112 +27,60 @@ def notification_repo() -> NotificationRepo:
     return AsyncMock(spec=ScheduledNotificationRepository)
 
 
-@pytest.fixture
-def event_repo() -> EventRepo:
-    return AsyncMock(spec=TimelineEventRepository)
-
-
-@pytest.fixture
-def name_repo() -> NameRepo:
-    return AsyncMock(spec=TimelineEventNameRepository)
-
-
 @pytest.fixture
 def usecase(
     notification_repo: NotificationRepo,
-    event_repo: EventRepo,
-    name_repo: NameRepo,
 ) -> GetScheduledNotificationsBySubscriptionUseCase:
-    return GetScheduledNotificationsBySubscriptionUseCase(
-        notification_repo, event_repo, name_repo
+    return GetScheduledNotificationsBySubscriptionUseCase(notification_repo)
+
+
+def make_dto() -> ScheduledNotificationDTO:
+    return ScheduledNotificationDTO(
+        id=1,
+        event_name="Подача документов",
+        send_at=datetime.today() + timedelta(days=1),
+        deadline=date.today() + timedelta(days=2),
     )
 
 
 @pytest.mark.asyncio
 async def test_returns_empty_list_if_no_notifications(usecase, notification_repo):
-    notification_repo.filter.return_value = []
+    notification_repo.get_notifications_by_subscription_id.return_value = []
 
     result = await usecase(subscription_id=1)
 
     assert result == []
-    notification_repo.filter.assert_awaited_once_with(1)
+    notification_repo.get_notifications_by_subscription_id.assert_awaited_once_with(1)
 
 
 @pytest.mark.asyncio
-async def test_returns_dto_for_single_notification(
-    usecase, notification_repo, event_repo, name_repo
-):
-    # Setup test data
-    notification = ScheduledNotificationDomain(
-        id=1,
-        subscription_id=1,
-        event_id=10,
-        send_at=datetime.today()+ timedelta(days=1),
-    )
-    event = TimelineEventDomain(
-        id=10,
-        name_id=100,
-        binding_id=-1,
-        deadline=date.today() + timedelta(days=2),
-    )
-    name = TimelineEventNameDomain(id=100, name="Подача документов")
-
-    # Setup mocks
-    notification_repo.filter.return_value = [notification]
-    event_repo.get_many.return_value = [event]
-    name_repo.get_many.return_value = [name]
+async def test_returns_dto_from_single_query(usecase, notification_repo):
+    dto = make_dto()
+    notification_repo.get_notifications_by_subscription_id.return_value = [dto]
 
-    # Run usecase
     result = await usecase(subscription_id=1)
 
-    # Assertions
-    assert len(result) == 1
-    dto = result[0]
-    assert dto.id == notification.id
-    assert dto.event_name == name.name
-    assert dto.send_at == notification.send_at
+    assert result == [dto]
+    notification_repo.filter.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_skips_notification_with_missing_event(
-    usecase, notification_repo, event_repo, name_repo
-):
-    notification = ScheduledNotificationDomain(
-        id=1,
-        subscription_id=1,
-        event_id=999,  # ID, которого не будет в events
-        send_at=datetime.now(),
-    )
-    notification_repo.filter.return_value = [notification]
-    event_repo.get_many.return_value = []  # simulate missing event
-    name_repo.get_many.return_value = []
-
-    result = await usecase(subscription_id=1)
+async def test_cached_until_unsubscribe(notification_repo):
+    cache = TTLScheduledNotificationCache()
+    usecase = GetScheduledNotificationsBySubscriptionUseCase(notification_repo, cache)
+    notification_repo.get_notifications_by_subscription_id.return_value = [make_dto()]
 
-    assert result == []
+    first = await usecase(subscription_id=1)
+    second = await usecase(subscription_id=1)
 
+    assert first == second
+    notification_repo.get_notifications_by_subscription_id.assert_awaited_once_with(1)
 
-@pytest.mark.asyncio
-async def test_uses_fallback_for_missing_event_name(
-    usecase, notification_repo, event_repo, name_repo
-):
-    notification = ScheduledNotificationDomain(
-        id=1,
-        subscription_id=1,
-        event_id=10,
-        send_at=datetime.today(),
+    unsubscribe = UnsubscribeFromProgramUseCase(
+        AsyncMock(spec=NotificationSchedulingService), cache
     )
-    event = TimelineEventDomain(
-        id=10,
-        name_id=999,  # name_id не будет в name_map
-        binding_id=-1,
-        deadline=date.today(),
-    )
-    notification_repo.filter.return_value = [notification]
-    event_repo.get_many.return_value = [event]
-    name_repo.get_many.return_value = []
-
-    result = await usecase(subscription_id=1)
+    await unsubscribe(subscription_id=1, chat_id=10)
+    notification_repo.get_notifications_by_subscription_id.return_value = []
 
-    assert len(result) == 1
-    assert result[0].event_name == "Неизвестное событие"
+    assert await usecase(subscription_id=1) == []
+    assert notification_repo.get_notifications_by_subscription_id.await_count == 2
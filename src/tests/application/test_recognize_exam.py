@@ -0,0 +1,73 @@
+from typing import Annotated
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tactic.application.common.fabrics import RecognizeExamFactory
+from tactic.application.common.repositories import SubjectRepository
+from tactic.application.services.recognize_exam import RecognizeExam
+from tactic.application.use_cases.recognize_exam import RecognizeExamUseCase
+from tactic.infrastructure.recognize_exam_registry import TTLRecognizeExamRegistry
+
+SubjectRepo = Annotated[SubjectRepository, AsyncMock]
+Factory = Annotated[RecognizeExamFactory, AsyncMock]
+
+
+@pytest.fixture
+def subj_repo() -> SubjectRepo:
+    repo = AsyncMock(spec=SubjectRepository)
+    repo.filter.return_value = []
+    return repo
+
+
+@pytest.fixture
+def recognizer_factory() -> Factory:
+    factory = AsyncMock(spec=RecognizeExamFactory)
+    recognizer = AsyncMock(spec=RecognizeExam)
+    recognizer.recognize.return_value = []
+    factory.create.return_value = recognizer
+    return factory
+
+
+@pytest.fixture
+def usecase(subj_repo, recognizer_factory) -> RecognizeExamUseCase:
+    return RecognizeExamUseCase(
+        subj_repo, recognizer_factory, TTLRecognizeExamRegistry()
+    )
+
+
+@pytest.mark.asyncio
+async def test_recognizer_reused_for_same_filters(
+    usecase, subj_repo, recognizer_factory
+):
+    await usecase("матем", contest_type_ids=[2, 1], education_level_ids=[1])
+    await usecase("русский", contest_type_ids=[1, 2], education_level_ids=[1])
+
+    subj_repo.filter.assert_awaited_once()
+    recognizer_factory.create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_none_and_empty_filters_share_recognizer(usecase, subj_repo):
+    await usecase("матем", study_form_ids=None)
+    await usecase("матем", study_form_ids=[])
+
+    subj_repo.filter.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_different_filters_build_new_recognizer(usecase, subj_repo):
+    await usecase("матем", contest_type_ids=[1])
+    await usecase("матем", contest_type_ids=[2])
+    await usecase("матем", contest_type_ids=[1], threshold=90)
+
+    assert subj_repo.filter.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_rebuild(usecase, subj_repo):
+    await usecase("матем")
+    usecase.recognizer_registry.invalidate()
+    await usecase("матем")
+
+    assert subj_repo.filter.await_count == 2
@@ -4,6 +4,7 @@ from sqlalchemy.pool import NullPool
 
 from shared.models import Base
 from tests.settings import settings
+from tests.sql_capture import capture_sql as _capture_sql
 
 DATABASE_URL = settings.get_connection_url()
 
@@ -50,3 +51,9 @@ async def session_with_drop_after():
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+
+
+@pytest.fixture
+def capture_sql():
+    """async with capture_sql(session) as sql: — запросы, выполненные в блоке."""
+    return _capture_sql
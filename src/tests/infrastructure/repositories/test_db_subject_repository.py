@@ -0,0 +1,134 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.models import (
+    ContestType,
+    EducationLevel,
+    Program,
+    ProgramContestExam,
+    StudyDuration,
+    StudyForm,
+    Subject,
+    SubjectAlias,
+)
+from tactic.infrastructure.repositories.db_subject_repository import DbSubjectRepository
+from tactic.infrastructure.repositories.subject_eligibility_index import (
+    SubjectEligibilityIndex,
+)
+
+
+@pytest.fixture
+async def seeded_db(db_session: AsyncSession):
+    level1 = EducationLevel(name="Бакалавриат")
+    level2 = EducationLevel(name="Магистратура")
+    form1 = StudyForm(name="Очная")
+    form2 = StudyForm(name="Заочная")
+    duration = StudyDuration(years="4 года")
+    ctype1 = ContestType(name="ЕГЭ")
+    ctype2 = ContestType(name="ВИ")
+
+    math = Subject(name="Математика", popularity=10)
+    rus = Subject(name="Русский язык", popularity=5)
+    phys = Subject(name="Физика", popularity=1)
+    unused = Subject(name="Латынь", popularity=0)
+
+    db_session.add_all(
+        [level1, level2, form1, form2, duration, ctype1, ctype2]
+        + [math, rus, phys, unused]
+    )
+    await db_session.flush()
+
+    db_session.add(SubjectAlias(alias="матеша", subject=math))
+
+    prog1 = Program(
+        title="Программа 1",
+        url="http://1.ru",
+        education_level=level1,
+        study_form=form1,
+        study_duration=duration,
+    )
+    prog2 = Program(
+        title="Программа 2",
+        url="http://2.ru",
+        education_level=level2,
+        study_form=form2,
+        study_duration=duration,
+    )
+    db_session.add_all([prog1, prog2])
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            ProgramContestExam(program=prog1, contest_type=ctype1, subject=math),
+            ProgramContestExam(
+                program=prog1, contest_type=ctype1, subject=rus, is_optional=True
+            ),
+            ProgramContestExam(program=prog2, contest_type=ctype2, subject=phys),
+        ]
+    )
+    await db_session.flush()
+
+    return db_session, {
+        "level1": level1,
+        "level2": level2,
+        "form1": form1,
+        "form2": form2,
+        "ctype1": ctype1,
+        "ctype2": ctype2,
+        "math": math,
+        "rus": rus,
+        "phys": phys,
+    }
+
+
+@pytest.fixture
+async def indexed_repo(seeded_db):
+    session, data = seeded_db
+    index = SubjectEligibilityIndex()
+    await DbSubjectRepository(session).load_eligibility_index(index)
+    return DbSubjectRepository(session, index), DbSubjectRepository(session), data
+
+
+def ids(subjects):
+    return {s.id for s in subjects}
+
+
+@pytest.mark.asyncio
+async def test_index_matches_sql_filter(indexed_repo):
+    indexed, plain, data = indexed_repo
+
+    filters = [
+        {},
+        {"contest_type_ids": [data["ctype1"].id]},
+        {"education_level_ids": [data["level2"].id]},
+        {"study_form_ids": [data["form1"].id, data["form2"].id]},
+        {
+            "contest_type_ids": [data["ctype2"].id],
+            "education_level_ids": [data["level2"].id],
+            "study_form_ids": [data["form2"].id],
+        },
+        {"education_level_ids": [999]},
+    ]
+    for kwargs in filters:
+        assert ids(await indexed.filter(**kwargs)) == ids(await plain.filter(**kwargs))
+
+
+@pytest.mark.asyncio
+async def test_conditions_apply_to_same_exam_row(indexed_repo):
+    indexed, _, data = indexed_repo
+
+    # ctype1 есть только у программы уровня level1, ctype2 — только у level2
+    result = await indexed.filter(
+        contest_type_ids=[data["ctype1"].id],
+        education_level_ids=[data["level2"].id],
+    )
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_index_keeps_aliases(indexed_repo):
+    indexed, _, data = indexed_repo
+
+    result = await indexed.filter(contest_type_ids=[data["ctype1"].id])
+    math = next(s for s in result if s.id == data["math"].id)
+    assert [a.alias for a in math.aliases] == ["матеша"]
@@ -0,0 +1,295 @@
+import json
+import random
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, List
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.models import (
+    ContestType,
+    EducationLevel,
+    NotificationSubscription,
+    Program,
+    ProgramContestExam,
+    ProgramTimelineBinding,
+    ScheduledNotification,
+    StudyDuration,
+    StudyForm,
+    Subject,
+    TimelineEvent,
+    TimelineEventName,
+    TimelineType,
+    User,
+)
+from tactic.infrastructure.repositories.db_subject_repository import DbSubjectRepository
+from tactic.infrastructure.repositories.notification_subscription_repository import (
+    NotificationSubscriptionRepositoryImpl,
+)
+from tactic.infrastructure.repositories.program_repository import ProgramRepositoryImpl
+from tactic.infrastructure.repositories.sheduled_notification_repository import (
+    ScheduledNotificationRepositoryImpl,
+)
+from tactic.infrastructure.repositories.timeline_event_repository import (
+    TimelineEventRepositoryImpl,
+)
+from tests.sql_capture import capture_sql
+
+
+LEVELS = 4
+FORMS = 3
+CONTEST_TYPES = 6
+SUBJECTS = 150
+TIMELINE_TYPES = 3
+PROGRAMS = 2000
+USERS = 500
+
+
+async def insert_ids(session: AsyncSession, model, rows: List[dict]) -> List[int]:
+    result = await session.execute(
+        insert(model).returning(model.id, sort_by_parameter_order=True), rows
+    )
+    return list(result.scalars().all())
+
+
+@pytest.fixture
+async def seeded_db(db_session: AsyncSession):
+    """
+    Каталог порядка реального x10 и ANALYZE: планировщик выбирает индекс
+    по настоящей статистике, а не потому, что таблицы крошечные.
+    """
+    session = db_session
+    rng = random.Random(15)
+
+    levels = await insert_ids(
+        session, EducationLevel, [{"name": f"Уровень {i}"} for i in range(LEVELS)]
+    )
+    forms = await insert_ids(
+        session, StudyForm, [{"name": f"Форма {i}"} for i in range(FORMS)]
+    )
+    ctypes = await insert_ids(
+        session, ContestType, [{"name": f"Конкурс {i}"} for i in range(CONTEST_TYPES)]
+    )
+    subjects = await insert_ids(
+        session,
+        Subject,
+        [{"name": f"Предмет {i}", "popularity": i} for i in range(SUBJECTS)],
+    )
+    types = await insert_ids(
+        session, TimelineType, [{"name": f"Тип {i}"} for i in range(TIMELINE_TYPES)]
+    )
+    [duration] = await insert_ids(session, StudyDuration, [{"years": "4 года"}])
+    [event_name] = await insert_ids(
+        session, TimelineEventName, [{"name": "Приём документов"}]
+    )
+
+    programs = await insert_ids(
+        session,
+        Program,
+        [
+            {
+                "title": f"Программа {i}",
+                "url": "http://example.ru",
+                "education_level_id": rng.choice(levels),
+                "study_form_id": rng.choice(forms),
+                "study_duration_id": duration,
+            }
+            for i in range(PROGRAMS)
+        ],
+    )
+    exams = []
+    for program_id in programs:
+        for contest_type_id in rng.sample(ctypes, rng.randint(1, 2)):
+            for i, subject_id in enumerate(rng.sample(subjects, rng.randint(3, 5))):
+                exams.append(
+                    {
+                        "program_id": program_id,
+                        "contest_type_id": contest_type_id,
+                        "subject_id": subject_id,
+                        "is_optional": i >= 2,
+                    }
+                )
+    await session.execute(insert(ProgramContestExam), exams)
+
+    bindings = await insert_ids(
+        session,
+        ProgramTimelineBinding,
+        [
+            {"education_level_id": level, "study_form_id": form, "type_id": type_id}
+            for level in levels
+            for form in forms
+            for type_id in types
+        ],
+    )
+    events = await insert_ids(
+        session,
+        TimelineEvent,
+        [
+            {
+                "binding_id": binding_id,
+                "name_id": event_name,
+                "deadline": date(2030, 6, 20) + timedelta(days=day),
+            }
+            for binding_id in bindings
+            for day in range(50)
+        ],
+    )
+
+    await session.execute(
+        insert(User), [{"user_id": user_id} for user_id in range(1, USERS + 1)]
+    )
+    subscriptions = await insert_ids(
+        session,
+        NotificationSubscription,
+        [
+            {"user_id": user_id, "program_id": program_id, "timeline_type_id": type_id}
+            for user_id in range(1, USERS + 1)
+            for program_id, type_id in zip(rng.sample(programs, 3), types)
+        ],
+    )
+    send_at = datetime.now() + timedelta(days=30)
+    await session.execute(
+        insert(ScheduledNotification),
+        [
+            {"subscription_id": subscription_id, "event_id": event_id, "send_at": send_at}
+            for subscription_id in subscriptions
+            for event_id in rng.sample(events, 5)
+        ],
+    )
+
+    conn = await session.connection()
+    await conn.execute(
+        text(
+            "ANALYZE program, program_contest_exam, program_timeline_binding,"
+            " timeline_event, notification_subscription, scheduled_notification"
+        )
+    )
+
+    return session, {
+        "level": levels[0],
+        "form": forms[0],
+        "ctype": ctypes[0],
+        "subjects": subjects[:20],
+        "program": programs[0],
+        "type": types[0],
+        "user": 1,
+        "subscription": subscriptions[0],
+    }
+
+
+async def plans_for(
+    session: AsyncSession, call: Callable[[], Awaitable[Any]]
+) -> List[str]:
+    """Планы запросов, которые выполняет call, с настройками по умолчанию."""
+    async with capture_sql(session) as sql:
+        await call()
+
+    conn = await session.connection()
+    plans = []
+    for statement, parameters in zip(sql.statements, sql.parameters):
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        raw = result.scalar_one()
+        plans.append(raw if isinstance(raw, str) else json.dumps(raw))
+    return plans
+
+
+def uses_index(plans: List[str], index_name: str) -> bool:
+    return any(f'"Index Name": "{index_name}"' in plan for plan in plans)
+
+
+@pytest.mark.asyncio
+async def test_program_filter_by_level_and_form(seeded_db):
+    session, data = seeded_db
+    repo = ProgramRepositoryImpl(session)
+
+    plans = await plans_for(
+        session,
+        lambda: repo.filter(
+            education_level_ids=[data["level"]], study_form_ids=[data["form"]]
+        ),
+    )
+    assert uses_index(plans, "idx_program_level_form")
+
+
+@pytest.mark.asyncio
+async def test_program_filter_by_exams(seeded_db):
+    session, data = seeded_db
+    repo = ProgramRepositoryImpl(session)
+
+    plans = await plans_for(
+        session, lambda: repo.filter(exam_subject_ids=data["subjects"])
+    )
+    assert uses_index(plans, "idx_pce_program_contest")
+
+
+@pytest.mark.asyncio
+async def test_subject_filter_by_contest_type(seeded_db):
+    session, data = seeded_db
+    repo = DbSubjectRepository(session)
+
+    plans = await plans_for(
+        session, lambda: repo.filter(contest_type_ids=[data["ctype"]])
+    )
+    assert uses_index(plans, "idx_pce_contest_type")
+
+
+@pytest.mark.asyncio
+async def test_subscription_filter_by_user(seeded_db):
+    session, data = seeded_db
+    repo = NotificationSubscriptionRepositoryImpl(session)
+
+    plans = await plans_for(session, lambda: repo.filter(user_id=data["user"]))
+    assert uses_index(plans, "idx_subscription_user_program_type")
+
+
+@pytest.mark.asyncio
+async def test_scheduled_notification_filter_by_subscription(seeded_db):
+    session, data = seeded_db
+    repo = ScheduledNotificationRepositoryImpl(session)
+
+    plans = await plans_for(
+        session,
+        lambda: repo.filter(notification_subscription_id=data["subscription"]),
+    )
+    assert uses_index(plans, "idx_scheduled_notification_subscription")
+
+
+@pytest.mark.asyncio
+async def test_timeline_event_filter(seeded_db):
+    session, data = seeded_db
+    repo = TimelineEventRepositoryImpl(session)
+
+    plans = await plans_for(
+        session,
+        lambda: repo.filter(program_id=data["program"], timeline_type_id=data["type"]),
+    )
+    # program_timeline_binding — несколько десятков строк, её индекс
+    # планировщику не нужен, поэтому проверяется только его наличие
+    assert uses_index(plans, "idx_timeline_event_binding_deadline")
+
+
+FILTER_INDEXES = [
+    "idx_pce_contest_type",
+    "idx_pce_program_contest",
+    "idx_pce_subject",
+    "idx_program_level_form",
+    "idx_program_study_form",
+    "idx_ptb_level_form_type",
+    "idx_scheduled_notification_subscription",
+    "idx_subscription_program_type",
+    "idx_subscription_user_program_type",
+    "idx_timeline_event_binding_deadline",
+]
+
+
+@pytest.mark.asyncio
+async def test_filter_indexes_exist(db_session: AsyncSession):
+    result = await db_session.execute(
+        text("SELECT indexname FROM pg_indexes WHERE indexname = ANY(:names)"),
+        {"names": FILTER_INDEXES},
+    )
+
+    assert sorted(result.scalars().all()) == FILTER_INDEXES
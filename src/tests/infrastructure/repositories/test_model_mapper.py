@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from shared.models import Program, ScheduledNotification
+from tactic.domain.entities.program import CreateProgramDomain, ProgramDomain
+from tactic.domain.entities.sheduled_notification import (
+    CreateScheduledNotificationDomain,
+    ScheduledNotificationDomain,
+)
+from tactic.infrastructure.repositories.model_mapper import ModelMapper, model_mapper
+
+
+def program_mapper() -> ModelMapper:
+    return model_mapper(ProgramDomain, Program, CreateProgramDomain)
+
+
+def test_mapper_is_shared_between_repositories():
+    assert program_mapper() is program_mapper()
+
+
+def test_from_row_equals_validated_model():
+    mapper = model_mapper(
+        ScheduledNotificationDomain,
+        ScheduledNotification,
+        CreateScheduledNotificationDomain,
+    )
+    send_at = datetime(2030, 6, 19, 12)
+
+    domain = mapper.from_row((1, 2, 3, send_at))
+
+    expected = ScheduledNotificationDomain(
+        id=1, subscription_id=2, event_id=3, send_at=send_at
+    )
+    assert domain == expected
+    assert domain.model_dump() == expected.model_dump()
+    assert domain.model_fields_set == expected.model_fields_set
+
+
+def test_from_orm_and_back():
+    mapper = program_mapper()
+    orm = Program(
+        id=7,
+        title="Программа",
+        url="http://example.ru",
+        education_level_id=1,
+        study_form_id=2,
+        study_duration_id=3,
+        program_info=None,
+        career_info="Кем работать",
+    )
+
+    domain = mapper.from_orm(orm)
+
+    assert domain == ProgramDomain.model_validate(orm, from_attributes=True)
+    assert mapper.to_orm(domain).career_info == "Кем работать"
+
+
+def test_from_orm_without_loaded_column_validates():
+    orm = Program(id=1, title="Программа", url="http://example.ru")
+
+    with pytest.raises(ValidationError):
+        program_mapper().from_orm(orm)
+
+
+def test_domain_with_extra_fields_is_validated():
+    class ProgramCard(BaseModel):
+        id: int
+        title: str
+        rating: float = 0.0
+
+    mapper = ModelMapper(ProgramCard, Program, CreateProgramDomain)
+
+    assert not mapper.trusted
+    assert mapper.from_row((1, "Программа")) == ProgramCard(id=1, title="Программа")
@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.models import (
+    EducationLevel,
+    NotificationSubscription,
+    Program,
+    StudyDuration,
+    StudyForm,
+    TimelineType,
+    User,
+)
+from tactic.domain.entities.timeline_type import PaymentType
+from tactic.infrastructure.repositories.notification_subscription_repository import (
+    NotificationSubscriptionRepositoryImpl,
+)
+
+
+@pytest.fixture
+async def seeded_db(db_session: AsyncSession):
+    level = EducationLevel(name="Бакалавриат")
+    form = StudyForm(name="Очная")
+    duration = StudyDuration(years="4 года")
+    paid = TimelineType(id=PaymentType.PAID.value, name="Платное")
+    budget = TimelineType(id=PaymentType.BUDGET.value, name="Бюджетное")
+    program = Program(
+        title="Прикладная информатика",
+        url="http://example.ru",
+        program_info="описание " * 1000,
+        education_level=level,
+        study_form=form,
+        study_duration=duration,
+    )
+    db_session.add_all(
+        [level, form, duration, paid, budget, program, User(user_id=1), User(user_id=2)]
+    )
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            NotificationSubscription(
+                user_id=1, program_id=program.id, timeline_type_id=budget.id
+            ),
+            NotificationSubscription(
+                user_id=1, program_id=program.id, timeline_type_id=paid.id
+            ),
+            NotificationSubscription(
+                user_id=2, program_id=program.id, timeline_type_id=paid.id
+            ),
+        ]
+    )
+    await db_session.flush()
+    return db_session
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_in_one_projected_query(seeded_db, capture_sql):
+    session = seeded_db
+    repo = NotificationSubscriptionRepositoryImpl(session)
+
+    async with capture_sql(session) as sql:
+        result = await repo.get_subscriptions_by_user_id(1)
+
+    assert [(s.program_title, s.timeline_type_name) for s in result] == [
+        ("Прикладная информатика", "Бюджет"),
+        ("Прикладная информатика", "Платно"),
+    ]
+    [statement] = sql.statements
+    assert "program_info" not in statement
+    assert "timeline_type" not in statement.split("FROM", 1)[1]
+
+
+@pytest.mark.asyncio
+async def test_no_subscriptions(seeded_db):
+    repo = NotificationSubscriptionRepositoryImpl(seeded_db)
+
+    assert await repo.get_subscriptions_by_user_id(999) == []
@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.models import (
@@ -9,6 +10,11 @@ from shared.models import (
     StudyDuration,
     StudyForm,
     Subject,
+    SubjectAlias,
+)
+from tactic.domain.entities.program import ProgramDTO
+from tactic.infrastructure.repositories.program_eligibility_index import (
+    ProgramEligibilityIndex,
 )
 from tactic.infrastructure.repositories.program_repository import ProgramRepositoryImpl
 
@@ -36,6 +42,8 @@ async def seeded_db(db_session: AsyncSession):
     prog1 = Program(
         title="Программа 1",
         url="http://1.ru",
+        program_info="О программе",
+        career_info="Кем работать",
         education_level=level1,
         study_form=form1,
         study_duration=duration,
@@ -239,3 +247,116 @@ async def test_program_without_any_exams(seeded_db):
 
     result = await repo.filter(exam_subject_ids=[data["subj1"].id])
     assert prog3.id not in result
+
+
+@pytest.mark.asyncio
+async def test_index_matches_sql_filter(seeded_db):
+    session, data = seeded_db
+    index = ProgramEligibilityIndex()
+    await ProgramRepositoryImpl(session).load_eligibility_index(index)
+    indexed = ProgramRepositoryImpl(session, index)
+    plain = ProgramRepositoryImpl(session)
+
+    subj1, subj2 = data["subj1"].id, data["subj2"].id
+    filters = [
+        {},
+        {"education_level_ids": [data["level1"].id]},
+        {"study_form_ids": [data["form2"].id]},
+        {"contest_type_ids": [data["ctype"].id]},
+        {"exam_subject_ids": [subj1]},
+        {"exam_subject_ids": [subj2]},
+        {"exam_subject_ids": [subj1, subj2]},
+        {"exam_subject_ids": [subj1, subj2], "contest_type_ids": [data["ctype"].id]},
+        {"exam_subject_ids": [subj1, subj2], "education_level_ids": [data["level2"].id]},
+        {"exam_subject_ids": [999]},
+    ]
+    for kwargs in filters:
+        assert set(await indexed.filter(**kwargs)) == set(await plain.filter(**kwargs))
+
+
+def test_index_masks_span_several_words():
+    # 100 предметов не помещаются в одно слово uint64
+    index = ProgramEligibilityIndex()
+    index.build(
+        programs=[(1, 1, 1), (2, 1, 1)],
+        exams=[(1, 1, subject, False) for subject in range(100)]
+        + [(2, 1, 99, False), (2, 1, 5, True), (2, 1, 70, True)],
+    )
+
+    assert index.filter(exam_subject_ids=list(range(100))) == [1, 2]
+    assert index.filter(exam_subject_ids=[99, 70]) == [2]
+    assert index.filter(exam_subject_ids=[99]) == []
+
+
+@pytest.mark.asyncio
+async def test_eligibility_table_matches_sql_filter(seeded_db):
+    session, data = seeded_db
+    plain = ProgramRepositoryImpl(session)
+    await plain.refresh_eligibility()
+    materialized = ProgramRepositoryImpl(session, use_eligibility_table=True)
+
+    subj1, subj2 = data["subj1"].id, data["subj2"].id
+    filters = [
+        {"contest_type_ids": [data["ctype"].id]},
+        {"exam_subject_ids": [subj1]},
+        {"exam_subject_ids": [subj2]},
+        {"exam_subject_ids": [subj1, subj2]},
+        {"exam_subject_ids": [subj1, subj2], "study_form_ids": [data["form1"].id]},
+        {"exam_subject_ids": [999]},
+    ]
+    for kwargs in filters:
+        assert set(await materialized.filter(**kwargs)) == set(
+            await plain.filter(**kwargs)
+        )
+
+
+@pytest.mark.asyncio
+async def test_program_texts_are_deferred(seeded_db, capture_sql):
+    session, data = seeded_db
+    session.expunge_all()
+
+    async with capture_sql(session) as sql:
+        await session.execute(select(Program))
+        titles = await ProgramRepositoryImpl(session).get_projection(
+            ProgramDTO, [data["prog1"].id]
+        )
+
+    assert titles == [ProgramDTO(id=data["prog1"].id, title="Программа 1")]
+    assert sql.statements
+    assert all("program_info" not in s for s in sql.statements)
+
+
+@pytest.mark.asyncio
+async def test_domain_reads_load_deferred_texts(seeded_db):
+    session, data = seeded_db
+    session.expunge_all()
+    repo = ProgramRepositoryImpl(session)
+
+    # Объект уже в identity map, но без отложенных колонок
+    await session.execute(select(Program))
+
+    program = await repo.get(data["prog1"].id)
+    [many] = await repo.get_many([data["prog1"].id])
+
+    assert program is not None
+    assert program.program_info == many.program_info == "О программе"
+    assert program.career_info == "Кем работать"
+
+
+@pytest.mark.asyncio
+async def test_projection_of_empty_ids(seeded_db):
+    session, _ = seeded_db
+
+    assert await ProgramRepositoryImpl(session).get_projection(ProgramDTO, []) == []
+
+
+@pytest.mark.asyncio
+async def test_catalog_version_tracks_subject_aliases(seeded_db):
+    session, data = seeded_db
+    repo = ProgramRepositoryImpl(session)
+    before = await repo.get_catalog_version()
+
+    session.add(SubjectAlias(subject_id=data["subj1"].id, alias="матан"))
+    await session.flush()
+
+    assert await repo.get_catalog_version() != before
@@ -0,0 +1,137 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.models import (
+    EducationLevel,
+    NotificationSubscription,
+    Program,
+    ProgramTimelineBinding,
+    ScheduledNotification,
+    StudyDuration,
+    StudyForm,
+    TimelineEvent,
+    TimelineEventName,
+    TimelineType,
+    User,
+)
+from tactic.domain.entities.sheduled_notification import (
+    CreateScheduledNotificationDomain,
+)
+from tactic.infrastructure.repositories.sheduled_notification_repository import (
+    ScheduledNotificationRepositoryImpl,
+)
+
+
+@pytest.fixture
+async def seeded_db(db_session: AsyncSession):
+    level = EducationLevel(name="Бакалавриат")
+    form = StudyForm(name="Очная")
+    type_ = TimelineType(name="Бюджет")
+    program = Program(
+        title="Прикладная информатика",
+        url="http://example.ru",
+        education_level=level,
+        study_form=form,
+        study_duration=StudyDuration(years="4 года"),
+    )
+    binding = ProgramTimelineBinding(
+        education_level=level, study_form=form, type=type_
+    )
+    documents = TimelineEventName(name="Приём документов")
+    exams = TimelineEventName(name="Вступительные испытания")
+    events = [
+        TimelineEvent(binding=binding, event_name=exams, deadline=date(2030, 7, 10)),
+        TimelineEvent(
+            binding=binding, event_name=documents, deadline=date(2030, 6, 20)
+        ),
+    ]
+    db_session.add_all([program, binding, User(user_id=1), *events])
+    await db_session.flush()
+
+    subscription = NotificationSubscription(
+        user_id=1, program_id=program.id, timeline_type_id=type_.id
+    )
+    db_session.add(subscription)
+    await db_session.flush()
+
+    for e in events:
+        db_session.add(
+            ScheduledNotification(
+                subscription_id=subscription.id,
+                event_id=e.id,
+                send_at=datetime.combine(e.deadline, datetime.min.time())
+                - timedelta(hours=12),
+            )
+        )
+    await db_session.flush()
+    return db_session, subscription.id
+
+
+@pytest.mark.asyncio
+async def test_notifications_in_one_query(seeded_db, capture_sql):
+    session, subscription_id = seeded_db
+    repo = ScheduledNotificationRepositoryImpl(session)
+
+    async with capture_sql(session) as sql:
+        result = await repo.get_notifications_by_subscription_id(subscription_id)
+
+    assert len(sql.statements) == 1
+    assert [(n.event_name, n.deadline) for n in result] == [
+        ("Приём документов", date(2030, 6, 20)),
+        ("Вступительные испытания", date(2030, 7, 10)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unknown_subscription(seeded_db):
+    session, subscription_id = seeded_db
+    repo = ScheduledNotificationRepositoryImpl(session)
+
+    assert await repo.get_notifications_by_subscription_id(subscription_id + 1) == []
+
+
+@pytest.mark.asyncio
+async def test_add_all_returns_rows_in_one_statement(seeded_db, capture_sql):
+    session, subscription_id = seeded_db
+    repo = ScheduledNotificationRepositoryImpl(session)
+    [event_id] = (
+        await session.execute(select(TimelineEvent.id).limit(1))
+    ).scalars().all()
+    send_times = [datetime(2030, 6, day, 12) for day in (5, 1, 3)]
+
+    async with capture_sql(session) as sql:
+        added = await repo.add_all(
+            [
+                CreateScheduledNotificationDomain(
+                    subscription_id=subscription_id, event_id=event_id, send_at=at
+                )
+                for at in send_times
+            ]
+        )
+
+    assert len(sql.statements) == 1
+    assert [n.send_at for n in added] == send_times
+    assert added == await repo.get_many([n.id for n in added])
+    assert await repo.add_all([]) == []
+
+
+@pytest.mark.asyncio
+async def test_add_all_rejects_past_send_at_like_add(seeded_db):
+    session, subscription_id = seeded_db
+    repo = ScheduledNotificationRepositoryImpl(session)
+    [event_id] = (
+        await session.execute(select(TimelineEvent.id).limit(1))
+    ).scalars().all()
+    past = CreateScheduledNotificationDomain(
+        subscription_id=subscription_id,
+        event_id=event_id,
+        send_at=datetime.now() - timedelta(hours=1),
+    )
+
+    with pytest.raises(ValueError, match="в прошлом"):
+        await repo.add(past)
+    with pytest.raises(ValueError, match="в прошлом"):
+        await repo.add_all([past])
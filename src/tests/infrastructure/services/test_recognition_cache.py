@@ -0,0 +1,85 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tactic.domain.entities.program import ProgramDTO
+from tactic.domain.entities.subject import SubjectDto
+from tactic.infrastructure import recognize_exam_rapid_wuzzy
+from tactic.infrastructure.cached_recognize_exam import CachingRecognizeExamFactory
+from tactic.infrastructure.cached_recognize_program import (
+    CachingRecognizeProgramFactory,
+)
+from tactic.infrastructure.recognition_cache import RecognitionCache
+from tactic.infrastructure.recognize_exam_rapid_wuzzy_factory import (
+    RecognizeExamRapidWuzzyFactory,
+)
+
+MATH = SubjectDto(id=1, name="Математика", popularity=100, aliases=[])
+RUS = SubjectDto(id=2, name="Русский язык", popularity=80, aliases=[])
+
+
+@pytest.fixture
+def cache() -> RecognitionCache[SubjectDto]:
+    return RecognitionCache[SubjectDto](maxsize=16)
+
+
+@pytest.mark.asyncio
+async def test_repeated_input_skips_scoring(cache, monkeypatch):
+    factory = CachingRecognizeExamFactory(RecognizeExamRapidWuzzyFactory(), cache)
+    recognizer = await factory.create([MATH, RUS], threshold=70)
+
+    scoring = MagicMock(wraps=recognize_exam_rapid_wuzzy.score_top_k)
+    monkeypatch.setattr(recognize_exam_rapid_wuzzy, "score_top_k", scoring)
+
+    first = await recognizer.recognize("Математика")
+    # Тот же ввод после нормализации
+    second = await recognizer.recognize("  МАТЕМАТИКА ")
+
+    assert first == second == [MATH]
+    assert scoring.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_k_is_part_of_key(cache):
+    factory = CachingRecognizeExamFactory(RecognizeExamRapidWuzzyFactory(), cache)
+    recognizer = await factory.create([MATH, RUS], threshold=0)
+
+    await recognizer.recognize("язык", k=1)
+    await recognizer.recognize("язык", k=2)
+
+    assert cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_recognize_many_scores_only_misses(cache):
+    inner = AsyncMock()
+    inner.create.return_value.recognize_many.side_effect = lambda inputs, k: [
+        [MATH] for _ in inputs
+    ]
+    recognizer = await CachingRecognizeExamFactory(inner, cache).create([], 70)
+
+    await recognizer.recognize("матем")
+    result = await recognizer.recognize_many(["матем", "матеша"])
+
+    assert result == [[MATH], [MATH]]
+    inner_recognizer = inner.create.return_value
+    assert inner_recognizer.recognize_many.await_args_list[-1].args == (["матеша"], 3)
+
+
+@pytest.mark.asyncio
+async def test_rebuilt_index_does_not_reuse_results():
+    cache = RecognitionCache[ProgramDTO](maxsize=16)
+    inner = AsyncMock()
+    inner.create.return_value.recognize.return_value = [
+        ProgramDTO(id=1, title="Прикладная информатика")
+    ]
+    factory = CachingRecognizeProgramFactory(inner, cache)
+
+    old = await factory.create(AsyncMock(), 70)
+    await old.recognize("информатика")
+    new = await factory.create(AsyncMock(), 70)
+    await new.recognize("информатика")
+
+    assert old.version != new.version
+    assert (cache.hits, cache.misses) == (0, 2)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 import pytest
 import pytest_asyncio
@@ -62,3 +63,57 @@ async def test_deduplication(recognizer: RecognizeExamRapidWuzzy):
     result = await recognizer.recognize("матеша")
     assert len(result) == 1
     assert result[0].name == "Математика"
+
+
+@pytest.mark.asyncio
+async def test_recognize_many_matches_single_recognize(
+    recognizer: RecognizeExamRapidWuzzy,
+):
+    inputs = ["Математика", "русик", "инглиш", "язык", "абракадабра"]
+
+    batch = await recognizer.recognize_many(inputs, k=2)
+
+    assert len(batch) == len(inputs)
+    for text, result in zip(inputs, batch):
+        assert result == await recognizer.recognize(text, k=2)
+    assert batch[-1] == []
+
+
+@pytest.mark.asyncio
+async def test_recognize_many_popularity_tie_break():
+    # Одинаковое сходство с обоими алиасами, выигрывает более популярный экзамен
+    bio = make_subject("Биология", ["био"], 10)
+    chem = make_subject("Химия", ["бих"], 90)
+    recognizer = await RecognizeExamRapidWuzzy.create([bio, chem], threshold=50)
+
+    [result] = await recognizer.recognize_many(["биx"], k=1)
+    assert [s.name for s in result] == ["Химия"]
+
+
+@pytest.mark.asyncio
+async def test_recognize_many_empty_input(recognizer: RecognizeExamRapidWuzzy):
+    assert await recognizer.recognize_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_wrong_keyboard_layout(recognizer: RecognizeExamRapidWuzzy):
+    result = await recognizer.recognize("vfntvfnbrf")
+    assert result[0].name == "Математика"
+
+
+@pytest.mark.asyncio
+async def test_translit(recognizer: RecognizeExamRapidWuzzy):
+    result = await recognizer.recognize("russkiy")
+    assert result[0].name == "Русский язык"
+
+
+@pytest.mark.asyncio
+async def test_executor_gives_same_results(recognizer: RecognizeExamRapidWuzzy):
+    inputs = ["Математика", "русик", "vfntvfnbrf", "абракадабра"]
+    expected = await recognizer.recognize_many(inputs, k=2)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pooled = await RecognizeExamRapidWuzzy.create(
+            subject_data=recognizer.subject_data, threshold=40, executor=executor
+        )
+        assert await pooled.recognize_many(inputs, k=2) == expected
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from unittest.mock import MagicMock
 
@@ -62,3 +63,77 @@ async def test_limit_k(recognizer: RecognizeProgramRapidWuzzy):
     assert len(result) <= 2
     titles = [p.title for p in result]
     assert any("информатика" in t.lower() for t in titles)
+
+
+@pytest.mark.asyncio
+async def test_word_order_insensitive(recognizer: RecognizeProgramRapidWuzzy):
+    result = await recognizer.recognize("информатика прикладная")
+    assert result
+    assert result[0].title == "Прикладная информатика"
+
+
+@pytest.mark.asyncio
+async def test_typo_match(recognizer: RecognizeProgramRapidWuzzy):
+    result = await recognizer.recognize("програмная инжинерия")
+    assert result
+    assert result[0].title == "Программная инженерия"
+
+
+@pytest.mark.asyncio
+async def test_prefilter_skips_unrelated_titles(
+    recognizer: RecognizeProgramRapidWuzzy,
+):
+    candidates = recognizer._candidates("бизнес")
+    titles = {recognizer.normalized_titles[pos] for pos in candidates}
+    assert titles == {"бизнес-информатика"}
+
+
+@pytest.mark.asyncio
+async def test_wrong_keyboard_layout(recognizer: RecognizeProgramRapidWuzzy):
+    result = await recognizer.recognize("ghbrkflyfz byajhvfnbrf")
+    assert [p.title for p in result] == ["Прикладная информатика"]
+
+
+@pytest.mark.asyncio
+async def test_translit_returns_program_once(recognizer: RecognizeProgramRapidWuzzy):
+    result = await recognizer.recognize("biznes-informatika")
+    assert [p.title for p in result] == ["Бизнес-информатика"]
+
+
+@pytest.mark.asyncio
+async def test_suggest_by_prefix(recognizer: RecognizeProgramRapidWuzzy):
+    result = await recognizer.suggest("инф")
+    assert {p.title for p in result} == {
+        "Прикладная информатика",
+        "Бизнес-информатика",
+    }
+
+
+@pytest.mark.asyncio
+async def test_suggest_all_words_must_match(recognizer: RecognizeProgramRapidWuzzy):
+    result = await recognizer.suggest("прикл инф")
+    assert [p.title for p in result] == ["Прикладная информатика"]
+
+
+@pytest.mark.asyncio
+async def test_suggest_ranks_title_start_first(recognizer: RecognizeProgramRapidWuzzy):
+    result = await recognizer.suggest("прогр", k=1)
+    assert [p.title for p in result] == ["Программная инженерия"]
+
+
+@pytest.mark.asyncio
+async def test_suggest_unknown_prefix(recognizer: RecognizeProgramRapidWuzzy):
+    assert await recognizer.suggest("юриспр") == []
+    assert await recognizer.suggest("   ") == []
+
+
+@pytest.mark.asyncio
+async def test_executor_gives_same_results(recognizer: RecognizeProgramRapidWuzzy):
+    inputs = ["информатика прикладная", "фундаментальная матиматика", "бизнес"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pooled = await RecognizeProgramRapidWuzzy.create(
+            programs=recognizer.programs, threshold=70, executor=executor
+        )
+        for text in inputs:
+            assert await pooled.recognize(text) == await recognizer.recognize(text)
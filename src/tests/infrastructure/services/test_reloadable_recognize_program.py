@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.models import EducationLevel, Program, StudyDuration, StudyForm
+from tactic.infrastructure.recognize_program_rapid_wuzzy_factory import (
+    RecognizeProgramRapidWuzzyFactory,
+)
+from tactic.infrastructure.reloadable_recognize_program import (
+    ReloadableRecognizeProgram,
+)
+from tests.conftest import async_session
+
+
+def make_program(title: str, level, form, duration) -> Program:
+    return Program(
+        title=title,
+        url="http://example.ru",
+        education_level=level,
+        study_form=form,
+        study_duration=duration,
+    )
+
+
+@pytest.fixture
+async def seeded(session_with_drop_after: AsyncSession):
+    session = session_with_drop_after
+    level = EducationLevel(name="Бакалавриат")
+    form = StudyForm(name="Очная")
+    duration = StudyDuration(years="4 года")
+    session.add(make_program("Прикладная информатика", level, form, duration))
+    await session.commit()
+    return session, (level, form, duration)
+
+
+@pytest.fixture
+async def recognizer(seeded) -> ReloadableRecognizeProgram:
+    recognizer = ReloadableRecognizeProgram(
+        async_session, RecognizeProgramRapidWuzzyFactory(), threshold=70
+    )
+    await recognizer.reload()
+    return recognizer
+
+
+@pytest.mark.asyncio
+async def test_unchanged_catalog_is_not_rebuilt(recognizer):
+    assert await recognizer.reload_if_changed() is False
+    assert recognizer.version == 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_change_swaps_index(seeded, recognizer):
+    session, refs = seeded
+    assert await recognizer.recognize("программная инженерия") == []
+
+    session.add(make_program("Программная инженерия", *refs))
+    await session.commit()
+
+    assert await recognizer.reload_if_changed() is True
+    assert recognizer.version == 2
+    result = await recognizer.recognize("программная инженерия")
+    assert [p.title for p in result] == ["Программная инженерия"]
+
+
+@pytest.mark.asyncio
+async def test_listeners_called_after_reload(recognizer):
+    calls = []
+
+    async def listener():
+        calls.append(recognizer.version)
+
+    recognizer.add_listener(listener)
+    await recognizer.reload()
+
+    assert calls == [2]
+
+
+class FlakyPubSub:
+    def __init__(self, redis: "FlakyRedis"):
+        self.redis = redis
+
+    async def subscribe(self, channel: str) -> None:
+        self.redis.subscriptions += 1
+        if self.redis.subscriptions == 1:
+            raise ConnectionError("redis недоступен")
+
+    async def listen(self):
+        yield {"type": "subscribe"}
+        yield {"type": "message"}
+        # Соединение разорвалось после сообщения
+        raise ConnectionError("соединение потеряно")
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FlakyRedis:
+    def __init__(self):
+        self.subscriptions = 0
+
+    def pubsub(self) -> FlakyPubSub:
+        return FlakyPubSub(self)
+
+
+@pytest.mark.asyncio
+async def test_reload_channel_resubscribes_after_errors(recognizer):
+    redis = FlakyRedis()
+    task = asyncio.create_task(
+        recognizer._listen_reload_channel(
+            redis, "catalog", retry_delay=0.001, max_retry_delay=0.001
+        )
+    )
+    while recognizer.version < 3:
+        await asyncio.sleep(0.01)
+
+    assert not task.done()
+    assert redis.subscriptions >= 3
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
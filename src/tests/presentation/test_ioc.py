@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from tactic.infrastructure.repositories.program_eligibility_index import (
+    ProgramEligibilityIndex,
+)
+from tactic.infrastructure.repositories.subject_eligibility_index import (
+    SubjectEligibilityIndex,
+)
+from tactic.presentation.ioc import IoC
+from tests.conftest import async_session
+
+
+def broken_session_factory():
+    raise ConnectionError("БД недоступна")
+
+
+def make_ioc() -> IoC:
+    return IoC(
+        session_factory=async_session,
+        bot=MagicMock(),
+        arq_redis=MagicMock(),
+        recognize_program=MagicMock(),
+        subject_eligibility_index=SubjectEligibilityIndex(),
+        program_eligibility_index=ProgramEligibilityIndex(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_filtered_programs_use_index_when_loaded():
+    ioc = make_ioc()
+    await ioc.load_program_eligibility_index()
+
+    async with ioc.get_filtered_programs() as use_case:
+        repo = use_case.program_repository
+        assert repo.eligibility_index is ioc._program_eligibility_index
+        assert not repo.use_eligibility_table
+
+
+@pytest.mark.asyncio
+async def test_filtered_programs_fall_back_to_table_when_index_fails():
+    ioc = make_ioc()
+    await ioc.load_program_eligibility_index()
+    ioc._session_factory = broken_session_factory
+
+    # Перезагрузка не удалась: индекс старого каталога не используется
+    await ioc.load_program_eligibility_index()
+    assert not ioc._program_eligibility_index.loaded
+
+    ioc._session_factory = async_session
+    async with ioc.get_filtered_programs() as use_case:
+        repo = use_case.program_repository
+        assert repo.eligibility_index is None
+        assert repo.use_eligibility_table
@@ -0,0 +1,38 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, List, Union
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+
+@dataclass
+class CapturedSql:
+    statements: List[str] = field(default_factory=list)
+    parameters: List[Any] = field(default_factory=list)
+
+
+@asynccontextmanager
+async def capture_sql(
+    target: Union[AsyncSession, AsyncEngine],
+) -> AsyncIterator[CapturedSql]:
+    """
+    SQL и параметры всех запросов, выполненных внутри блока: через
+    соединение сессии или через любое соединение движка.
+    """
+    if isinstance(target, AsyncEngine):
+        sync_target: Any = target.sync_engine
+    else:
+        sync_target = (await target.connection()).sync_connection
+
+    captured = CapturedSql()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.statements.append(statement)
+        captured.parameters.append(parameters)
+
+    event.listen(sync_target, "before_cursor_execute", capture)
+    try:
+        yield captured
+    finally:
+        event.remove(sync_target, "before_cursor_execute", capture)
@@ -0,0 +1,205 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from vector_db_service.app.collection_versions import (
+    CollectionValidationError,
+    alias_target,
+    index_signature,
+    sync_aliased_collection,
+    versions_of,
+)
+from vector_db_service.app.incremental_index import IndexDocument
+from vector_db_service.app.settings import qdrant_settings
+
+
+class FakeQdrant:
+    """Коллекции и alias'ы Qdrant в памяти."""
+
+    def __init__(self) -> None:
+        self.collections: Dict[str, Dict[int, Any]] = {}
+        self.aliases: Dict[str, str] = {}
+        self.alias_updates = 0
+
+    def resolve(self, name: str) -> Dict[int, Any]:
+        return self.collections[self.aliases.get(name, name)]
+
+    async def get_collections(self):
+        return SimpleNamespace(
+            collections=[SimpleNamespace(name=n) for n in self.collections]
+        )
+
+    async def get_aliases(self):
+        return SimpleNamespace(
+            aliases=[
+                SimpleNamespace(alias_name=a, collection_name=c)
+                for a, c in self.aliases.items()
+            ]
+        )
+
+    async def collection_exists(self, collection_name: str) -> bool:
+        return collection_name in self.collections
+
+    async def create_collection(self, collection_name: str, **kwargs) -> None:
+        self.collections[collection_name] = {}
+
+    async def delete_collection(self, collection_name: str) -> None:
+        self.collections.pop(collection_name, None)
+
+    async def scroll(self, collection_name, limit, offset, **kwargs):
+        points = self.resolve(collection_name)
+        return [
+            SimpleNamespace(id=i, payload=p["payload"]) for i, p in points.items()
+        ], None
+
+    async def upsert(self, collection_name: str, points) -> None:
+        for point in points:
+            self.resolve(collection_name)[point.id] = {
+                "vector": point.vector,
+                "payload": point.payload,
+            }
+
+    async def delete(self, collection_name: str, points_selector) -> None:
+        for point_id in points_selector.points:
+            self.resolve(collection_name).pop(point_id, None)
+
+    async def count(self, collection_name: str, exact: bool):
+        return SimpleNamespace(count=len(self.resolve(collection_name)))
+
+    async def query_points(self, collection_name: str, query, limit: int):
+        points = self.resolve(collection_name)
+        ranked = sorted(points, key=lambda i: abs(points[i]["vector"][0] - query[0]))
+        return SimpleNamespace(points=[SimpleNamespace(id=i) for i in ranked[:limit]])
+
+    async def update_collection_aliases(self, change_aliases_operations) -> None:
+        self.alias_updates += 1
+        for operation in change_aliases_operations:
+            if hasattr(operation, "delete_alias"):
+                del self.aliases[operation.delete_alias.alias_name]
+            else:
+                create = operation.create_alias
+                assert create.alias_name not in self.collections
+                self.aliases[create.alias_name] = create.collection_name
+
+
+def encode_batch(texts: List[str]) -> List[List[float]]:
+    return [[float(len(text))] for text in texts]
+
+
+def docs(count: int) -> List[IndexDocument]:
+    return [IndexDocument(id=i, text="x" * i) for i in range(1, count + 1)]
+
+
+async def sync(qdrant: FakeQdrant, model: str, count: int = 3, **kwargs) -> None:
+    await sync_aliased_collection(
+        qdrant, "faq", docs(count), encode_batch, model, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_model_change_builds_new_version_and_switches_alias():
+    qdrant = FakeQdrant()
+    await sync(qdrant, "m1")
+    first = await alias_target(qdrant, "faq")
+    assert first is not None and first.startswith("faq__")
+
+    # Та же модель — инкрементально в ту же версию
+    await sync(qdrant, "m1", count=4)
+    assert await alias_target(qdrant, "faq") == first
+    assert len(qdrant.collections[first]) == 4
+
+    await sync(qdrant, "m2", keep_versions=0)
+    second = await alias_target(qdrant, "faq")
+    assert second != first
+    assert list(qdrant.collections) == [second]
+
+
+@pytest.mark.asyncio
+async def test_failed_validation_keeps_live_alias():
+    qdrant = FakeQdrant()
+    await sync(qdrant, "m1")
+    live = await alias_target(qdrant, "faq")
+
+    def broken(texts: List[str]) -> List[List[float]]:
+        return [[0.0] for _ in texts]
+
+    with pytest.raises(CollectionValidationError):
+        await sync_aliased_collection(
+            qdrant, "faq", docs(10), broken, "m2"
+        )
+
+    assert await alias_target(qdrant, "faq") == live
+    assert list(qdrant.collections) == [live]
+
+
+@pytest.mark.asyncio
+async def test_legacy_collection_is_replaced_by_alias():
+    qdrant = FakeQdrant()
+    qdrant.collections["faq"] = {1: {"vector": [1.0], "payload": {}}}
+
+    await sync(qdrant, "m1")
+
+    assert "faq" not in qdrant.collections
+    assert (await alias_target(qdrant, "faq")) in qdrant.collections
+
+
+def test_versions_are_ordered_by_build_time():
+    names = [
+        "faq__bbbb_20260102000000",
+        "faq__aaaa_20260101000000",
+        "faq",
+        "faq_other",
+    ]
+
+    assert versions_of("faq", names) == [
+        "faq__aaaa_20260101000000",
+        "faq__bbbb_20260102000000",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_orphaned_build_is_not_kept_for_rollback():
+    qdrant = FakeQdrant()
+    await sync(qdrant, "m1")
+    live = await alias_target(qdrant, "faq")
+    # Сборка, прерванная до переключения alias
+    signature = index_signature("m2", qdrant_settings.embedded_size)
+    orphan = f"faq__{signature}_99990101000000"
+    qdrant.collections[orphan] = {}
+
+    await sync(qdrant, "m2", keep_versions=1)
+
+    current = await alias_target(qdrant, "faq")
+    assert sorted(qdrant.collections) == sorted([live, current])
+
+
+class CancelledUpsertQdrant(FakeQdrant):
+    async def upsert(self, collection_name: str, points) -> None:
+        raise asyncio.CancelledError
+
+
+class FailingAliasQdrant(FakeQdrant):
+    async def update_collection_aliases(self, change_aliases_operations) -> None:
+        raise ConnectionError("qdrant недоступен")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "qdrant_class, error",
+    [
+        (CancelledUpsertQdrant, asyncio.CancelledError),
+        (FailingAliasQdrant, ConnectionError),
+    ],
+)
+async def test_interrupted_rebuild_removes_new_version(qdrant_class, error):
+    qdrant = qdrant_class()
+    qdrant.collections["faq__old_20260101000000"] = {}
+    qdrant.aliases["faq"] = "faq__old_20260101000000"
+
+    with pytest.raises(error):
+        await sync(qdrant, "m1")
+
+    assert list(qdrant.collections) == ["faq__old_20260101000000"]
+    assert await alias_target(qdrant, "faq") == "faq__old_20260101000000"
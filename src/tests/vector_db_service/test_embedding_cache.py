@@ -0,0 +1,100 @@
+from typing import Dict, List, Optional
+
+import pytest
+
+from vector_db_service.app.embedding_cache import EmbeddingCache
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.data: Dict[str, bytes] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int) -> None:
+        self.data[key] = value
+
+
+class BrokenRedis:
+    async def get(self, key: str) -> Optional[bytes]:
+        raise ConnectionError("redis is down")
+
+    async def set(self, key: str, value: bytes, ex: int) -> None:
+        raise ConnectionError("redis is down")
+
+
+class Model:
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    async def encode(self, text: str) -> List[float]:
+        self.calls.append(text)
+        return [0.5, -0.25, float(len(text))]
+
+
+@pytest.mark.asyncio
+async def test_normalized_queries_share_vector():
+    model = Model()
+    cache = EmbeddingCache("rubert-tiny2")
+
+    first = await cache.encode("Как  поступить?", model.encode)
+    second = await cache.encode("  Как поступить? ", model.encode)
+    await cache.encode("как поступить?", model.encode)
+
+    assert first == second
+    # Регистр сохраняется: модель считает вектор по тексту пользователя
+    assert model.calls == ["Как поступить?", "как поступить?"]
+    assert cache.stats.memory_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_is_bounded():
+    model = Model()
+    cache = EmbeddingCache("rubert-tiny2", maxsize=2)
+
+    for text in ["a", "b", "a", "c", "b"]:
+        await cache.encode(text, model.encode)
+
+    # "b" вытеснен при добавлении "c", "a" — свежий
+    assert model.calls == ["a", "b", "c", "b"]
+    assert cache.snapshot()["size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_level_is_shared_and_keyed_by_model():
+    redis = FakeRedis()
+    model = Model()
+    await EmbeddingCache("model-a", redis=redis).encode("вопрос", model.encode)
+
+    other_process = EmbeddingCache("model-a", redis=redis)
+    vector = await other_process.encode("вопрос", model.encode)
+    assert vector == [0.5, -0.25, 6.0]
+    assert other_process.stats.redis_hits == 1
+
+    await EmbeddingCache("model-b", redis=redis).encode("вопрос", model.encode)
+    assert len(model.calls) == 2
+    assert all(len(raw) == 3 * 2 for raw in redis.data.values())  # float16
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_model():
+    model = Model()
+    cache = EmbeddingCache("rubert-tiny2", redis=BrokenRedis())
+
+    assert await cache.encode("вопрос", model.encode) == [0.5, -0.25, 6.0]
+    assert cache.stats.redis_errors == 2
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_and_redis_levels_return_same_vector():
+    redis = FakeRedis()
+
+    async def encode(text: str) -> List[float]:
+        return [0.1, 1 / 3]
+
+    computed = await EmbeddingCache("model-a", redis=redis).encode("вопрос", encode)
+    from_redis = await EmbeddingCache("model-a", redis=redis).encode("вопрос", encode)
+
+    assert computed == from_redis
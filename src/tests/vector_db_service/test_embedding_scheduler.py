@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from typing import List
+
+import pytest
+
+from vector_db_service.app.embedding_scheduler import EmbeddingScheduler
+
+
+class FakeModel:
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+        self.threads: List[str] = []
+
+    def encode_batch(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(list(texts))
+        self.threads.append(threading.current_thread().name)
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_batched():
+    model = FakeModel()
+    scheduler = EmbeddingScheduler(model.encode_batch, max_batch_size=8, max_wait_ms=50)
+    scheduler.start()
+    try:
+        texts = [f"запрос {'x' * i}" for i in range(5)] + ["запрос "]
+        vectors = await asyncio.gather(*(scheduler.encode(t) for t in texts))
+    finally:
+        await scheduler.stop()
+
+    assert vectors == [[float(len(t))] for t in texts]
+    # Одна пачка, повтор посчитан один раз, и не в event loop
+    assert len(model.batches) == 1
+    assert len(model.batches[0]) == 5
+    assert model.threads[0].startswith("embedding")
+
+
+@pytest.mark.asyncio
+async def test_batch_size_is_limited():
+    model = FakeModel()
+    scheduler = EmbeddingScheduler(model.encode_batch, max_batch_size=2, max_wait_ms=50)
+    scheduler.start()
+    try:
+        await asyncio.gather(*(scheduler.encode(str(i)) for i in range(5)))
+    finally:
+        await scheduler.stop()
+
+    assert [len(batch) for batch in model.batches] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_error_is_passed_to_every_request():
+    def broken(texts: List[str]) -> List[List[float]]:
+        raise ValueError("model failed")
+
+    scheduler = EmbeddingScheduler(broken, max_wait_ms=10)
+    scheduler.start()
+    try:
+        results = await asyncio.gather(
+            scheduler.encode("a"), scheduler.encode("b"), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+    finally:
+        await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_encode_requires_start():
+    scheduler = EmbeddingScheduler(FakeModel().encode_batch)
+
+    with pytest.raises(RuntimeError):
+        await scheduler.encode("a")
+    await scheduler.stop()
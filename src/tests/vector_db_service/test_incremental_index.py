@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from vector_db_service.app.incremental_index import (
+    HASH_FIELD,
+    MODEL_FIELD,
+    IndexDocument,
+    sync_collection,
+)
+
+
+class FakeQdrant:
+    def __init__(self) -> None:
+        self.points: Dict[int, Dict[str, Any]] = {}
+        self.created: List[str] = []
+
+    async def collection_exists(self, collection_name: str) -> bool:
+        return bool(self.created)
+
+    async def create_collection(self, collection_name: str, **kwargs) -> None:
+        self.created.append(collection_name)
+
+    async def scroll(self, collection_name, limit, offset, **kwargs):
+        ids = sorted(self.points)
+        start = offset or 0
+        page = [
+            SimpleNamespace(id=i, payload=self.points[i]["payload"])
+            for i in ids[start : start + limit]
+        ]
+        next_offset: Optional[int] = start + limit if start + limit < len(ids) else None
+        return page, next_offset
+
+    async def upsert(self, collection_name: str, points) -> None:
+        for point in points:
+            self.points[point.id] = {"vector": point.vector, "payload": point.payload}
+
+    async def delete(self, collection_name: str, points_selector) -> None:
+        for point_id in points_selector.points:
+            self.points.pop(point_id, None)
+
+
+class Model:
+    def __init__(self) -> None:
+        self.encoded: List[str] = []
+
+    def encode_batch(self, texts: List[str]) -> List[List[float]]:
+        self.encoded.extend(texts)
+        return [[float(len(text))] for text in texts]
+
+
+def docs(*texts: str) -> List[IndexDocument]:
+    return [
+        IndexDocument(id=i, text=text, payload={"title": text})
+        for i, text in enumerate(texts, start=1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_only_changed_documents_are_embedded():
+    qdrant, model = FakeQdrant(), Model()
+
+    first = await sync_collection(
+        qdrant, "faq", docs("a", "b", "c"), model.encode_batch, "m1", batch_size=2
+    )
+    assert (first.upserted, first.unchanged) == (3, 0)
+    assert qdrant.created == ["faq"]
+    assert qdrant.points[1]["payload"][MODEL_FIELD] == "m1"
+    assert HASH_FIELD in qdrant.points[1]["payload"]
+
+    model.encoded.clear()
+    second = await sync_collection(
+        qdrant, "faq", docs("a", "B"), model.encode_batch, "m1"
+    )
+
+    assert model.encoded == ["B"]
+    assert (second.unchanged, second.upserted, second.deleted) == (1, 1, 1)
+    assert sorted(qdrant.points) == [1, 2]
+    assert qdrant.created == ["faq"]
+
+
+@pytest.mark.asyncio
+async def test_model_change_reembeds_everything():
+    qdrant, model = FakeQdrant(), Model()
+    await sync_collection(qdrant, "faq", docs("a", "b"), model.encode_batch, "m1")
+
+    model.encoded.clear()
+    stats = await sync_collection(
+        qdrant, "faq", docs("a", "b"), model.encode_batch, "m2"
+    )
+
+    assert model.encoded == ["a", "b"]
+    assert stats.upserted == 2
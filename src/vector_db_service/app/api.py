@@ -1,7 +1,9 @@
 from typing import List, Set
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request
+from qdrant_client import AsyncQdrantClient
 
+from vector_db_service.app.embedding_model import embedding_cache
 from vector_db_service.app.models import (
     ProgramRequest,
     ProgramResponseEntry,
@@ -16,18 +18,33 @@ from vector_db_service.app.qdrant_client import (
 router = APIRouter()
 
 
+def get_qdrant(request: Request) -> AsyncQdrantClient:
+    return request.app.state.qdrant
+
+
 @router.post("/search", response_model=VectorSearchResponse)
-async def search(request: SearchRequest):
-    return await search_similar_question(request.query, request.path, request.k)
+async def search(
+    request: SearchRequest, qdrant: AsyncQdrantClient = Depends(get_qdrant)
+):
+    return await search_similar_question(
+        qdrant, request.query, request.path, request.k
+    )
 
 
 @router.post("/programs")
-async def programs(request: ProgramRequest) -> List[ProgramResponseEntry]:
+async def programs(
+    request: ProgramRequest, qdrant: AsyncQdrantClient = Depends(get_qdrant)
+) -> List[ProgramResponseEntry]:
     return await search_similar_program_ids(
-        request.query, request.k, request.programs_id
+        qdrant, request.query, request.k, request.programs_id
     )
 
 
+@router.get("/metrics/embedding-cache")
+async def embedding_cache_metrics():
+    return embedding_cache.snapshot()
+
+
 @router.get("/health")
 async def health():
     return {"status": "ok"}
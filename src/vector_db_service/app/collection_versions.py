@@ -0,0 +1,227 @@
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+)
+
+from vector_db_service.app.incremental_index import (
+    EncodeBatch,
+    IndexDocument,
+    SyncStats,
+    sync_collection,
+)
+from vector_db_service.app.settings import qdrant_settings
+
+logger = logging.getLogger(__name__)
+
+# Физические коллекции: <alias>__<подпись индекса>_<время сборки>
+VERSION_SEPARATOR = "__"
+
+
+class CollectionValidationError(Exception):
+    pass
+
+
+def index_signature(model_name: str, embedded_size: int) -> str:
+    """Меняется, когда старые векторы несовместимы с новыми."""
+    raw = f"{model_name}:{embedded_size}".encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()[:8]
+
+
+def versioned_name(alias: str, signature: str) -> str:
+    built_at = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    return f"{alias}{VERSION_SEPARATOR}{signature}_{built_at}"
+
+
+def built_at(collection_name: str) -> str:
+    return collection_name.rsplit("_", 1)[-1]
+
+
+def versions_of(alias: str, collection_names: Sequence[str]) -> List[str]:
+    """Версии коллекции alias, от старой к новой."""
+    prefix = f"{alias}{VERSION_SEPARATOR}"
+    versions = [name for name in collection_names if name.startswith(prefix)]
+    return sorted(versions, key=built_at)
+
+
+async def alias_target(client: AsyncQdrantClient, alias: str) -> Optional[str]:
+    for description in (await client.get_aliases()).aliases:
+        if description.alias_name == alias:
+            return description.collection_name
+    return None
+
+
+async def validate_collection(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    documents: Sequence[IndexDocument],
+    encode_batch: EncodeBatch,
+    executor: Any = None,
+) -> None:
+    """Число точек совпадает с БД, а поиск по тексту документа находит его."""
+    count = (await client.count(collection_name=collection_name, exact=True)).count
+    if count != len(documents):
+        raise CollectionValidationError(
+            f"{collection_name}: {count} точек вместо {len(documents)}"
+        )
+    if not documents:
+        return
+
+    # Самый длинный текст почти наверняка уникален, а пустые описания
+    # программ дают одинаковые векторы
+    probe = max(documents, key=lambda document: len(document.text))
+    [vector] = await asyncio.get_running_loop().run_in_executor(
+        executor, encode_batch, [probe.text]
+    )
+    hits = await client.query_points(
+        collection_name=collection_name, query=vector, limit=5
+    )
+    if probe.id not in {int(hit.id) for hit in hits.points}:
+        raise CollectionValidationError(
+            f"{collection_name}: контрольный запрос не нашёл документ {probe.id}"
+        )
+
+
+async def switch_alias(
+    client: AsyncQdrantClient, alias: str, collection_name: str
+) -> None:
+    """Переводит alias на collection_name одной атомарной операцией."""
+    collections = {c.name for c in (await client.get_collections()).collections}
+    if alias in collections:
+        # Коллекция из времён до версий: имя нужно освободить под alias
+        logger.warning(f"Удаляем коллекцию {alias}, чтобы создать alias с этим именем")
+        await client.delete_collection(collection_name=alias)
+
+    operations: List[Any] = []
+    if await alias_target(client, alias) is not None:
+        operations.append(
+            DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias))
+        )
+    operations.append(
+        CreateAliasOperation(
+            create_alias=CreateAlias(collection_name=collection_name, alias_name=alias)
+        )
+    )
+    await client.update_collection_aliases(change_aliases_operations=operations)
+
+
+async def drop_old_versions(
+    client: AsyncQdrantClient,
+    alias: str,
+    current: str,
+    previous: Optional[str],
+    keep: int,
+) -> List[str]:
+    """
+    Удаляет версии, кроме current и keep последних рабочих до неё.
+
+    Рабочие — previous и более старые: новее previous бывают только сборки,
+    которые так и не получили alias (прерванные или не прошедшие проверку),
+    откатываться на них нельзя, поэтому они удаляются всегда.
+    """
+    names = [c.name for c in (await client.get_collections()).collections]
+    versions = [name for name in versions_of(alias, names) if name != current]
+    rollback = (
+        []
+        if previous is None
+        else [name for name in versions if built_at(name) <= built_at(previous)]
+    )
+    kept = set(rollback[max(len(rollback) - keep, 0) :])
+    dropped = [name for name in versions if name not in kept]
+    for name in dropped:
+        logger.info(f"Удаляем старую версию коллекции {name}")
+        await client.delete_collection(collection_name=name)
+    return dropped
+
+
+async def discard_version(
+    client: AsyncQdrantClient, alias: str, collection_name: str
+) -> None:
+    """Удаляет собранную версию, если alias на неё так и не переключился."""
+    try:
+        if await alias_target(client, alias) != collection_name:
+            await client.delete_collection(collection_name=collection_name)
+    except Exception:
+        logger.exception(f"Не удалось удалить версию {collection_name}")
+
+
+async def rebuild_collection(
+    client: AsyncQdrantClient,
+    alias: str,
+    documents: Sequence[IndexDocument],
+    encode_batch: EncodeBatch,
+    model_name: str,
+    signature: str,
+    previous: Optional[str] = None,
+    executor: Any = None,
+    keep_versions: int = 1,
+) -> SyncStats:
+    """
+    Blue/green сборка: новая версия собирается рядом с рабочей (previous),
+    проверяется и только потом получает alias. До переключения поиск идёт
+    по старой.
+    """
+    collection_name = versioned_name(alias, signature)
+    logger.info(f"Полная пересборка {alias} в {collection_name}")
+    try:
+        stats = await sync_collection(
+            client, collection_name, documents, encode_batch, model_name, executor
+        )
+        await validate_collection(
+            client, collection_name, documents, encode_batch, executor
+        )
+        await switch_alias(client, alias, collection_name)
+    except BaseException:
+        # В том числе CancelledError при остановке сервиса посреди сборки
+        await discard_version(client, alias, collection_name)
+        raise
+
+    logger.info(f"Alias {alias} переключён на {collection_name}")
+    await drop_old_versions(client, alias, collection_name, previous, keep_versions)
+    return stats
+
+
+async def sync_aliased_collection(
+    client: AsyncQdrantClient,
+    alias: str,
+    documents: Sequence[IndexDocument],
+    encode_batch: EncodeBatch,
+    model_name: str,
+    executor: Any = None,
+    force_rebuild: bool = False,
+    keep_versions: int = 1,
+) -> SyncStats:
+    """
+    Поиск обращается к коллекции по alias. Если текущая версия собрана той
+    же моделью и размерностью, она догоняет БД инкрементально, иначе
+    собирается новая версия.
+    """
+    signature = index_signature(model_name, qdrant_settings.embedded_size)
+    target = await alias_target(client, alias)
+    if (
+        target is not None
+        and target.startswith(f"{alias}{VERSION_SEPARATOR}{signature}_")
+        and not force_rebuild
+    ):
+        return await sync_collection(
+            client, target, documents, encode_batch, model_name, executor
+        )
+    return await rebuild_collection(
+        client,
+        alias,
+        documents,
+        encode_batch,
+        model_name,
+        signature,
+        target,
+        executor,
+        keep_versions,
+    )
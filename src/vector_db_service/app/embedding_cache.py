@@ -0,0 +1,142 @@
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Encode = Callable[[str], Awaitable[List[float]]]
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    # Регистр не трогаем: модель его различает, и вектор должен совпадать
+    # с тем, что получился бы без кеша
+    return _SPACES.sub(" ", text.strip())
+
+
+def to_float16(vector: List[float]) -> List[float]:
+    return np.asarray(vector, dtype=np.float16).astype(np.float32).tolist()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    memory_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    redis_errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.redis_hits + self.misses
+        return (self.memory_hits + self.redis_hits) / total if total else 0.0
+
+
+class EmbeddingCache:
+    """
+    Кеш эмбеддингов запросов: LRU в памяти процесса и, если задан redis,
+    общий второй уровень с векторами в float16.
+
+    Ключ — имя модели и хеш текста со схлопнутыми пробелами, поэтому смена
+    модели не отдаёт старые векторы. Оба уровня хранят векторы, округлённые
+    до float16, чтобы любой процесс возвращал один и тот же вектор. Redis
+    необязателен: его ошибки только считаются, а вектор тогда вычисляется
+    заново.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        maxsize: int = 4096,
+        redis: Optional[Any] = None,
+        redis_ttl: int = 7 * 24 * 3600,
+    ):
+        self.model_name = model_name
+        self.maxsize = maxsize
+        self.redis = redis
+        self.redis_ttl = redis_ttl
+        self.stats = EmbeddingCacheStats()
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def make_key(self, text: str) -> str:
+        digest = hashlib.sha1(normalize_query(text).encode("utf-8")).hexdigest()
+        return f"embedding:{self.model_name}:{digest}"
+
+    async def encode(self, text: str, compute: Encode) -> List[float]:
+        key = self.make_key(text)
+
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            return vector
+
+        vector = await self._redis_get(key)
+        if vector is not None:
+            self.stats.redis_hits += 1
+        else:
+            self.stats.misses += 1
+            vector = to_float16(await compute(normalize_query(text)))
+            await self._redis_set(key, vector)
+
+        self._remember(key, vector)
+        return vector
+
+    def clear(self) -> None:
+        self._memory.clear()
+
+    async def close(self) -> None:
+        if self.redis is not None:
+            await self.redis.aclose()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "size": len(self._memory),
+            "maxsize": self.maxsize,
+            "redis": self.redis is not None,
+            **asdict(self.stats),
+            "hit_rate": round(self.stats.hit_rate, 4),
+        }
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        self._memory[key] = vector
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    async def _redis_get(self, key: str) -> Optional[List[float]]:
+        if self.redis is None:
+            return None
+        try:
+            raw = await self.redis.get(key)
+        except Exception:
+            self.stats.redis_errors += 1
+            logger.warning("Кеш эмбеддингов: redis недоступен", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        return np.frombuffer(raw, dtype=np.float16).astype(np.float32).tolist()
+
+    async def _redis_set(self, key: str, vector: List[float]) -> None:
+        if self.redis is None:
+            return
+        try:
+            raw = np.asarray(vector, dtype=np.float16).tobytes()
+            await self.redis.set(key, raw, ex=self.redis_ttl)
+        except Exception:
+            self.stats.redis_errors += 1
+            logger.warning("Кеш эмбеддингов: redis недоступен", exc_info=True)
+
+
+def create_embedding_redis(url: Optional[str]) -> Optional[Any]:
+    """Клиент второго уровня кеша; redis нужен, только если задан url."""
+    if not url:
+        return None
+    from redis.asyncio import Redis
+
+    return Redis.from_url(url)
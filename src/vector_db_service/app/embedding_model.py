@@ -5,7 +5,12 @@ import numpy as np
 import torch
 from sentence_transformers import SentenceTransformer
 
-from vector_db_service.app.settings import qdrant_settings
+from vector_db_service.app.embedding_cache import (
+    EmbeddingCache,
+    create_embedding_redis,
+)
+from vector_db_service.app.embedding_scheduler import EmbeddingScheduler
+from vector_db_service.app.settings import embedding_settings, qdrant_settings
 
 
 # Класс для эмбеддингов
@@ -61,3 +66,17 @@ except Exception as e:
 
 
 embedder = SentenceEmbedder(sentence_model)
+
+# Эмбеддинги пользовательских запросов: пачками и вне event loop
+embedding_scheduler = EmbeddingScheduler(
+    embedder.encode_batch,
+    max_batch_size=embedding_settings.embedding_max_batch_size,
+    max_wait_ms=embedding_settings.embedding_max_wait_ms,
+)
+
+embedding_cache = EmbeddingCache(
+    qdrant_settings.embedded_model,
+    maxsize=embedding_settings.embedding_cache_size,
+    redis=create_embedding_redis(embedding_settings.embedding_cache_redis_url),
+    redis_ttl=embedding_settings.embedding_cache_ttl,
+)
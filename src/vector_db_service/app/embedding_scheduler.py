@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EncodeBatch = Callable[[List[str]], List[List[float]]]
+
+
+class EmbeddingScheduler:
+    """
+    Очередь запросов на эмбеддинг с микробатчингом.
+
+    Тексты конкурентных запросов копятся, пока не наберётся max_batch_size
+    или не пройдёт max_wait_ms с прихода первого, и считаются одним вызовом
+    encode_batch в отдельном пуле: event loop uvicorn не блокируется прямым
+    проходом модели, а модель работает пачками, как ей выгодно.
+    """
+
+    def __init__(
+        self,
+        encode_batch: EncodeBatch,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        executor: Optional[Executor] = None,
+    ):
+        self.encode_batch = encode_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        # Один поток: torch сам распараллеливает проход по ядрам, а
+        # несколько одновременных проходов только конкурируют за них
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="embedding"
+        )
+        self._queue: "asyncio.Queue[Tuple[str, asyncio.Future]]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run(), name="embedding-scheduler")
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Embedding scheduler stopped"))
+        self.executor.shutdown(wait=False)
+
+    async def encode(self, text: str) -> List[float]:
+        if self._worker is None:
+            raise RuntimeError("Embedding scheduler is not started")
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _next_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            # Клиент мог уйти, пока запрос стоял в очереди
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            # Одинаковые тексты в пачке считаются один раз
+            positions: Dict[str, int] = {}
+            for text, _ in batch:
+                positions.setdefault(text, len(positions))
+
+            try:
+                vectors = await loop.run_in_executor(
+                    self.executor, self.encode_batch, list(positions)
+                )
+            except Exception as e:
+                logger.exception("Ошибка при расчёте эмбеддингов")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(vectors[positions[text]])
@@ -0,0 +1,143 @@
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, PointIdsList, PointStruct, VectorParams
+
+from vector_db_service.app.settings import qdrant_settings
+
+logger = logging.getLogger(__name__)
+
+EncodeBatch = Callable[[List[str]], List[List[float]]]
+
+HASH_FIELD = "content_hash"
+MODEL_FIELD = "embedding_model"
+
+
+@dataclass
+class IndexDocument:
+    id: int
+    # Текст, по которому считается вектор
+    text: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SyncStats:
+    collection: str
+    total: int = 0
+    unchanged: int = 0
+    upserted: int = 0
+    deleted: int = 0
+
+
+def content_hash(document: IndexDocument, model_name: str) -> str:
+    raw = json.dumps(
+        [model_name, document.text, document.payload],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def ensure_collection(client: AsyncQdrantClient, collection_name: str) -> None:
+    if not await client.collection_exists(collection_name):
+        logger.info(f"Создание коллекции {collection_name}")
+        await client.create_collection(
+            collection_name=collection_name,
+            vectors_config=VectorParams(
+                size=qdrant_settings.embedded_size, distance=Distance.COSINE
+            ),
+        )
+
+
+async def indexed_hashes(
+    client: AsyncQdrantClient, collection_name: str, page_size: int = 1000
+) -> Dict[int, Optional[str]]:
+    """id точки -> хеш содержимого, с которым она проиндексирована."""
+    hashes: Dict[int, Optional[str]] = {}
+    offset = None
+    while True:
+        points, offset = await client.scroll(
+            collection_name=collection_name,
+            limit=page_size,
+            offset=offset,
+            with_payload=[HASH_FIELD],
+            with_vectors=False,
+        )
+        for point in points:
+            hashes[int(point.id)] = (point.payload or {}).get(HASH_FIELD)
+        if offset is None:
+            return hashes
+
+
+async def sync_collection(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    documents: Sequence[IndexDocument],
+    encode_batch: EncodeBatch,
+    model_name: str,
+    executor: Any = None,
+    batch_size: int = 64,
+) -> SyncStats:
+    """
+    Приводит коллекцию к documents, не пересоздавая её: векторы считаются
+    только для новых и изменившихся документов (по хешу текста, payload и
+    модели), точки удалённых документов удаляются. Пока идёт синхронизация,
+    поиск работает по текущему содержимому коллекции.
+    """
+    stats = SyncStats(collection=collection_name, total=len(documents))
+    await ensure_collection(client, collection_name)
+    indexed = await indexed_hashes(client, collection_name)
+
+    changed: List[IndexDocument] = []
+    hashes: Dict[int, str] = {}
+    for document in documents:
+        digest = content_hash(document, model_name)
+        if indexed.get(document.id) == digest:
+            stats.unchanged += 1
+        else:
+            changed.append(document)
+            hashes[document.id] = digest
+
+    loop = asyncio.get_running_loop()
+    for start in range(0, len(changed), batch_size):
+        batch = changed[start : start + batch_size]
+        # Модель считает в пуле, event loop продолжает обслуживать поиск
+        vectors = await loop.run_in_executor(
+            executor, encode_batch, [document.text for document in batch]
+        )
+        await client.upsert(
+            collection_name=collection_name,
+            points=[
+                PointStruct(
+                    id=document.id,
+                    vector=vector,
+                    payload={
+                        **document.payload,
+                        HASH_FIELD: hashes[document.id],
+                        MODEL_FIELD: model_name,
+                    },
+                )
+                for document, vector in zip(batch, vectors)
+            ],
+        )
+        stats.upserted += len(batch)
+
+    stale = sorted(set(indexed) - {document.id for document in documents})
+    if stale:
+        await client.delete(
+            collection_name=collection_name,
+            points_selector=PointIdsList(points=stale),
+        )
+        stats.deleted = len(stale)
+
+    logger.info(
+        f"Коллекция {collection_name}: всего {stats.total}, без изменений "
+        f"{stats.unchanged}, обновлено {stats.upserted}, удалено {stats.deleted}"
+    )
+    return stats
@@ -1,28 +1,27 @@
 import logging
-from typing import List, Sequence
+from typing import List
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+from qdrant_client import AsyncQdrantClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from shared.models import Program
-from vector_db_service.app.embedding_model import embedder
+from vector_db_service.app.embedding_model import embedder, embedding_scheduler
+from vector_db_service.app.collection_versions import sync_aliased_collection
+from vector_db_service.app.incremental_index import IndexDocument, SyncStats
 from vector_db_service.app.repositories.program_repository import ProgramRepository
 from vector_db_service.app.settings import db_settings, qdrant_settings
 
-qdrant = QdrantClient(
-    host=qdrant_settings.qdrant_host_name, port=qdrant_settings.qdrant_port
-)
+logger = logging.getLogger(__name__)
 
 
 def program_to_text(program: Program) -> str:
     return f"{program.program_info or ''} {program.career_info or ''}"
 
 
-def to_point(program: Program, vector: List[float]) -> PointStruct:
-    return PointStruct(
+def program_to_document(program: Program) -> IndexDocument:
+    return IndexDocument(
         id=program.id,
-        vector=vector,
+        text=program_to_text(program),
         payload={
             "title": program.title,
             "url": program.url,
@@ -31,33 +30,7 @@ def to_point(program: Program, vector: List[float]) -> PointStruct:
     )
 
 
-async def upload_program_vectors(programs: Sequence[Program]):
-    if not programs:
-        return
-
-    await create_collection_if_needed()
-
-    combined_texts = [program_to_text(program) for program in programs]
-    vectors = embedder.encode_batch(combined_texts)
-
-    points = [to_point(p, v) for p, v in zip(programs, vectors)]
-    qdrant.upsert(
-        collection_name=qdrant_settings.qdrant_program_collection, points=points
-    )
-
-
-async def create_collection_if_needed():
-    collections = qdrant.get_collections().collections
-    if qdrant_settings.qdrant_program_collection not in [c.name for c in collections]:
-        qdrant.recreate_collection(
-            collection_name=qdrant_settings.qdrant_program_collection,
-            vectors_config=VectorParams(
-                size=qdrant_settings.embedded_size, distance=Distance.COSINE
-            ),
-        )
-
-
-async def load_program_collection():
+async def read_program_documents(batch_size: int = 100) -> List[IndexDocument]:
     engine = create_async_engine(
         db_settings.get_connection_url(),
         future=True,
@@ -66,15 +39,34 @@ async def load_program_collection():
     session_factory = async_sessionmaker(
         engine, expire_on_commit=False, class_=AsyncSession
     )
-    async with session_factory() as session:
-        repo = ProgramRepository(session)
-        offset = 0
-        batch_size = 100
 
-        while True:
-            programs, total = await repo.get_paginated(limit=batch_size, offset=offset)
-            if not programs:
-                break
-
-            await upload_program_vectors(programs)
-            offset += batch_size
+    documents: List[IndexDocument] = []
+    try:
+        async with session_factory() as session:
+            repo = ProgramRepository(session)
+            while True:
+                programs, _ = await repo.get_paginated(
+                    limit=batch_size, offset=len(documents)
+                )
+                if not programs:
+                    break
+                documents.extend(program_to_document(p) for p in programs)
+    finally:
+        await engine.dispose()
+    return documents
+
+
+async def load_program_collection(qdrant: AsyncQdrantClient) -> SyncStats:
+    documents = await read_program_documents()
+    logger.info(f"Программ в БД: {len(documents)}")
+
+    return await sync_aliased_collection(
+        qdrant,
+        qdrant_settings.qdrant_program_collection,
+        documents,
+        embedder.encode_batch,
+        model_name=qdrant_settings.embedded_model,
+        executor=embedding_scheduler.executor,
+        force_rebuild=qdrant_settings.qdrant_force_rebuild,
+        keep_versions=qdrant_settings.qdrant_keep_collection_versions,
+    )
@@ -1,41 +1,28 @@
 import logging
+from typing import List
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+from qdrant_client import AsyncQdrantClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from vector_db_service.app.embedding_model import embedder
+from vector_db_service.app.embedding_model import embedder, embedding_scheduler
+from vector_db_service.app.collection_versions import sync_aliased_collection
+from vector_db_service.app.incremental_index import IndexDocument, SyncStats
+from vector_db_service.app.models import QuestionItem
 from vector_db_service.app.repositories.question_repository import QuestionRepository
 from vector_db_service.app.settings import db_settings, qdrant_settings
 
 logger = logging.getLogger(__name__)
 
 
-async def recreate_collection_from_repository():
-    client = QdrantClient(
-        host=qdrant_settings.qdrant_host_name,
-        port=qdrant_settings.qdrant_port,
+def question_to_document(item: QuestionItem) -> IndexDocument:
+    return IndexDocument(
+        id=item.id,
+        text=f"{' > '.join(item.path)} — {item.question}",
+        payload=item.model_dump(),
     )
 
-    collection_name = qdrant_settings.qdrant_question_collection
-
-    # Удаляем старую коллекцию
-    existing = client.get_collections().collections
-    if collection_name in [c.name for c in existing]:
-        logger.info(f"Удаляем старую коллекцию {collection_name}")
-        client.delete_collection(collection_name=collection_name)
-
-    logger.info(f"Создание коллекции {collection_name}")
-    client.create_collection(
-        collection_name=collection_name,
-        vectors_config=VectorParams(
-            size=qdrant_settings.embedded_size, distance=Distance.COSINE
-        ),
-    )
-
-    batch_size = 100
-    offset = 0
 
+async def read_questions(batch_size: int = 100) -> List[QuestionItem]:
     engine = create_async_engine(
         db_settings.get_connection_url(),
         future=True,
@@ -45,35 +32,35 @@ async def recreate_collection_from_repository():
         engine, expire_on_commit=False, class_=AsyncSession
     )
 
-    async with session_factory() as session:
-        repo = QuestionRepository(session)
-        all_loaded = False
-
-        while not all_loaded:
-            items, total = await repo.get_questions_with_path(
-                offset=offset, limit=batch_size
-            )
-            if not items:
-                break
-
-            combined_texts = [
-                f"{' > '.join(item.path)} — {item.question}" for item in items
-            ]
-            vectors = embedder.encode_batch(combined_texts)
-            points = [
-                PointStruct(id=item.id, vector=vector, payload=item.model_dump())
-                for item, vector in zip(items, vectors)
-            ]
-
-            client.upsert(collection_name=collection_name, points=points)
-            logger.info(f"Загружено {offset + len(items)} / {total}")
-
-            offset += batch_size
-            if offset >= total:
-                all_loaded = True
-
-    logger.info("Коллекция успешно создана и заполнена.")
-
-
-async def load_question_collection():
-    await recreate_collection_from_repository()
+    items: List[QuestionItem] = []
+    try:
+        async with session_factory() as session:
+            repo = QuestionRepository(session)
+            while True:
+                page, total = await repo.get_questions_with_path(
+                    offset=len(items), limit=batch_size
+                )
+                if not page:
+                    break
+                items.extend(page)
+                if len(items) >= total:
+                    break
+    finally:
+        await engine.dispose()
+    return items
+
+
+async def load_question_collection(client: AsyncQdrantClient) -> SyncStats:
+    items = await read_questions()
+    logger.info(f"Вопросов в БД: {len(items)}")
+
+    return await sync_aliased_collection(
+        client,
+        qdrant_settings.qdrant_question_collection,
+        [question_to_document(item) for item in items],
+        embedder.encode_batch,
+        model_name=qdrant_settings.embedded_model,
+        executor=embedding_scheduler.executor,
+        force_rebuild=qdrant_settings.qdrant_force_rebuild,
+        keep_versions=qdrant_settings.qdrant_keep_collection_versions,
+    )
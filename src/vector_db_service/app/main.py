@@ -1,19 +1,43 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
+from qdrant_client import AsyncQdrantClient
 
-from vector_db_service.app.load_program_collection import load_program_collection
 from vector_db_service.app.api import router
+from vector_db_service.app.embedding_model import embedding_cache, embedding_scheduler
+from vector_db_service.app.load_program_collection import load_program_collection
 from vector_db_service.app.load_question_collection import load_question_collection
+from vector_db_service.app.qdrant_client import create_qdrant_client
+
+logger = logging.getLogger(__name__)
+
+
+async def sync_collections(qdrant: AsyncQdrantClient) -> None:
+    try:
+        await load_question_collection(qdrant)
+        await load_program_collection(qdrant)
+    except Exception:
+        logger.exception("Не удалось синхронизировать коллекции с БД")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Это выполняется при старте
-    await load_question_collection()
-    await load_program_collection()
+    qdrant = create_qdrant_client()
+    app.state.qdrant = qdrant
+    embedding_scheduler.start()
+    # Коллекции не пересоздаются, а догоняют БД в фоне: до конца
+    # синхронизации поиск идёт по уже проиндексированным точкам
+    indexing = asyncio.create_task(sync_collections(qdrant), name="sync-collections")
     yield
+    indexing.cancel()
+    await asyncio.gather(indexing, return_exceptions=True)
+    await embedding_scheduler.stop()
+    await embedding_cache.close()
+    await qdrant.close()
 
 
 app = FastAPI(
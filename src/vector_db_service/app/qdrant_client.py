@@ -1,9 +1,12 @@
 from typing import List, Optional
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.models import FieldCondition, Filter, HasIdCondition, MatchValue
 
-from vector_db_service.app.embedding_model import embedder
+from vector_db_service.app.embedding_model import (
+    embedding_cache,
+    embedding_scheduler,
+)
 from vector_db_service.app.models import (
     ProgramResponseEntry,
     ResponseEntry,
@@ -11,9 +14,17 @@ from vector_db_service.app.models import (
 )
 from vector_db_service.app.settings import qdrant_settings
 
-client = QdrantClient(
-    host=qdrant_settings.qdrant_host_name, port=qdrant_settings.qdrant_port
-)
+def create_qdrant_client() -> AsyncQdrantClient:
+    """
+    Один клиент на процесс: создаётся в lifespan приложения и переиспользует
+    соединение (gRPC, если доступен) для поиска и загрузки коллекций.
+    """
+    return AsyncQdrantClient(
+        host=qdrant_settings.qdrant_host_name,
+        port=qdrant_settings.qdrant_port,
+        grpc_port=qdrant_settings.qdrant_grpc_port,
+        prefer_grpc=qdrant_settings.qdrant_prefer_grpc,
+    )
 
 
 def make_path_filter(path: List[str]) -> Filter:
@@ -26,13 +37,13 @@ def make_path_filter(path: List[str]) -> Filter:
 
 
 async def search_similar_question(
-    user_query: str, path: List[str] = [], k: int = 5
+    client: AsyncQdrantClient, user_query: str, path: List[str] = [], k: int = 5
 ) -> VectorSearchResponse:
 
-    vector = embedder.encode(user_query)
+    vector = await embedding_cache.encode(user_query, embedding_scheduler.encode)
     query_filter: Optional[Filter] = make_path_filter(path) if len(path) != 0 else None
 
-    hits = client.query_points(
+    hits = await client.query_points(
         collection_name=qdrant_settings.qdrant_question_collection,
         query=vector,
         query_filter=query_filter,
@@ -55,19 +66,22 @@ async def search_similar_question(
 
 
 async def search_similar_program_ids(
-    text: str, top_k: int = 5, program_ids: List[int] = []
+    client: AsyncQdrantClient,
+    text: str,
+    top_k: int = 5,
+    program_ids: List[int] = [],
 ) -> List[ProgramResponseEntry]:
     
     if not program_ids:
         return []
     
-    vector = embedder.encode(text)
+    vector = await embedding_cache.encode(text, embedding_scheduler.encode)
     
     filter = (
         Filter(must=HasIdCondition(has_id=[x for x in program_ids]))
     )
 
-    hits = client.query_points(
+    hits = await client.query_points(
         collection_name=qdrant_settings.qdrant_program_collection,
         query=vector,
         query_filter=filter,
@@ -2,6 +2,7 @@ from typing import List, Sequence, Tuple
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from shared.models import Program
 
@@ -13,7 +14,14 @@ class ProgramRepository:
     async def get_paginated(
         self, limit: int = 100, offset: int = 0
     ) -> Tuple[Sequence[Program], int]:
-        stmt = select(Program).limit(limit).offset(offset)
+        # Тексты описания нужны для эмбеддингов, а по умолчанию они отложены
+        stmt = (
+            select(Program)
+            .options(undefer_group("details"))
+            .order_by(Program.id)
+            .limit(limit)
+            .offset(offset)
+        )
         result = await self.session.execute(stmt)
 
         count_stmt = select(func.count()).select_from(Program)
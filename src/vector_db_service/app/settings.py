@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -7,6 +8,12 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class QdrantSettings(BaseSettings):
     qdrant_host_name: str = Field(default="qdrant")
     qdrant_port: int =  Field(default=6333)
+    qdrant_grpc_port: int = Field(default=6334)
+    qdrant_prefer_grpc: bool = Field(default=True)
+    # Коллекции выше — это alias'ы на версии; старых версий держим для отката
+    qdrant_keep_collection_versions: int = Field(default=1)
+    # Собрать новые версии коллекций при старте, даже если модель не менялась
+    qdrant_force_rebuild: bool = Field(default=False)
     qdrant_question_collection: str = Field(default="vyatsu_faq")
     qdrant_program_collection: str = Field(default="program_vectors")
     embedded_size: int = Field(default=312)
@@ -22,6 +29,24 @@ class QdrantSettings(BaseSettings):
 qdrant_settings = QdrantSettings()
 
 
+class EmbeddingSettings(BaseSettings):
+    # Микробатчинг запросов: размер пачки и сколько ждать её заполнения
+    embedding_max_batch_size: int = Field(default=32)
+    embedding_max_wait_ms: float = Field(default=5.0)
+    # Кеш эмбеддингов запросов: LRU в процессе и необязательный redis
+    embedding_cache_size: int = Field(default=4096)
+    embedding_cache_redis_url: Optional[str] = Field(default=None)
+    embedding_cache_ttl: int = Field(default=7 * 24 * 3600)
+
+    model_config = SettingsConfigDict(
+        env_file=".env.vector_db",
+        extra="ignore"
+    )
+
+
+embedding_settings = EmbeddingSettings()
+
+
 
 class DBSettings(BaseSettings):
     db_host: str = Field(default="", description="Database host")